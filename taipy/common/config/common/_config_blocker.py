@@ -20,6 +20,7 @@ class _ConfigBlocker:
 
     __logger = _TaipyLogger._get_logger()
     __block_config_update = False
+    __nb_updates = 0
 
     @classmethod
     def _block(cls):
@@ -33,6 +34,11 @@ class _ConfigBlocker:
             cls.__logger.debug("Unblocking configuration update.")
             cls.__block_config_update = False
 
+    @classmethod
+    def _nb_updates(cls) -> int:
+        """Number of configuration updates performed through the checked methods."""
+        return cls.__nb_updates
+
     @classmethod
     def _check(cls):
         def inner(f):
@@ -46,7 +52,10 @@ class _ConfigBlocker:
                     cls.__logger.error(f"ConfigurationUpdateBlocked: {error_message}")
                     raise ConfigurationUpdateBlocked(error_message)
 
-                return f(*args, **kwargs)
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    cls.__nb_updates += 1
 
             return _check_if_is_blocking
 
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import functools
 import os
 import re
 from collections import UserDict
@@ -16,6 +17,7 @@ from datetime import datetime, timedelta
 from importlib import import_module
 from operator import attrgetter
 from pydoc import locate
+from typing import Any, Dict, Optional, Tuple
 
 from ..exceptions.exceptions import InconsistentEnvVariableError, MissingEnvVariableError
 from .frequency import Frequency
@@ -23,12 +25,42 @@ from .scope import Scope
 
 
 class _TemplateHandler:
-    """Factory to handle actions related to config value templating."""
+    """Factory to handle actions related to config value templating.
+
+    Templates are parsed once and the result is cached. The environment variables are read each time
+    a template is resolved, unless the environment is frozen. Then, the values of the environment
+    variables are the ones at the time the environment was frozen, or at the last configuration update,
+    and the resolved values are cached.
+    """
 
     _PATTERN = r"^ENV\[([a-zA-Z_]\w*)\](:(\bbool\b|\bstr\b|\bfloat\b|\bint\b))?$"
+    __MAX_CACHED_TEMPLATES = 4096
+
+    # A copy of the environment variables, used instead of os.environ while the environment is frozen.
+    __frozen_environ: Optional[Dict[str, str]] = None
+    # The values resolved while the environment is frozen, by template, type, required flag and default value.
+    __frozen_values: Dict[Tuple[str, Any, bool, Any], Any] = {}
+
+    @classmethod
+    def _freeze_environment(cls):
+        cls.__frozen_environ = dict(os.environ)
+        cls.__frozen_values = {}
+
+    @classmethod
+    def _unfreeze_environment(cls):
+        cls.__frozen_environ = None
+        cls.__frozen_values = {}
+
+    @classmethod
+    def _invalidate(cls):
+        """Take a new copy of the environment variables if the environment is frozen."""
+        if cls.__frozen_environ is not None:
+            cls._freeze_environment()
 
     @classmethod
     def _replace_templates(cls, template, type=str, required=True, default=None):
+        if isinstance(template, str):
+            return template if "ENV" not in template else cls._replace_template(template, type, required, default)
         if isinstance(template, tuple):
             return tuple(cls._replace_template(item, type, required, default) for item in template)
         if isinstance(template, list):
@@ -39,14 +71,36 @@ class _TemplateHandler:
             return {str(k): cls._replace_template(v, type, required, default) for k, v in template.items()}
         return cls._replace_template(template, type, required, default)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=__MAX_CACHED_TEMPLATES)
+    def __parse(template: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Return the name of the environment variable and the dynamic type of a template, None if it is not one."""
+        if match := re.fullmatch(_TemplateHandler._PATTERN, template):
+            return match.group(1), match.group(3)
+        return None
+
     @classmethod
     def _replace_template(cls, template, type, required, default):
-        if "ENV" not in str(template):
+        if not isinstance(template, str):
+            # Templates are strings, no need to compute the string representation of any other value.
+            return template
+        if "ENV" not in template:
             return template
-        if match := re.fullmatch(cls._PATTERN, str(template)):
-            var = match.group(1)
-            dynamic_type = match.group(3)
-            val = os.environ.get(var)
+        if cls.__frozen_environ is None or cls.__parse(template) is None:
+            # Only the values of templates are cached, not any string containing "ENV".
+            return cls.__resolve(template, type, required, default)
+        key = (template, type, required, default)
+        try:
+            return cls.__frozen_values[key]
+        except KeyError:
+            value = cls.__frozen_values[key] = cls.__resolve(template, type, required, default)
+            return value
+
+    @classmethod
+    def __resolve(cls, template: str, type, required, default):
+        if parsed := cls.__parse(template):
+            var, dynamic_type = parsed
+            val = os.environ.get(var) if cls.__frozen_environ is None else cls.__frozen_environ.get(var)
             if val is None:
                 if required:
                     raise MissingEnvVariableError(f"Environment variable {var} is not set.")
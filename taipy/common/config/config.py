@@ -21,6 +21,7 @@ from .checker._checker import _Checker
 from .checker.issue_collector import IssueCollector
 from .common._classproperty import _Classproperty
 from .common._config_blocker import _ConfigBlocker
+from .common._template_handler import _TemplateHandler
 from .global_app.global_app_config import GlobalAppConfig
 from .section import Section
 from .unique_section import UniqueSection
@@ -216,6 +217,21 @@ class Config:
         """Unblock update on the configuration signgleton."""
         _ConfigBlocker._unblock()
 
+    @classmethod
+    def freeze_environment(cls) -> None:
+        """Freeze the values of the environment variables used by the configuration templates.
+
+        Once frozen, the values of the `ENV[...]` templates are resolved from a copy of the environment
+        variables taken when this method is called, or when the configuration is later updated. This
+        avoids reading the environment each time a templated value is accessed.
+        """
+        _TemplateHandler._freeze_environment()
+
+    @classmethod
+    def unfreeze_environment(cls) -> None:
+        """Resolve the configuration templates from the current environment variables."""
+        _TemplateHandler._unfreeze_environment()
+
     @classmethod
     @_ConfigBlocker._check()
     def configure_global_app(cls, **properties) -> GlobalAppConfig:
@@ -304,6 +320,7 @@ class Config:
     @classmethod
     def _compile_configs(cls) -> None:
         Config._override_env_file()
+        _TemplateHandler._invalidate()
         cls._applied_config._clean()
         if cls._default_config:
             cls._applied_config._update(cls._default_config)
@@ -182,6 +182,19 @@ class Config:
     def unblock_update(cls) -> None:
         """Unblock update on the configuration signgleton."""
 
+    @classmethod
+    def freeze_environment(cls) -> None:
+        """Freeze the values of the environment variables used by the configuration templates.
+
+        Once frozen, the values of the `ENV[...]` templates are resolved from a copy of the environment
+        variables taken when this method is called, or when the configuration is later updated. This
+        avoids reading the environment each time a templated value is accessed.
+        """
+
+    @classmethod
+    def unfreeze_environment(cls) -> None:
+        """Resolve the configuration templates from the current environment variables."""
+
     @classmethod
     @_ConfigBlocker._check()
     def configure_global_app(cls, **properties) -> GlobalAppConfig:
@@ -342,7 +355,7 @@ class Config:
         Arguments:
             storage_type (str): The default storage type for all data node configurations.
                 The possible values are *"pickle"* (the default value), *"csv"*, *"excel"*,
-                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"generic"*,
+                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"numpy"*, *"generic"*,
                 or *"s3_object"*.
             scope (Optional[Scope^]): The default scope for all data node configurations.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -394,7 +407,7 @@ class Config:
                 are None (which is the default value of *"pickle"*, unless it has been overloaded by the
                 *storage_type* value set in the default data node configuration
                 (see `(Config.)set_default_data_node_configuration()^`)), *"pickle"*, *"csv"*, *"excel"*,
-                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"mongo_collection"*, *"in_memory"*, or
+                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"numpy"*, *"mongo_collection"*, *"in_memory"*, or
                 *"generic"*.
             scope (Optional[Scope^]): The scope of the data node configuration.<br/>
                 The default value is `Scope.SCENARIO` (or the one specified in
@@ -421,6 +434,8 @@ class Config:
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        engine: Optional[str] = None,
+        dtype: Optional[Union[str, Dict[str, str]]] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new CSV data node configuration.
@@ -440,6 +455,11 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            engine (Optional[str]): The parser used to read the CSV file. Possible values are *"c"*,
+                *"python"*, or *"pyarrow"* (multi-threaded).<br/>
+                The default value is the default parser of pandas.
+            dtype (Optional[Union[str, dict[str, str]]]): The data type of the columns, or a dictionary
+                mapping column names to data types.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -663,6 +683,44 @@ class Config:
             The new pickle data node configuration.
         """  # noqa: E501
 
+    @classmethod
+    def configure_numpy_data_node(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        default_data: Optional[Any] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        mmap_mode: Optional[str] = "r",
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new numpy data node configuration.
+
+        Arguments:
+            id (str): The unique identifier of the new numpy data node configuration.
+            default_path (Optional[str]): The path of the `.npy` file.
+            default_data (Optional[any]): The default data of the data nodes instantiated from
+                this numpy data node configuration.
+                If provided, note that the default_data will be stored as a configuration attribute.
+                So it is designed to handle small data values like parameters, and it must be Json serializable.
+            scope (Optional[Scope^]): The scope of the numpy data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            mmap_mode (Optional[str]): The mode used to memory-map the `.npy` file when the data node is read.
+                The possible values are *"r"* (read-only), *"c"* (copy-on-write), or None to load the whole
+                array in memory.<br/>
+                The default value is *"r"*.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new numpy data node configuration.
+        """  # noqa: E501
+
     @classmethod
     def configure_sql_table_data_node(
         cls,
@@ -681,6 +739,8 @@ class Config:
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        db_pool_size: Optional[int] = None,
+        db_pool_pre_ping: Optional[bool] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL table data node configuration.
@@ -716,6 +776,13 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            db_pool_size (Optional[int]): The number of connections kept open in the pool of the
+                database engine. The engine and its pool are shared by all the SQL data nodes that
+                connect to the same database.<br/>
+                The default value is the default pool size of SQLAlchemy.
+            db_pool_pre_ping (Optional[bool]): If True, the connections of the pool are tested before
+                being used, so that a connection closed by the database is transparently replaced.<br/>
+                The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -742,6 +809,8 @@ class Config:
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        db_pool_size: Optional[int] = None,
+        db_pool_pre_ping: Optional[bool] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL data node configuration.
@@ -781,6 +850,13 @@ class Config:
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            db_pool_size (Optional[int]): The number of connections kept open in the pool of the
+                database engine. The engine and its pool are shared by all the SQL data nodes that
+                connect to the same database.<br/>
+                The default value is the default pool size of SQLAlchemy.
+            db_pool_pre_ping (Optional[bool]): If True, the connections of the pool are tested before
+                being used, so that a connection closed by the database is transparently replaced.<br/>
+                The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
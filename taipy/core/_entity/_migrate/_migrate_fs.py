@@ -16,6 +16,7 @@ from typing import Dict
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
+from ..._repository._filesystem_index import _FileSystemIndex
 from ._utils import _migrate
 
 __logger = _TaipyLogger._get_logger()
@@ -55,6 +56,14 @@ def __write_entities_to_fs(_entities: Dict, root: str):
         shutil.rmtree(pipelines_path)
 
 
+def __remove_indexes(root: str):
+    # Indexes are rebuilt from the migrated entities on their next use
+    suffixes = (_FileSystemIndex._SUFFIX, _FileSystemIndex._SUFFIX + _FileSystemIndex._LOCK_SUFFIX)
+    for file in os.listdir(root):
+        if file.endswith(suffixes):
+            os.remove(os.path.join(root, file))
+
+
 def _restore_migrate_file_entities(path: str) -> bool:
     backup_path = f"{path}_backup"
 
@@ -112,6 +121,7 @@ def _migrate_fs_entities(path: str, backup: bool = True) -> bool:
     entities = _load_all_entities_from_fs(path)
     entities, _ = _migrate(entities)
     __write_entities_to_fs(entities, path)
+    __remove_indexes(path)
 
     __logger.info("Migration finished")
     return True
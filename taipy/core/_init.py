@@ -27,12 +27,14 @@ from .submission.submission import Submission
 from .submission.submission_id import SubmissionId
 from .submission.submission_status import SubmissionStatus
 from .taipy import (
+    batch,
     can_create,
     cancel_job,
     clean_all_entities,
     compare_scenarios,
     create_global_data_node,
     create_scenario,
+    create_scenarios,
     delete,
     delete_job,
     delete_jobs,
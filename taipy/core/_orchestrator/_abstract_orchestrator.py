@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import threading
 from abc import abstractmethod
 from typing import Callable, Iterable, Optional, Union
 
@@ -21,6 +22,9 @@ from ..task.task import Task
 class _AbstractOrchestrator:
     """Creates, enqueues, and orchestrates jobs as instances of `Job^` class."""
 
+    # Signaled when the job dispatcher may have a job to dispatch.
+    jobs_to_run_condition = threading.Condition()
+
     @property
     @abstractmethod
     def jobs_to_run(self):
@@ -31,6 +35,12 @@ class _AbstractOrchestrator:
     def blocked_jobs(self):
         pass
 
+    @classmethod
+    def _notify_dispatcher(cls) -> None:
+        """Wake up the job dispatcher waiting for a job to run or for an available worker."""
+        with cls.jobs_to_run_condition:
+            cls.jobs_to_run_condition.notify_all()
+
     @classmethod
     @abstractmethod
     def initialize(cls):
@@ -44,5 +44,5 @@ class _DevelopmentJobDispatcher(_JobDispatcher):
         Arguments:
             job (Job^): The job to submit on an executor with an available worker.
         """
-        rs = _TaskFunctionWrapper(job.id, job.task).execute()
-        self._update_job_status(job, rs)
+        exceptions, output_fingerprints = _TaskFunctionWrapper(job.id, job.task).execute()
+        self._update_job_status(job, exceptions, output_fingerprints)
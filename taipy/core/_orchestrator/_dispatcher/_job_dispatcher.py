@@ -10,18 +10,20 @@
 # specific language governing permissions and limitations under the License.
 
 import threading
-import time
 import traceback
 from abc import abstractmethod
 from queue import Empty
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from ...data._data_manager_factory import _DataManagerFactory
+from ...data.data_node import DataNode
+from ...data.data_node_id import EDIT_FINGERPRINT_KEY, EDIT_INPUT_FINGERPRINTS_KEY
 from ...job._job_manager_factory import _JobManagerFactory
 from ...job.job import Job
+from ...job.job_id import JobId
 from ...task.task import Task
 from .._abstract_orchestrator import _AbstractOrchestrator
 
@@ -30,9 +32,13 @@ class _JobDispatcher(threading.Thread):
     """Manages job dispatching (instances of `Job^` class) on executors."""
 
     _STOP_FLAG = False
+    # Bounds the wait when a job is queued without notifying the dispatcher.
+    _MAX_WAITING_TIME = 1.0
     stop_wait = True
     stop_timeout = None
     _logger = _TaipyLogger._get_logger()
+    # Fingerprints of the inputs of the dispatched jobs, recorded in the edits of their outputs once completed.
+    __input_fingerprints: Dict[JobId, Dict[str, str]] = {}
 
     def __init__(self, orchestrator: _AbstractOrchestrator):
         threading.Thread.__init__(self, name="Thread-Taipy-JobDispatcher")
@@ -57,6 +63,7 @@ class _JobDispatcher(threading.Thread):
             timeout (Optional[float]): The maximum time to wait. If None, the method will wait indefinitely.
         """
         self._STOP_FLAG = True
+        self.orchestrator._notify_dispatcher()
         if wait and self.is_running():
             self._logger.debug("Waiting for the dispatcher thread to stop...")
             self.join(timeout=timeout)
@@ -64,8 +71,7 @@ class _JobDispatcher(threading.Thread):
     def run(self):
         self._logger.debug("Job dispatcher started.")
         while not self._STOP_FLAG:
-            if not self._can_execute():
-                time.sleep(0.2)  # We need to sleep to avoid busy waiting.
+            if not self._wait_for_job_to_execute():
                 continue
 
             with self.lock:
@@ -73,7 +79,7 @@ class _JobDispatcher(threading.Thread):
                 job = None
                 try:
                     if not self._STOP_FLAG:
-                        job = self.orchestrator.jobs_to_run.get(block=True, timeout=0.1)
+                        job = self.orchestrator.jobs_to_run.get(block=False)
                 except Empty:  # In case the last job of the queue has been removed.
                     pass
             if job:
@@ -87,15 +93,36 @@ class _JobDispatcher(threading.Thread):
                     self._logger.exception(e)
         self._logger.debug("Job dispatcher stopped.")
 
+    def _wait_for_job_to_execute(self) -> bool:
+        """Block until a job is queued and the dispatcher has resources to dispatch it, or until it is stopped.
+
+        The orchestrator notifies the dispatcher when jobs are queued, and the dispatcher notifies itself
+        when a worker becomes available.
+
+        Returns:
+            True if a job can be dispatched.
+        """
+        condition = self.orchestrator.jobs_to_run_condition  # type: ignore[attr-defined]
+        with condition:
+            is_ready = condition.wait_for(
+                lambda: self._STOP_FLAG or (self._can_execute() and not self.orchestrator.jobs_to_run.empty()),
+                timeout=self._MAX_WAITING_TIME,
+            )
+        return is_ready and not self._STOP_FLAG
+
     @abstractmethod
     def _can_execute(self) -> bool:
         """Returns True if the dispatcher have resources to dispatch a new job."""
         raise NotImplementedError
 
     def _execute_job(self, job: Job):
-        if job.force or self._needs_to_run(job.task):
+        # The fingerprints are computed once, to decide if the job runs and to record them in its outputs.
+        input_fingerprints = self._get_input_fingerprints(job.task.input.values())
+        if job.force or self._needs_to_run(job.task, input_fingerprints):
             if job.force:
                 self._logger.info(f"job {job.id} is forced to be executed.")
+            if input_fingerprints:
+                _JobDispatcher.__input_fingerprints[job.id] = input_fingerprints
             job.running()
             self._dispatch(job)
         else:
@@ -113,12 +140,18 @@ class _JobDispatcher(threading.Thread):
             self._execute_job(job)
 
     @staticmethod
-    def _needs_to_run(task: Task) -> bool:
+    def _needs_to_run(task: Task, input_fingerprints: Optional[Dict[str, str]] = None) -> bool:
         """
         Returns True if the task has no output or if at least one input was modified since the latest run.
 
+        If all the inputs have a fingerprint, an input is modified if its fingerprint differs from the one
+        recorded when the outputs were last written by a job. Otherwise, an input is modified if it was
+        edited after the outputs.
+
         Arguments:
              task (Task^): The task to run.
+             input_fingerprints (Optional[Dict[str, str]]): The fingerprints of the inputs, as returned by
+                `_get_input_fingerprints()`. If None, they are computed when needed.
 
         Returns:
              True if the task needs to run. False otherwise.
@@ -133,10 +166,39 @@ class _JobDispatcher(threading.Thread):
             return True
         if len(task.input) == 0:
             return False
-        input_last_edit = max(data_manager._get(dn.id).last_edit_date for dn in task.input.values())
-        output_last_edit = min(data_manager._get(dn.id).last_edit_date for dn in task.output.values())
+        inputs = [data_manager._get(dn.id) for dn in task.input.values()]
+        outputs = [data_manager._get(dn.id) for dn in task.output.values()]
+        if input_fingerprints is None:
+            input_fingerprints = _JobDispatcher._get_input_fingerprints(inputs)
+        if input_fingerprints is not None:
+            recorded_fingerprints = [
+                last_edit.get(EDIT_INPUT_FINGERPRINTS_KEY) if (last_edit := dn.get_last_edit()) else None
+                for dn in outputs
+            ]
+            if all(recorded is not None for recorded in recorded_fingerprints):
+                return any(recorded != input_fingerprints for recorded in recorded_fingerprints)
+        input_last_edit = max(dn.last_edit_date for dn in inputs)
+        output_last_edit = min(dn.last_edit_date for dn in outputs)
         return input_last_edit > output_last_edit
 
+    @staticmethod
+    def _get_input_fingerprints(inputs: Iterable[DataNode]) -> Optional[Dict[str, str]]:
+        """Returns the fingerprints of the inputs by data node id, or None if an input has no fingerprint."""
+        inputs = list(inputs)
+        if not all(dn.properties.get(DataNode._FINGERPRINT_KEY) for dn in inputs):
+            return None
+        fingerprints = {}
+        for dn in inputs:
+            if (fingerprint := dn._get_fingerprint()) is None:
+                return None
+            fingerprints[dn.id] = fingerprint
+        return fingerprints
+
+    @staticmethod
+    def _discard_input_fingerprints(job_id: JobId):
+        """Forget the fingerprints of the inputs of a job whose outputs will not be written by it."""
+        _JobDispatcher.__input_fingerprints.pop(job_id, None)
+
     @abstractmethod
     def _dispatch(self, job: Job):
         """
@@ -148,8 +210,13 @@ class _JobDispatcher(threading.Thread):
         raise NotImplementedError
 
     @staticmethod
-    def _update_job_status(job: Job, exceptions):
-        """Update the job status based on the success or the failure of its execution."""
+    def _update_job_status(job: Job, exceptions, output_fingerprints: Optional[Dict[str, str]] = None):
+        """Update the job status based on the success or the failure of its execution.
+
+        The fingerprints of the outputs, computed by the process that wrote them, are recorded in their edits
+        along with the fingerprints of the inputs. The outputs are not hashed again.
+        """
+        input_fingerprints = _JobDispatcher.__input_fingerprints.pop(job.id, None)
         if exceptions:
             job.failed()
             _TaipyLogger._get_logger().error(f" {len(exceptions)} errors occurred during execution of job {job.id}")
@@ -160,6 +227,12 @@ class _JobDispatcher(threading.Thread):
             _JobManagerFactory._build_manager()._set(job)
         else:
             for output in job.task.output.values():
-                output.track_edit(job_id=job.id)
+                output.track_edit(
+                    job_id=job.id,
+                    **{
+                        EDIT_FINGERPRINT_KEY: (output_fingerprints or {}).get(output.id),
+                        EDIT_INPUT_FINGERPRINTS_KEY: input_fingerprints,
+                    },
+                )
                 output.unlock_edit()
             job.completed()
@@ -10,32 +10,52 @@
 # specific language governing permissions and limitations under the License.
 
 import multiprocessing as mp
+import uuid
 from concurrent.futures import Executor, ProcessPoolExecutor
 from functools import partial
 from threading import Lock
-from typing import Callable, Optional
+from typing import Any, Callable, Optional, Tuple
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
+from taipy.common.config.common._config_blocker import _ConfigBlocker
 
+from ..._entity._reload import _Reloader
 from ...job.job import Job
+from ...task._task_manager_factory import _TaskManagerFactory
 from .._abstract_orchestrator import _AbstractOrchestrator
 from ._job_dispatcher import _JobDispatcher
 from ._task_function_wrapper import _TaskFunctionWrapper
 
 
+def _initialize_worker(config_as_string: str, config_generation: str, subproc_initializer: Optional[Callable]):
+    try:
+        # Applying the configuration imports the modules of the configured functions.
+        _TaskFunctionWrapper._apply_config(config_as_string, config_generation)
+    except Exception as e:
+        # An error raised by an initializer breaks the whole pool: it is raised by each job executed by the worker.
+        _TaskFunctionWrapper._config_error = e
+    # Warms up the managers and their repositories before the first job is received.
+    _Reloader()
+    if subproc_initializer:
+        subproc_initializer()
+
+
 class _StandaloneJobDispatcher(_JobDispatcher):
     """Manages job dispatching (instances of `Job^` class) in an asynchronous way using a ProcessPoolExecutor."""
 
     _nb_available_workers_lock = Lock()
     _DEFAULT_MAX_NB_OF_WORKERS = 2
 
+    # The serialized configuration, along with the configuration and the number of updates it was serialized from.
+    __config_payload: Optional[Tuple[Any, int, str, str]] = None
+    __config_payload_lock = Lock()
+
     def __init__(self, orchestrator: _AbstractOrchestrator, subproc_initializer: Optional[Callable] = None):
         super().__init__(orchestrator)
-        max_workers = Config.job_config.max_nb_of_workers or self._DEFAULT_MAX_NB_OF_WORKERS
-        self._executor: Executor = ProcessPoolExecutor(
-            max_workers=max_workers, initializer=subproc_initializer, mp_context=mp.get_context("spawn")
-        )
+        self._max_workers = Config.job_config.max_nb_of_workers or self._DEFAULT_MAX_NB_OF_WORKERS
+        self._subproc_initializer = subproc_initializer
+        self._executor: Executor = self._create_executor()
         self._nb_available_workers = self._executor._max_workers  # type: ignore
 
     def _can_execute(self) -> bool:
@@ -45,8 +65,10 @@ class _StandaloneJobDispatcher(_JobDispatcher):
             return self._nb_available_workers > 0
 
     def run(self):
-        with self._executor:
+        try:
             super().run()
+        finally:
+            self._executor.shutdown()
         self._logger.debug("Standalone job dispatcher: Pool executor shut down.")
 
     def _dispatch(self, job: Job):
@@ -58,13 +80,48 @@ class _StandaloneJobDispatcher(_JobDispatcher):
         with self._nb_available_workers_lock:
             self._nb_available_workers -= 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the dispatch method.")
-        config_as_string = _TomlSerializer()._serialize(Config._applied_config)  # type: ignore[attr-defined]
+        config_generation, _ = self._get_config_payload()
+        if config_generation != self._workers_config_generation:
+            # The configuration was updated since the workers started: the next jobs are executed by new
+            # workers started with the updated configuration, while the running jobs complete on the others.
+            previous_executor, self._executor = self._executor, self._create_executor()
+            previous_executor.shutdown(wait=False)
 
-        future = self._executor.submit(_TaskFunctionWrapper(job.id, job.task), config_as_string=config_as_string)
+        # Saved tasks are resolved by the workers from their ids, instead of being sent along with each job.
+        by_id = _TaskManagerFactory._build_manager()._exists(job.task.id)
+        future = self._executor.submit(
+            _TaskFunctionWrapper(job.id, job.task, by_id), config_generation=self._workers_config_generation
+        )
         future.add_done_callback(partial(self._update_job_status_from_future, job))
 
+    def _create_executor(self) -> Executor:
+        """Start a pool of workers receiving the applied configuration once, when they start."""
+        self._workers_config_generation, config_as_string = self._get_config_payload()
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            initializer=_initialize_worker,
+            initargs=(config_as_string, self._workers_config_generation, self._subproc_initializer),
+            mp_context=mp.get_context("spawn"),
+        )
+
+    @classmethod
+    def _get_config_payload(cls) -> Tuple[str, str]:
+        """Return the generation and the serialization of the applied configuration.
+
+        The configuration is only serialized again when it has been updated.
+        """
+        applied_config, nb_updates = Config._applied_config, _ConfigBlocker._nb_updates()
+        with cls.__config_payload_lock:
+            payload = cls.__config_payload
+            if payload is None or payload[0] is not applied_config or payload[1] != nb_updates:
+                config_as_string = _TomlSerializer()._serialize(applied_config)  # type: ignore[attr-defined]
+                payload = cls.__config_payload = (applied_config, nb_updates, uuid.uuid4().hex, config_as_string)
+            return payload[2], payload[3]
+
     def _update_job_status_from_future(self, job: Job, ft):
         with self._nb_available_workers_lock:
             self._nb_available_workers += 1
             self._logger.debug(f"Setting nb_available_workers to {self._nb_available_workers} in the callback method.")
-        self._update_job_status(job, ft.result())
+        self.orchestrator._notify_dispatcher()
+        exceptions, output_fingerprints = ft.result()
+        self._update_job_status(job, exceptions, output_fingerprints)
@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Any, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
@@ -17,30 +17,73 @@ from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from ...data._data_manager_factory import _DataManagerFactory
 from ...data.data_node import DataNode
-from ...exceptions import DataNodeWritingError
+from ...data.data_node_id import EDIT_JOB_ID_KEY, EDIT_TIMESTAMP_KEY, DataNodeId
+from ...data.pickle import PickleDataNode
+from ...exceptions import DataNodeWritingError, NonExistingTask
 from ...job.job_id import JobId
+from ...task._task_manager_factory import _TaskManagerFactory
 from ...task.task import Task
+from ...task.task_id import TaskId
 
 logger = _TaipyLogger._get_logger()
 
 
 class _TaskFunctionWrapper:
-    """Wrapper around task function."""
+    """Wrapper around task function.
 
-    def __init__(self, job_id: JobId, task: Task):
+    If `by_id` is True, the wrapper only holds the job and task ids when it is sent to another process.
+    The process executing the job resolves the task from its repository and keeps it in a cache for the
+    next jobs of the task.
+    """
+
+    _MAX_CACHED_TASKS = 1024
+    _MAX_KEPT_OUTPUTS = 8
+
+    # Generation of the configuration applied in the current process by `_apply_config()`.
+    _applied_config_generation: Optional[str] = None
+    # Error raised when the configuration was applied by the worker initializer.
+    _config_error: Optional[Exception] = None
+    # Tasks resolved by the current process, by id.
+    __tasks: Dict[TaskId, Task] = {}
+    # Data written by the jobs executed by the current process, with the job id, by data node id.
+    __kept_outputs: Dict[DataNodeId, Tuple[JobId, Any]] = {}
+
+    def __init__(self, job_id: JobId, task: Task, by_id: bool = False):
         self.job_id = job_id
-        self.task = task
+        self.task: Optional[Task] = task
+        self.task_id: TaskId = task.id
+        self.by_id = by_id
+
+    def __getstate__(self):
+        if not self.by_id:
+            return vars(self)
+        # The task is resolved when the job is executed, so that errors are reported as job errors.
+        return {**vars(self), "task": None}
+
+    def __setstate__(self, state):
+        vars(self).update(state)
 
     def __call__(self, **kwargs):
         """Make this object callable as a function. Actually calls `execute`."""
         return self.execute(**kwargs)
 
-    def execute(self, **kwargs):
-        """Execute the wrapped function. If `config_as_string` is given, then it will be reapplied to the config."""
+    def execute(self, **kwargs) -> Tuple[List[Exception], Dict[DataNodeId, str]]:
+        """Execute the wrapped function.
+
+        If `config_as_string` is given, then it will be reapplied to the config, unless the process already
+        applied the configuration of the given `config_generation`.
+
+        Returns:
+            The exceptions raised by the execution, and the fingerprints of the written outputs by data node id.
+        """
         try:
+            config_generation = kwargs.pop("config_generation", None)
             if config_as_string := kwargs.pop("config_as_string", None):
-                Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
-                Config.block_update()
+                self._apply_config(config_as_string, config_generation)
+            if self._config_error is not None:
+                raise self._config_error
+            if self.task is None:
+                self.task = self._resolve_task(self.task_id)
 
             inputs = list(self.task.input.values())
             outputs = list(self.task.output.values())
@@ -50,28 +93,78 @@ class _TaskFunctionWrapper:
             return self._write_data(outputs, results, self.job_id)
         except Exception as e:
             logger.error("Error during task function execution!", exc_info=1)
-            return [e]
+            return [e], {}
+
+    @classmethod
+    def _apply_config(cls, config_as_string: str, config_generation: Optional[str] = None):
+        if config_generation is not None and config_generation == cls._applied_config_generation:
+            return
+        Config._applied_config._update(_TomlSerializer()._deserialize(config_as_string))
+        Config.block_update()
+        cls._applied_config_generation = config_generation
+        cls._config_error = None
+        cls.__tasks.clear()
+        cls.__kept_outputs.clear()
+
+    @classmethod
+    def _resolve_task(cls, task_id: TaskId) -> Task:
+        if (task := cls.__tasks.get(task_id)) is None:
+            task = _TaskManagerFactory._build_manager()._get(task_id)
+            if task is None:
+                raise NonExistingTask(task_id)
+            if len(cls.__tasks) >= cls._MAX_CACHED_TASKS:
+                del cls.__tasks[next(iter(cls.__tasks))]
+            cls.__tasks[task_id] = task
+        return task
 
     def _read_inputs(self, inputs: List[DataNode]) -> List[Any]:
         data_manager = _DataManagerFactory._build_manager()
-        return [data_manager._get(dn.id).read_or_raise() for dn in inputs]
+        return [self.__read(data_manager._get(dn.id)) for dn in inputs]
+
+    @classmethod
+    def __read(cls, data_node: DataNode) -> Any:
+        if (kept := cls.__kept_outputs.pop(data_node.id, None)) is not None:
+            job_id, data = kept
+            edits = data_node.edits
+            last_edit = edits[-1] if edits else {}
+            # The data is still the one written by the job if it is the last edit, and the file is unchanged since.
+            if last_edit.get(EDIT_JOB_ID_KEY) == job_id and last_edit[EDIT_TIMESTAMP_KEY] == data_node.last_edit_date:
+                cls.__kept_outputs[data_node.id] = kept
+                return data
+        return data_node.read_or_raise()
+
+    @classmethod
+    def __keep_output(cls, data_node: DataNode, data: Any, job_id: JobId):
+        if not isinstance(data_node, PickleDataNode) or not Config.job_config.keep_outputs_in_memory:
+            return
+        cls.__kept_outputs.pop(data_node.id, None)
+        if len(cls.__kept_outputs) >= cls._MAX_KEPT_OUTPUTS:
+            del cls.__kept_outputs[next(iter(cls.__kept_outputs))]
+        cls.__kept_outputs[data_node.id] = (job_id, data)
 
-    def _write_data(self, outputs: List[DataNode], results, job_id: JobId):
+    def _write_data(
+        self, outputs: List[DataNode], results, job_id: JobId
+    ) -> Tuple[List[Exception], Dict[DataNodeId, str]]:
         data_manager = _DataManagerFactory._build_manager()
+        exceptions: List[Exception] = []
+        # The outputs are hashed by the process that wrote them, from the data it still holds.
+        fingerprints: Dict[DataNodeId, str] = {}
         try:
             if outputs:
                 _results = self._extract_results(outputs, results)
-                exceptions = []
                 for res, dn in zip(_results, outputs):
                     try:
                         data_node = data_manager._get(dn.id)
                         data_node._write(res)
+                        self.__keep_output(data_node, res, job_id)
+                        if fingerprint := data_node._get_written_fingerprint(res):
+                            fingerprints[data_node.id] = fingerprint
                     except Exception as e:
                         logger.error("Error during write", exc_info=1)
                         exceptions.append(DataNodeWritingError(f"Error writing in datanode id {dn.id}: {e}"))
-                return exceptions
+            return exceptions, fingerprints
         except Exception as e:
-            return [e]
+            return [e], {}
 
     def _execute_fct(self, arguments: List[Any]) -> Any:
         return self.task.function(*arguments)
@@ -14,13 +14,15 @@ from datetime import datetime
 from queue import Queue
 from threading import Lock
 from time import sleep
-from typing import Callable, Iterable, List, Optional, Set, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from .._entity.submittable import Submittable
+from .._repository._unit_of_work import _UnitOfWork
 from ..data._data_manager_factory import _DataManagerFactory
+from ..data.data_node_id import DataNodeId
 from ..job._job_manager_factory import _JobManagerFactory
 from ..job.job import Job
 from ..job.job_id import JobId
@@ -28,6 +30,7 @@ from ..submission._submission_manager_factory import _SubmissionManagerFactory
 from ..submission.submission import Submission
 from ..task.task import Task
 from ._abstract_orchestrator import _AbstractOrchestrator
+from ._dispatcher._job_dispatcher import _JobDispatcher
 
 
 class _Orchestrator(_AbstractOrchestrator):
@@ -38,6 +41,10 @@ class _Orchestrator(_AbstractOrchestrator):
     jobs_to_run: Queue = Queue()
     blocked_jobs: List[Job] = []
 
+    # Input data nodes each blocked job waits for, and the blocked jobs waiting for each data node.
+    _awaited_data_nodes: Dict[JobId, Set[DataNodeId]] = {}
+    _awaiting_jobs: Dict[DataNodeId, Dict[JobId, Job]] = {}
+
     lock = Lock()
     __logger = _TaipyLogger._get_logger()
 
@@ -96,6 +103,8 @@ class _Orchestrator(_AbstractOrchestrator):
                 )
             submission.jobs = jobs  # type: ignore
             cls._orchestrate_job_to_run_or_block(jobs)
+            # The dispatcher thread reads the submitted entities from the repositories.
+            _UnitOfWork._flush()
         if Config.job_config.is_development:
             cls._check_and_execute_jobs_if_development_mode()
         elif wait:
@@ -145,6 +154,8 @@ class _Orchestrator(_AbstractOrchestrator):
             jobs = [job]
             submission.jobs = jobs  # type: ignore
             cls._orchestrate_job_to_run_or_block(jobs)
+            # The dispatcher thread reads the submitted entities from the repositories.
+            _UnitOfWork._flush()
         if Config.job_config.is_development:
             cls._check_and_execute_jobs_if_development_mode()
         else:
@@ -194,6 +205,7 @@ class _Orchestrator(_AbstractOrchestrator):
             if cls._is_blocked(job):
                 job.blocked()
                 blocked_jobs.append(job)
+                cls.__await_inputs(job)
             else:
                 job.pending()
                 pending_jobs.append(job)
@@ -201,6 +213,7 @@ class _Orchestrator(_AbstractOrchestrator):
         cls.blocked_jobs.extend(blocked_jobs)
         for job in pending_jobs:
             cls.jobs_to_run.put(job)
+        cls._notify_dispatcher()
 
     @classmethod
     def _wait_until_job_finished(cls, jobs: Union[List[Job], Job], timeout: Optional[Union[float, int]] = None) -> None:
@@ -236,6 +249,25 @@ class _Orchestrator(_AbstractOrchestrator):
         data_manager = _DataManagerFactory._build_manager()
         return any(not data_manager._get(dn.id).is_ready_for_reading for dn in input_data_nodes)
 
+    @classmethod
+    def __await_inputs(cls, job: Job) -> None:
+        data_manager = _DataManagerFactory._build_manager()
+        awaited_ids = {dn.id for dn in job.task.input.values() if not data_manager._get(dn.id).is_ready_for_reading}
+        if not awaited_ids:
+            # The job is checked again on every job completion.
+            return
+        cls._awaited_data_nodes[job.id] = awaited_ids
+        for dn_id in awaited_ids:
+            cls._awaiting_jobs.setdefault(dn_id, {})[job.id] = job
+
+    @classmethod
+    def __stop_awaiting_inputs(cls, job: Job) -> None:
+        for dn_id in cls._awaited_data_nodes.pop(job.id, ()):
+            if awaiting_jobs := cls._awaiting_jobs.get(dn_id):
+                awaiting_jobs.pop(job.id, None)
+                if not awaiting_jobs:
+                    del cls._awaiting_jobs[dn_id]
+
     @staticmethod
     def _unlock_edit_on_jobs_outputs(jobs: Union[Job, List[Job], Set[Job]]) -> None:
         jobs = [jobs] if isinstance(jobs, Job) else jobs
@@ -246,25 +278,54 @@ class _Orchestrator(_AbstractOrchestrator):
     def _on_status_change(cls, job: Job) -> None:
         if job.is_completed() or job.is_skipped():
             cls.__logger.debug(f"{job.id} has been completed or skipped. Unblocking jobs.")
-            cls.__unblock_jobs()
+            cls.__unblock_jobs(job)
         elif job.is_failed():
             cls._fail_subsequent_jobs(job)
 
     @classmethod
-    def __unblock_jobs(cls) -> None:
+    def __unblock_jobs(cls, finished_job: Job) -> None:
         with cls.lock:
             cls.__logger.debug("Acquiring lock to unblock jobs.")
-            for job in cls.blocked_jobs:
-                if not cls._is_blocked(job):
-                    cls.__logger.debug(f"Unblocking job: {job.id}.")
-                    job.pending()
-                    cls.__logger.debug(f"Removing job {job.id} from the blocked_job list.")
-                    cls.__remove_blocked_job(job)
-                    cls.__logger.debug(f"Adding job {job.id} to the list of jobs to run.")
-                    cls.jobs_to_run.put(job)
+            blocked_job_ids = {job.id for job in cls.blocked_jobs}
+            jobs_to_unblock = []
+
+            # Only the jobs waiting for the outputs of the finished job can be unblocked by its completion.
+            data_manager = _DataManagerFactory._build_manager()
+            for dn in finished_job.task.output.values():
+                if dn.id not in cls._awaiting_jobs or not data_manager._get(dn.id).is_ready_for_reading:
+                    continue
+                for job_id, job in cls._awaiting_jobs.pop(dn.id).items():
+                    awaited_ids = cls._awaited_data_nodes.get(job_id, set())
+                    awaited_ids.discard(dn.id)
+                    if not awaited_ids:
+                        cls._awaited_data_nodes.pop(job_id, None)
+                        if job_id not in blocked_job_ids:
+                            continue
+                        # The other inputs may have been locked since the job was blocked.
+                        if cls._is_blocked(job):
+                            cls.__await_inputs(job)
+                        else:
+                            jobs_to_unblock.append(job)
+
+            # The blocked jobs whose inputs are not tracked are checked entirely.
+            jobs_to_unblock.extend(
+                job
+                for job in cls.blocked_jobs
+                if job.id not in cls._awaited_data_nodes and job not in jobs_to_unblock and not cls._is_blocked(job)
+            )
+
+            for job in jobs_to_unblock:
+                cls.__logger.debug(f"Unblocking job: {job.id}.")
+                job.pending()
+                cls.__logger.debug(f"Removing job {job.id} from the blocked_job list.")
+                cls.__remove_blocked_job(job)
+                cls.__logger.debug(f"Adding job {job.id} to the list of jobs to run.")
+                cls.jobs_to_run.put(job)
+            cls._notify_dispatcher()
 
     @classmethod
     def __remove_blocked_job(cls, job: Job) -> None:
+        cls.__stop_awaiting_inputs(job)
         try:  # In case the job has been removed from the list of blocked_jobs.
             cls.blocked_jobs.remove(job)
         except Exception:
@@ -327,6 +388,7 @@ class _Orchestrator(_AbstractOrchestrator):
             )
             for job in to_fail_or_abandon_jobs:
                 job.abandoned()
+                _JobDispatcher._discard_input_fingerprints(job.id)
             to_fail_or_abandon_jobs.update([failed_job])
             cls.__remove_blocked_jobs(to_fail_or_abandon_jobs)
             cls.__remove_jobs_to_run(to_fail_or_abandon_jobs)
@@ -343,8 +405,10 @@ class _Orchestrator(_AbstractOrchestrator):
                 cls.__logger.info(f"{job.id} has already been skipped and cannot be canceled.")
             elif job_id_to_cancel == job.id:
                 job.canceled()
+                _JobDispatcher._discard_input_fingerprints(job.id)
             else:
                 job.abandoned()
+                _JobDispatcher._discard_input_fingerprints(job.id)
 
     @staticmethod
     def _check_and_execute_jobs_if_development_mode() -> None:
@@ -12,7 +12,8 @@
 import json
 import pathlib
 from abc import abstractmethod
-from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from contextlib import contextmanager
+from typing import Any, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar, Union
 
 from ..exceptions import FileCannotBeRead
 from ._decoder import _Decoder
@@ -32,6 +33,24 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _save_all(self, entities: Iterable[Entity]):
+        """
+        Save several entities in the repository.
+
+        Arguments:
+            entities: The entities to save.
+        """
+        for entity in entities:
+            self._save(entity)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """
+        Group the writes made in the context so that they are committed together when the
+        repository supports it.
+        """
+        yield
+
     @abstractmethod
     def _exists(self, entity_id: str) -> bool:
         """
@@ -116,6 +135,21 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _get_latest(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> Optional[Entity]:
+        """
+        Retrieve the last created entity whose model holds the value for the attribute.
+
+        Arguments:
+            attribute: The model attribute that is the key to the search.
+            value: The value of the attribute that is being searched.
+            filters: The filters the entity must match, taking any version filter into account.
+
+        Returns:
+            The matching entity with the greatest creation date, or None if no entity matches.
+        """
+        entities = self._load_all([{**fil, attribute: value} for fil in filters or [{}]])
+        return max(entities, key=lambda entity: entity.creation_date, default=None)  # type: ignore[attr-defined]
+
     @abstractmethod
     def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]):
         """
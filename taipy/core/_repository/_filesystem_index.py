@@ -0,0 +1,351 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import os
+import pathlib
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class _FileSystemIndex:
+    """
+    Secondary indexes of the entities stored in a `_FileSystemRepository^` folder.
+
+    The index maps the values of some attributes (config id, owner id, version, ...) to the ids of the
+    entities holding them. It is persisted next to the entity folder as an append-only log of JSON lines,
+    each line recording the indexed values of an entity or its deletion. Appending keeps the index
+    consistent when several processes share the same storage folder: each process replays the lines
+    written by the others before answering a lookup.
+
+    The index is rebuilt from the entity files when it is missing, or when the number of entities it
+    references does not match the number of entity files the first time it is loaded by a process.
+
+    The first line of the log records the indexed attributes. A log written for other attributes is
+    discarded and rebuilt. It is discarded while holding the lock described below, and only if its first
+    line is still outdated, so that a log just rebuilt by another process is kept.
+
+    Once the lines superseded by later lines (deletions, updates) outnumber the entities, the log is
+    compacted: it is rewritten with one line per entity and atomically replaces the previous file.
+    Appending lines and compacting the log hold an exclusive lock on a lock file next to the log, so
+    that no line appended by another process is lost when the previous file is replaced. The other
+    processes then replay the new file.
+
+    When the creation date is indexed, the index also keeps track of the last created entity holding
+    each value that was looked up, so that the latest entity is found without comparing all of them.
+
+    Lookups return candidate ids. The repository still checks the content of the corresponding files.
+
+    Attributes:
+        dir_path (pathlib.Path): The folder holding the entity files.
+        attributes (Tuple[str, ...]): The names of the indexed model attributes.
+    """
+
+    _SUFFIX = ".index"
+    _LOCK_SUFFIX = ".lock"
+    __ID_KEY = "id"
+    __DELETED_KEY = "deleted"
+    __HEADER_KEY = "attributes"
+    _CREATION_DATE = "creation_date"
+    _COMPACTION_MIN_LINES = 1000
+
+    def __init__(self, dir_path: pathlib.Path, attributes: Tuple[str, ...]):
+        self.dir_path = dir_path
+        self.attributes = attributes
+        self._lock = threading.RLock()
+        self.__reset()
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self.dir_path.with_name(self.dir_path.name + self._SUFFIX)
+
+    @property
+    def lock_path(self) -> pathlib.Path:
+        return self.path.with_name(self.path.name + self._LOCK_SUFFIX)
+
+    def _ids(self, filters: List[Dict]) -> Optional[Set[str]]:
+        """Return the ids of the entities matching at least one of the filters.
+
+        Returns:
+            None if the filters cannot be answered by the index, the set of candidate ids otherwise.
+        """
+        if not filters or not all(self._is_indexable(fil) for fil in filters):
+            return None
+        with self._lock:
+            self.__refresh()
+            ids: Set[str] = set()
+            for fil in filters:
+                ids.update(self.__ids_matching(fil))
+            return ids
+
+    def _ids_by(self, attribute: str, value: Any) -> Set[str]:
+        with self._lock:
+            self.__refresh()
+            return set(self._postings[attribute].get(value, ()))
+
+    def _latest_id(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> Optional[str]:
+        """Return the id of the last created entity holding the value among the entities matching the filters.
+
+        The creation date must be indexed, as well as the attribute and the filters.
+
+        Returns:
+            The id of the entity with the greatest creation date, None if no entity matches.
+        """
+        with self._lock:
+            self.__refresh()
+            key = (attribute, value)
+            if key not in self._latest:
+                self._latest[key] = self.__latest_of(self._postings[attribute].get(value, ()))
+            entity_id = self._latest[key]
+            if entity_id is None or not filters or any(self.__matches(entity_id, fil) for fil in filters):
+                return entity_id
+            # The last created entity does not match the filters (it belongs to another version for instance).
+            ids: Set[str] = set()
+            for fil in filters:
+                ids.update(self.__ids_matching({**fil, attribute: value}))
+            return self.__latest_of(ids)
+
+    def _all_ids(self) -> Set[str]:
+        with self._lock:
+            self.__refresh()
+            return set(self._entries)
+
+    def _is_indexable(self, fil: Dict) -> bool:
+        return all(key in self.attributes and (value is None or isinstance(value, str)) for key, value in fil.items())
+
+    def _set(self, model: Dict[str, Any]):
+        self._set_all([model])
+
+    def _set_all(self, models: Iterable[Dict[str, Any]]):
+        with self._lock:
+            self.__refresh()
+            lines = []
+            for model in models:
+                entity_id = model[self.__ID_KEY]
+                values = self.__indexed_values(model)
+                if self._entries.get(entity_id) != values:
+                    lines.append({self.__ID_KEY: entity_id, **values})
+            self.__append(lines)
+
+    def _remove(self, entity_ids: Iterable[str]):
+        with self._lock:
+            self.__refresh()
+            if lines := [{self.__ID_KEY: entity_id, self.__DELETED_KEY: True} for entity_id in entity_ids]:
+                self.__append(lines)
+
+    def _clear(self):
+        with self._lock:
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+            self.__reset()
+
+    def __reset(self):
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[Any, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._latest: Dict[Tuple[str, Any], Optional[str]] = {}
+        self._file_id: Optional[Tuple[int, int]] = None
+        self._offset = 0
+        self._nb_lines = 0
+        self._is_reconciled = False
+        self._is_outdated = False
+
+    def __ids_matching(self, fil: Dict) -> Set[str]:
+        if not fil:
+            return set(self._entries)
+        postings = sorted((self._postings[key].get(value, set()) for key, value in fil.items()), key=len)
+        return set(postings[0]).intersection(*postings[1:])
+
+    def __matches(self, entity_id: str, fil: Dict) -> bool:
+        values = self._entries[entity_id]
+        return all(
+            value in values.get(key, ()) if isinstance(values.get(key), list) else values.get(key) == value
+            for key, value in fil.items()
+        )
+
+    def __latest_of(self, entity_ids: Iterable[str]) -> Optional[str]:
+        return max(entity_ids, key=self.__creation_order, default=None)
+
+    def __creation_order(self, entity_id: str) -> Tuple[str, str]:
+        # Creation dates are ISO formatted strings: their order is the chronological order.
+        return self._entries[entity_id].get(self._CREATION_DATE) or "", entity_id
+
+    def __indexed_values(self, model: Dict[str, Any]) -> Dict[str, Any]:
+        values = {}
+        for attribute in self.attributes:
+            if attribute in model:
+                value = model[attribute]
+                values[attribute] = sorted(value) if isinstance(value, (list, set, tuple)) else value
+        return values
+
+    def __refresh(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            stat = None
+
+        if stat is None or (stat.st_dev, stat.st_ino) != self._file_id or stat.st_size < self._offset:
+            # The index file was created, replaced or deleted since it was last read.
+            self.__reset()
+        if stat is not None and stat.st_size > self._offset:
+            self.__read_lines()
+        if self._is_outdated:
+            self.__remove_outdated_log()
+            self.__reset()
+            if self.path.exists():
+                # The log was rebuilt by another process in the meantime.
+                self.__read_lines()
+        if not self._is_reconciled:
+            self._is_reconciled = True
+            self.__reconcile()
+
+    def __read_lines(self):
+        with self.path.open("rb") as f:
+            self._file_id = (os.fstat(f.fileno()).st_dev, os.fstat(f.fileno()).st_ino)
+            f.seek(self._offset)
+            content = f.read()
+        # A line being appended by another process is read once it is complete.
+        if (end := content.rfind(b"\n") + 1) == 0:
+            return
+        lines = content[:end].splitlines()
+        if self._offset == 0 and not self.__is_header(lines[0]):
+            # The index was written for other attributes.
+            self._is_outdated = True
+            return
+        self._offset += end
+        self._nb_lines += len(lines)
+        for line in lines:
+            try:
+                self.__apply(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    def __remove_outdated_log(self):
+        with self.__file_lock():
+            try:
+                with self.path.open("rb") as f:
+                    first_line = f.readline()
+            except FileNotFoundError:
+                return
+            # Another process may have rebuilt the log for the indexed attributes since it was read.
+            if not self.__is_header(first_line):
+                self.path.unlink(missing_ok=True)
+
+    def __is_header(self, line: bytes) -> bool:
+        try:
+            return json.loads(line) == {self.__HEADER_KEY: list(self.attributes)}
+        except ValueError:
+            return False
+
+    def __apply(self, line: Dict[str, Any]):
+        entity_id = line.pop(self.__ID_KEY)
+        if previous := self._entries.pop(entity_id, None):
+            for attribute, value in previous.items():
+                for v in value if isinstance(value, list) else [value]:
+                    self._postings[attribute][v].discard(entity_id)
+                    if self._latest.get((attribute, v)) == entity_id:
+                        del self._latest[attribute, v]
+        if line.pop(self.__DELETED_KEY, False):
+            return
+        self._entries[entity_id] = line
+        for attribute, value in line.items():
+            for v in value if isinstance(value, list) else [value]:
+                self._postings[attribute][v].add(entity_id)
+                if (attribute, v) in self._latest and (
+                    (latest := self._latest[attribute, v]) is None
+                    or self.__creation_order(latest) < self.__creation_order(entity_id)
+                ):
+                    self._latest[attribute, v] = entity_id
+
+    def __reconcile(self):
+        try:
+            file_ids = {f.name[: -len(".json")] for f in os.scandir(self.dir_path) if f.name.endswith(".json")}
+        except FileNotFoundError:
+            file_ids = set()
+        if len(file_ids) == len(self._entries) and file_ids == self._entries.keys():
+            return
+
+        lines: List[Dict[str, Any]] = [
+            {self.__ID_KEY: entity_id, self.__DELETED_KEY: True} for entity_id in self._entries.keys() - file_ids
+        ]
+        for entity_id in file_ids - self._entries.keys():
+            try:
+                with (self.dir_path / f"{entity_id}.json").open("r", encoding="UTF-8") as f:
+                    model = json.load(f)
+            except (OSError, ValueError):
+                continue
+            lines.append({self.__ID_KEY: entity_id, **self.__indexed_values(model)})
+        self.__append(lines)
+
+    def __append(self, lines: List[Dict[str, Any]]):
+        if not lines:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.__file_lock():
+            if not self.path.exists() or os.path.getsize(self.path) == 0:
+                lines.insert(0, {self.__HEADER_KEY: list(self.attributes)})
+            content = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines).encode("UTF-8")
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+            try:
+                os.write(fd, content)
+            finally:
+                os.close(fd)
+            # Lines are read back from the file so that the lines appended by other processes are replayed in order.
+            self.__read_lines()
+            if self._nb_lines - len(self._entries) > max(self._COMPACTION_MIN_LINES, len(self._entries)):
+                self.__compact()
+
+    def __compact(self):
+        # The file lock is held: no other process appends lines until the log is replaced.
+        lines = [{self.__HEADER_KEY: list(self.attributes)}]
+        lines.extend({self.__ID_KEY: entity_id, **values} for entity_id, values in self._entries.items())
+        content = "".join(json.dumps(line, ensure_ascii=False) + "\n" for line in lines).encode("UTF-8")
+        temporary_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            temporary_path.write_bytes(content)
+            os.replace(temporary_path, self.path)
+            stat = os.stat(self.path)
+        except OSError:
+            # The log is kept as is, for instance when it is opened by another process on Windows.
+            return
+        finally:
+            temporary_path.unlink(missing_ok=True)
+        self._file_id = (stat.st_dev, stat.st_ino)
+        self._offset = len(content)
+        self._nb_lines = len(lines)
+
+    @contextmanager
+    def __file_lock(self) -> Iterator[None]:
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            if os.name == "nt":
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                try:
+                    yield
+                finally:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
@@ -11,9 +11,10 @@
 
 import copy
 import json
+import os
 import pathlib
 import shutil
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from taipy.common.config import Config
 
@@ -23,6 +24,9 @@ from ..exceptions import FileCannotBeRead, FileEmpty, ModelNotFound
 from ._abstract_repository import _AbstractRepository
 from ._decoder import _Decoder
 from ._encoder import _Encoder
+from ._filesystem_index import _FileSystemIndex
+from ._identity_map import _IdentityMap
+from ._unit_of_work import _UnitOfWork
 
 
 class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
@@ -40,11 +44,17 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     """
 
     __EXCEPTIONS_TO_RETRY = (FileCannotBeRead, FileEmpty)
+    _ENTITY_CACHE_SIZE_KEY = "entity_cache_size"
+    _ENTITY_INDEX_KEY = "entity_index"
+    _INDEXED_ATTRIBUTES: Tuple[str, ...] = ("config_id", "owner_id", "version", "parent_ids", "cycle")
 
     def __init__(self, model_type: Type[ModelType], converter: Type[Converter], dir_name: str):
         self.model_type = model_type
         self.converter = converter
         self._dir_name = dir_name
+        self._identity_map = self.__build_identity_map()
+        self._index_enabled = self.__is_index_enabled()
+        self.__index: Optional[_FileSystemIndex] = None
 
     @property
     def dir_path(self):
@@ -54,35 +64,82 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     def _storage_folder(self) -> pathlib.Path:
         return pathlib.Path(Config.core.taipy_storage_folder)
 
+    @property
+    def _index(self) -> Optional[_FileSystemIndex]:
+        if not self._index_enabled:
+            return None
+        dir_path = self.dir_path
+        if self.__index is None or self.__index.dir_path != dir_path:
+            self.__index = _FileSystemIndex(dir_path, self._INDEXED_ATTRIBUTES)
+        return self.__index
+
     ###############################
     # ##   Inherited methods   ## #
     ###############################
 
     def _save(self, entity: Entity):
+        if _UnitOfWork._register(self, entity.id, entity):  # type: ignore
+            return
         self.__create_directory_if_not_exists()
-        model = self.converter._entity_to_model(entity)  # type: ignore
-        self.__get_path(model.id).write_text(
-            json.dumps(model.to_dict(), ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False),
-            encoding="UTF-8",
-        )
+        model_dict, file_content = self.__to_file_content(entity)
+        path = self.__get_path(model_dict["id"])
+        path.write_text(file_content, encoding="UTF-8")
+        self.__invalidate_identity_map()
+        if index := self._index:
+            index._set(model_dict)
+
+    def _save_all(self, entities: Iterable[Entity]):
+        self.__create_directory_if_not_exists()
+        model_dicts = []
+        temporary_paths: List[Tuple[pathlib.Path, pathlib.Path]] = []
+        replaced = 0
+        try:
+            for entity in entities:
+                model_dict, file_content = self.__to_file_content(entity)
+                path = self.__get_path(model_dict["id"])
+                temporary_path = self._storage_folder / f".{self._dir_name}.{path.name}.{os.getpid()}.tmp"
+                temporary_paths.append((temporary_path, path))
+                temporary_path.write_text(file_content, encoding="UTF-8")
+                model_dicts.append(model_dict)
+
+            # Entity files are only replaced once all of them are written, each replacement being atomic.
+            for temporary_path, path in temporary_paths:
+                os.replace(temporary_path, path)
+                replaced += 1
+        finally:
+            for temporary_path, _ in temporary_paths[replaced:]:
+                temporary_path.unlink(missing_ok=True)
+            self.__invalidate_identity_map()
+            if index := self._index:
+                index._set_all(model_dicts[:replaced])
 
     def _exists(self, entity_id: str) -> bool:
+        if _UnitOfWork._get(self, entity_id) is not None:
+            return True
         return self.__get_path(entity_id).exists()
 
     def _load(self, entity_id: str) -> Entity:
+        if (entity := _UnitOfWork._get(self, entity_id)) is not None:
+            return entity
         path = pathlib.Path(self.__get_path(entity_id))
-
-        try:
-            file_content = self.__read_file(path)
-        except (FileNotFoundError, FileCannotBeRead, FileEmpty):
-            raise ModelNotFound(str(self.dir_path), entity_id) from None
-
-        return self.__file_content_to_entity(file_content)
+        if (identity_map := self._identity_map) is None:
+            return self.__load_file(entity_id, path)
+
+        # The generation and the signature are taken before reading so that a concurrent write can only
+        # invalidate the entity read.
+        generation = identity_map.generation
+        if (signature := identity_map._signature(path)) is None:
+            raise ModelNotFound(str(self.dir_path), entity_id)
+        if (entity := identity_map._get(entity_id, signature)) is None:
+            entity = self.__load_file(entity_id, path)
+            identity_map._put(entity_id, generation, signature, entity)
+        return entity
 
     def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        _UnitOfWork._flush(self)
         entities = []
         try:
-            for f in self.dir_path.iterdir():
+            for f in self.__candidate_files(filters):
                 if data := self.__filter_by(f, filters):
                     entities.append(self.__file_content_to_entity(data))
         except FileNotFoundError:
@@ -90,34 +147,52 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         return entities
 
     def _delete(self, entity_id: str):
+        is_pending = bool(_UnitOfWork._discard(self, [entity_id]))
         try:
             self.__get_path(entity_id).unlink()
         except FileNotFoundError:
+            if is_pending:
+                return
             raise ModelNotFound(str(self.dir_path), entity_id) from None
+        self.__invalidate_identity_map()
+        if index := self._index:
+            index._remove([entity_id])
 
     def _delete_all(self):
+        _UnitOfWork._discard(self)
         shutil.rmtree(self.dir_path, ignore_errors=True)
+        self.__invalidate_identity_map()
+        if index := self._index:
+            index._clear()
 
     def _delete_many(self, ids: Iterable[str]):
         for model_id in ids:
             self._delete(model_id)
 
     def _delete_by(self, attribute: str, value: str):
+        _UnitOfWork._flush(self)
         filters: List[Dict] = [{}]
         for fil in filters:
             fil.update({attribute: value})
 
+        deleted_ids = []
         try:
-            for f in self.dir_path.iterdir():
+            for f in self.__candidate_files(filters):
                 if self.__filter_by(f, filters):
                     f.unlink()
+                    deleted_ids.append(f.stem)
         except FileNotFoundError:
             pass
+        self.__invalidate_identity_map()
+        if index := self._index:
+            index._remove(deleted_ids)
 
     def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        _UnitOfWork._flush(self)
         return list(self.__search(attribute, value, filters))
 
     def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]) -> None:
+        _UnitOfWork._flush(self)
         if isinstance(folder_path, str):
             folder: pathlib.Path = pathlib.Path(folder_path)
         else:
@@ -137,11 +212,19 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     def _get_by_configs_and_owner_ids(self, configs_and_owner_ids, filters: Optional[List[Dict]] = None):
         # Design in order to optimize performance on Entity creation.
         # Maintainability and readability were impacted.
+        _UnitOfWork._flush(self)
         if not filters:
             filters = [{}]
         res = {}
         configs_and_owner_ids = set(configs_and_owner_ids)
 
+        if (index := self._index) and all(index._is_indexable(fil) for fil in filters):
+            for config, owner_id in configs_and_owner_ids:
+                config_filters = [{**fil, "config_id": config.id, "owner_id": owner_id} for fil in filters]
+                if entity := self.__get_first_by_index(index, config_filters):
+                    res[config, owner_id] = entity
+            return res
+
         try:
             for f in self.dir_path.iterdir():
                 config_id, owner_id, entity = self.__match_file_and_get_entity(
@@ -161,9 +244,25 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
 
         return res
 
+    def _get_latest(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> Optional[Entity]:
+        _UnitOfWork._flush(self)
+        if (
+            (index := self._index)
+            and index._CREATION_DATE in index.attributes
+            and all(index._is_indexable({**fil, attribute: value}) for fil in filters or [{}])
+        ):
+            if (entity_id := index._latest_id(attribute, value, filters)) is None:
+                return None
+            latest_filters = [{**fil, attribute: value} for fil in filters or [{}]]
+            if data := self.__filter_by(self.__get_path(entity_id), latest_filters):
+                return self.__file_content_to_entity(data)
+            # The index is behind the entity files: the latest entity is looked for in the files.
+        return super()._get_latest(attribute, value, filters)
+
     def _get_by_config_and_owner_id(
         self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
     ) -> Optional[Entity]:
+        _UnitOfWork._flush(self)
         filters = [{}] if not filters else copy.deepcopy(filters)
 
         if owner_id is not None:
@@ -178,6 +277,10 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
     def __filter_files_by_config_and_owner_id(
         self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
     ):
+        if (index := self._index) and filters and all(index._is_indexable(fil) for fil in filters):
+            return self.__get_first_by_index(
+                index, [{**fil, "config_id": config_id, "owner_id": owner_id} for fil in filters]
+            )
         try:
             files = filter(lambda f: config_id in f.name, self.dir_path.iterdir())
             entities = (self.__file_content_to_entity(self.__filter_by(f, filters)) for f in files)
@@ -201,15 +304,59 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
 
         return None, None, None
 
+    def __build_identity_map(self) -> Optional[_IdentityMap]:
+        cache_size = int(Config.core.repository_properties.get(self._ENTITY_CACHE_SIZE_KEY, 0) or 0)
+        return _IdentityMap(cache_size) if cache_size > 0 else None
+
+    def __invalidate_identity_map(self):
+        if self._identity_map is not None:
+            self._identity_map._invalidate()
+
+    def __is_index_enabled(self) -> bool:
+        enabled = Config.core.repository_properties.get(self._ENTITY_INDEX_KEY, True)
+        return enabled.lower() not in ("false", "0", "no") if isinstance(enabled, str) else bool(enabled)
+
     def __create_directory_if_not_exists(self):
         self.dir_path.mkdir(parents=True, exist_ok=True)
 
+    def __get_first_by_index(self, index: _FileSystemIndex, filters: List[Dict]) -> Optional[Entity]:
+        for entity_id in sorted(index._ids(filters) or ()):
+            if data := self.__filter_by(self.__get_path(entity_id), filters):
+                return self.__file_content_to_entity(data)
+        return None
+
+    def __candidate_files(self, filters: Optional[List[Dict]]) -> Iterable[pathlib.Path]:
+        if (index := self._index) and (ids := index._ids(filters or [])) is not None:
+            return (self.__get_path(entity_id) for entity_id in sorted(ids))
+        return self.dir_path.iterdir()
+
     def __search(self, attribute: str, value: str, filters: Optional[List[Dict]] = None) -> Iterator[Entity]:
+        if (index := self._index) and index._is_indexable({attribute: value}):
+            candidate_filters = [{**fil, attribute: value} for fil in filters or [{}]]
+            if (ids := index._ids(candidate_filters)) is not None:
+                entities = []
+                for entity_id in sorted(ids):
+                    if data := self.__filter_by(self.__get_path(entity_id), filters):
+                        entities.append(self.__file_content_to_entity(data))
+                return filter(lambda e: getattr(e, attribute, None) == value, entities)
         return filter(lambda e: getattr(e, attribute, None) == value, self._load_all(filters))
 
+    def __to_file_content(self, entity: Entity) -> Tuple[Dict[str, Any], str]:
+        model = self.converter._entity_to_model(entity)  # type: ignore
+        model_dict = model.to_dict()
+        return model_dict, json.dumps(model_dict, ensure_ascii=False, indent=0, cls=_Encoder, check_circular=False)
+
     def __get_path(self, model_id) -> pathlib.Path:
         return self.dir_path / f"{model_id}.json"
 
+    def __load_file(self, entity_id: str, path: pathlib.Path) -> Entity:
+        try:
+            file_content = self.__read_file(path)
+        except (FileNotFoundError, FileCannotBeRead, FileEmpty):
+            raise ModelNotFound(str(self.dir_path), entity_id) from None
+
+        return self.__file_content_to_entity(json.loads(file_content, cls=_Decoder))
+
     def __file_content_to_entity(self, file_content):
         if not file_content:
             return None
@@ -0,0 +1,91 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pathlib
+import stat
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+_Signature = Tuple[int, int]
+
+
+class _IdentityMap:
+    """
+    Bounded LRU map of the entities loaded by a `_FileSystemRepository^`, keyed by entity id.
+
+    Loading an entity kept in the map returns the same instance, without reading and converting its
+    file again. The instance is shared by all the callers loading the entity in the process.
+
+    An entry is valid as long as:
+
+    - The generation of the map has not changed. The repository increments it, which empties the map,
+      each time it writes or deletes entities, including when a `_UnitOfWork^` writes its pending
+      entities. An entity read while the generation changed is not kept.
+    - The signature (modification time and size) of the entity file has not changed, so that an
+      entity written by another process is read again. A file rewritten by another process with the
+      same size within the modification time resolution of the file system is not detected.
+
+    Attributes:
+        max_size (int): The maximum number of entities kept in memory.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._generation = 0
+        self._entries: OrderedDict[str, Tuple[_Signature, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @staticmethod
+    def _signature(filepath: pathlib.Path) -> Optional[_Signature]:
+        try:
+            file_stat = os.stat(filepath)
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def _get(self, entity_id: str, signature: _Signature) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(entity_id)
+            if entry is None:
+                return None
+            entry_signature, entity = entry
+            if entry_signature != signature:
+                del self._entries[entity_id]
+                return None
+            self._entries.move_to_end(entity_id)
+            return entity
+
+    def _put(self, entity_id: str, generation: int, signature: _Signature, entity: Any):
+        """Keep the entity read from a file with the given signature while the map had the given generation."""
+        with self._lock:
+            if generation != self._generation:
+                # The entities were written or deleted while the file was read.
+                return
+            self._entries[entity_id] = (signature, entity)
+            self._entries.move_to_end(entity_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _invalidate(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,68 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import pathlib
+import sqlite3
+import threading
+import weakref
+from typing import Dict, Set
+
+
+class _Connection(sqlite3.Connection):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.initialized_tables: Set[str] = set()
+
+
+class _SQLiteConnection:
+    """Process-wide pool of SQLite connections, holding one connection per thread and database file.
+
+    Connections are opened in autocommit mode with the WAL journal so that readers from other
+    processes do not block writers. Connections inherited from a parent process are never reused.
+    """
+
+    _TIMEOUT = 30.0
+
+    __local = threading.local()
+    __generation = 0
+    __all_connections: "weakref.WeakSet[_Connection]" = weakref.WeakSet()
+    __lock = threading.Lock()
+
+    @classmethod
+    def _get(cls, db_location: str) -> _Connection:
+        if getattr(cls.__local, "key", None) != (os.getpid(), cls.__generation):
+            cls.__local.key = (os.getpid(), cls.__generation)
+            cls.__local.connections = {}
+        connections: Dict[str, _Connection] = cls.__local.connections
+        if (connection := connections.get(db_location)) is None:
+            connection = connections[db_location] = cls.__connect(db_location)
+            with cls.__lock:
+                cls.__all_connections.add(connection)
+        return connection
+
+    @classmethod
+    def _close_all(cls):
+        with cls.__lock:
+            for connection in list(cls.__all_connections):
+                connection.close()
+            cls.__all_connections.clear()
+            cls.__generation += 1
+
+    @classmethod
+    def __connect(cls, db_location: str) -> _Connection:
+        pathlib.Path(db_location).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            db_location, timeout=cls._TIMEOUT, isolation_level=None, check_same_thread=False, factory=_Connection
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
@@ -0,0 +1,271 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import pathlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
+
+from taipy.common.config import Config
+
+from ..common.typing import Converter, Entity, ModelType
+from ..exceptions import ModelNotFound
+from ._abstract_repository import _AbstractRepository
+from ._decoder import _Decoder
+from ._encoder import _Encoder
+from ._sqlite_connection import _Connection, _SQLiteConnection
+from ._unit_of_work import _UnitOfWork
+
+
+class _SQLiteRepository(_AbstractRepository[ModelType, Entity]):
+    """
+    Holds common methods to be used and extended when the need for saving
+    dataclasses in a SQLite database emerges.
+
+    Each model type is stored in its own table. A row holds the JSON serialization of the model
+    along with the indexed columns used to filter entities without decoding them.
+
+    Attributes:
+        model_type (ModelType): Generic dataclass.
+        converter: A class that handles conversion to and from a database backend.
+        table_name (str): Name of the table that holds the rows of this dataclass model.
+    """
+
+    _DB_LOCATION_KEY = "db_location"
+    _DEFAULT_DB_FILE_NAME = "taipy.sqlite"
+    _INDEXED_COLUMNS: Tuple[str, ...] = ("config_id", "owner_id", "version")
+    __ID_COLUMN = "id"
+    __CREATION_DATE_COLUMN = "creation_date"
+    __MODEL_COLUMN = "model"
+    __MAX_VARIABLES = 500
+
+    def __init__(self, model_type: Type[ModelType], converter: Type[Converter], table_name: str):
+        self.model_type = model_type
+        self.converter = converter
+        self.table_name = table_name
+
+    @property
+    def db_location(self) -> str:
+        if db_location := Config.core.repository_properties.get(self._DB_LOCATION_KEY):
+            return str(db_location)
+        return str(pathlib.Path(Config.core.taipy_storage_folder) / self._DEFAULT_DB_FILE_NAME)
+
+    @property
+    def _connection(self) -> _Connection:
+        connection = _SQLiteConnection._get(self.db_location)
+        if self.table_name not in connection.initialized_tables:
+            self._create_tables(connection)
+            connection.initialized_tables.add(self.table_name)
+        return connection
+
+    ###############################
+    # ##   Inherited methods   ## #
+    ###############################
+
+    def _save(self, entity: Entity):
+        if _UnitOfWork._register(self, entity.id, entity):  # type: ignore
+            return
+        self._connection.execute(self.__upsert_query(), self.__to_row(entity))
+
+    def _save_all(self, entities: Iterable[Entity]):
+        rows = [self.__to_row(entity) for entity in entities]
+        with self._transaction():
+            self._connection.executemany(self.__upsert_query(), rows)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        connection = self._connection
+        if connection.in_transaction:
+            # Joins the transaction opened by another repository sharing the connection.
+            yield
+            return
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _exists(self, entity_id: str) -> bool:
+        if _UnitOfWork._get(self, entity_id) is not None:
+            return True
+        query = f"SELECT 1 FROM {self.table_name} WHERE {self.__ID_COLUMN} = ? LIMIT 1"
+        return self._connection.execute(query, (entity_id,)).fetchone() is not None
+
+    def _load(self, entity_id: str) -> Entity:
+        if (entity := _UnitOfWork._get(self, entity_id)) is not None:
+            return entity
+        query = f"SELECT {self.__MODEL_COLUMN} FROM {self.table_name} WHERE {self.__ID_COLUMN} = ?"
+        if row := self._connection.execute(query, (entity_id,)).fetchone():
+            return self.__to_entity(row[0])
+        raise ModelNotFound(self.table_name, entity_id)
+
+    def _load_all(self, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        _UnitOfWork._flush(self)
+        return [self.__to_entity(model) for model in self.__select_models(filters)]
+
+    def _delete(self, entity_id: str):
+        is_pending = bool(_UnitOfWork._discard(self, [entity_id]))
+        query = f"DELETE FROM {self.table_name} WHERE {self.__ID_COLUMN} = ?"
+        if self._connection.execute(query, (entity_id,)).rowcount == 0 and not is_pending:
+            raise ModelNotFound(self.table_name, entity_id)
+
+    def _delete_all(self):
+        _UnitOfWork._discard(self)
+        self._connection.execute(f"DELETE FROM {self.table_name}")
+
+    def _delete_many(self, ids: Iterable[str]):
+        ids = list(ids)
+        _UnitOfWork._discard(self, ids)
+        for i in range(0, len(ids), self.__MAX_VARIABLES):
+            chunk = ids[i : i + self.__MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            query = f"DELETE FROM {self.table_name} WHERE {self.__ID_COLUMN} IN ({placeholders})"
+            self._connection.execute(query, chunk)
+
+    def _delete_by(self, attribute: str, value: str):
+        _UnitOfWork._flush(self)
+        if self.__is_indexed({attribute: value}):
+            self._connection.execute(f"DELETE FROM {self.table_name} WHERE {attribute} IS ?", (value,))
+        else:
+            self._delete_many(
+                json.loads(model)[self.__ID_COLUMN] for model in self.__select_models([{attribute: value}])
+            )
+
+    def _search(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> List[Entity]:
+        if self.__is_indexed({attribute: value}):
+            filters = [{**fil, attribute: value} for fil in filters or [{}]]
+        return [e for e in self._load_all(filters) if getattr(e, attribute, None) == value]
+
+    def _export(self, entity_id: str, folder_path: Union[str, pathlib.Path]) -> None:
+        _UnitOfWork._flush(self)
+        query = f"SELECT {self.__MODEL_COLUMN} FROM {self.table_name} WHERE {self.__ID_COLUMN} = ?"
+        if (row := self._connection.execute(query, (entity_id,)).fetchone()) is None:
+            raise ModelNotFound(self.table_name, entity_id)
+
+        export_dir = pathlib.Path(folder_path) / self.table_name
+        export_dir.mkdir(parents=True, exist_ok=True)
+        (export_dir / f"{entity_id}.json").write_text(
+            json.dumps(json.loads(row[0]), ensure_ascii=False, indent=0), encoding="UTF-8"
+        )
+
+    ###########################################
+    # ##   Specific or optimized methods   ## #
+    ###########################################
+    def _get_by_configs_and_owner_ids(self, configs_and_owner_ids, filters: Optional[List[Dict]] = None):
+        _UnitOfWork._flush(self)
+        filters = filters or [{}]
+        res = {}
+        for config, owner_id in set(configs_and_owner_ids):
+            config_filters = [{**fil, "config_id": config.id, "owner_id": owner_id} for fil in filters]
+            if models := self.__select_models(config_filters, limit=1):
+                res[config, owner_id] = self.__to_entity(models[0])
+        return res
+
+    def _get_by_config_and_owner_id(
+        self, config_id: str, owner_id: Optional[str], filters: Optional[List[Dict]] = None
+    ) -> Optional[Entity]:
+        _UnitOfWork._flush(self)
+        config_filters = [{**fil, "config_id": config_id, "owner_id": owner_id} for fil in filters or [{}]]
+        if models := self.__select_models(config_filters, limit=1):
+            return self.__to_entity(models[0])
+        return None
+
+    def _get_latest(self, attribute: str, value: Any, filters: Optional[List[Dict]] = None) -> Optional[Entity]:
+        _UnitOfWork._flush(self)
+        latest_filters = [{**fil, attribute: value} for fil in filters or [{}]]
+        if self.__CREATION_DATE_COLUMN in self._INDEXED_COLUMNS and all(
+            self.__is_indexed(fil) for fil in latest_filters
+        ):
+            if models := self.__select_models(latest_filters, limit=1, order_by=self.__CREATION_DATE_COLUMN):
+                return self.__to_entity(models[0])
+            return None
+        return super()._get_latest(attribute, value, filters)
+
+    def _create_tables(self, connection: _Connection):
+        columns = ", ".join(f"{column} TEXT" for column in self._INDEXED_COLUMNS)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+            f"({self.__ID_COLUMN} TEXT PRIMARY KEY, {columns}, {self.__MODEL_COLUMN} TEXT NOT NULL)"
+        )
+        existing_columns = {row[1] for row in connection.execute(f"PRAGMA table_info({self.table_name})")}
+        for column in self._INDEXED_COLUMNS:
+            if column not in existing_columns:
+                # The column was added after the table was created: it is filled from the stored models.
+                connection.execute(f"ALTER TABLE {self.table_name} ADD COLUMN {column} TEXT")
+                connection.execute(
+                    f"UPDATE {self.table_name} SET {column} = json_extract({self.__MODEL_COLUMN}, '$.{column}')"
+                )
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.table_name}_{column} ON {self.table_name} ({column})"
+            )
+
+    #############################
+    # ##   Private methods   ## #
+    #############################
+
+    def __upsert_query(self) -> str:
+        columns = (self.__ID_COLUMN, *self._INDEXED_COLUMNS, self.__MODEL_COLUMN)
+        placeholders = ", ".join("?" * len(columns))
+        return f"INSERT OR REPLACE INTO {self.table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+
+    def __to_row(self, entity: Entity) -> Tuple:
+        model = self.converter._entity_to_model(entity)  # type: ignore
+        model_dict = model.to_dict()
+        indexed_values = tuple(self.__column_value(model_dict.get(column)) for column in self._INDEXED_COLUMNS)
+        return (
+            model.id,
+            *indexed_values,
+            json.dumps(model_dict, ensure_ascii=False, cls=_Encoder, check_circular=False),
+        )
+
+    @staticmethod
+    def __column_value(value: Any) -> Optional[str]:
+        return value if value is None or isinstance(value, str) else str(value)
+
+    def __to_entity(self, model: str) -> Entity:
+        return self.converter._model_to_entity(self.model_type.from_dict(json.loads(model, cls=_Decoder)))  # type: ignore
+
+    def __is_indexed(self, fil: Dict) -> bool:
+        return all(
+            (key == self.__ID_COLUMN or key in self._INDEXED_COLUMNS) and (value is None or isinstance(value, str))
+            for key, value in fil.items()
+        )
+
+    def __select_models(
+        self, filters: Optional[List[Dict]], limit: Optional[int] = None, order_by: Optional[str] = None
+    ) -> List[str]:
+        query = f"SELECT {self.__MODEL_COLUMN} FROM {self.table_name}"
+        params: List[Any] = []
+        if filters:
+            conditions = []
+            for fil in filters:
+                indexed = {key: value for key, value in fil.items() if self.__is_indexed({key: value})}
+                conditions.append(" AND ".join(f"{key} IS ?" for key in indexed) or "1")
+                params.extend(indexed.values())
+            query += " WHERE " + " OR ".join(f"({condition})" for condition in conditions)
+        if order_by:
+            query += f" ORDER BY {order_by} DESC, {self.__ID_COLUMN} DESC"
+
+        if filters and not all(self.__is_indexed(fil) for fil in filters):
+            # Conditions on attributes without a column are checked on the decoded models.
+            rows = self._connection.execute(query, params).fetchall()
+            models = [row[0] for row in rows if self.__match(json.loads(row[0], cls=_Decoder), filters)]
+            return models[:limit] if limit else models
+
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return [row[0] for row in self._connection.execute(query, params).fetchall()]
+
+    @staticmethod
+    def __match(model: Dict, filters: List[Dict]) -> bool:
+        return any(all(model.get(key) == value for key, value in fil.items()) for fil in filters)
@@ -0,0 +1,140 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set
+
+if TYPE_CHECKING:
+    from ..notification.event import Event
+    from ._abstract_repository import _AbstractRepository
+
+
+class _UnitOfWork:
+    """
+    Entity writes collected while a batch is open in the current thread.
+
+    While a unit of work is open, the entities saved in a repository are kept in memory, keyed by
+    repository and id, so that saving the same entity several times results in a single write. Loading
+    an entity by id returns the pending instance. Any other query on a repository first writes the
+    entities pending in that repository so that its results stay consistent.
+
+    The pending entities are written when the outermost batch exits, repository by repository, within
+    a single transaction for the repositories that support it. The events published during the batch
+    are then sent to the `Notifier^`, once the entities they refer to can be read by other threads.
+
+    When the outermost batch exits with an exception, the pending entities and the deferred events are
+    discarded. The entities already written because a query flushed them are not rolled back.
+    """
+
+    __local = threading.local()
+
+    def __init__(self):
+        self._pending: Dict["_AbstractRepository", Dict[str, Any]] = {}
+        self._events: List["Event"] = []
+        self._is_writing = False
+
+    @classmethod
+    @contextmanager
+    def _open(cls) -> Iterator["_UnitOfWork"]:
+        if (unit_of_work := getattr(cls.__local, "unit_of_work", None)) is not None:
+            # A nested batch joins the outermost one.
+            yield unit_of_work
+            return
+
+        unit_of_work = cls.__local.unit_of_work = cls()
+        try:
+            yield unit_of_work
+        except BaseException:
+            unit_of_work._pending.clear()
+            unit_of_work._events.clear()
+            raise
+        finally:
+            cls.__local.unit_of_work = None
+            unit_of_work.__commit()
+
+    @classmethod
+    def _register(cls, repository: "_AbstractRepository", entity_id: str, entity: Any) -> bool:
+        """Keep the entity to save until the unit of work is committed.
+
+        Returns:
+            True if the entity is kept by a unit of work, False if it must be saved right away.
+        """
+        if (unit_of_work := cls.__current()) is None:
+            return False
+        unit_of_work._pending.setdefault(repository, {})[entity_id] = entity
+        return True
+
+    @classmethod
+    def _get(cls, repository: "_AbstractRepository", entity_id: str) -> Optional[Any]:
+        if (unit_of_work := cls.__current()) is None or not unit_of_work._pending:
+            return None
+        return unit_of_work._pending.get(repository, {}).get(entity_id)
+
+    @classmethod
+    def _discard(cls, repository: "_AbstractRepository", entity_ids: Optional[Iterable[str]] = None) -> Set[str]:
+        """Forget the pending entities of a repository that are about to be deleted.
+
+        Returns:
+            The ids of the discarded entities.
+        """
+        if (unit_of_work := cls.__current()) is None or repository not in unit_of_work._pending:
+            return set()
+        pending = unit_of_work._pending[repository]
+        if entity_ids is None:
+            discarded = set(pending)
+            pending.clear()
+        else:
+            discarded = {entity_id for entity_id in entity_ids if pending.pop(entity_id, None) is not None}
+        return discarded
+
+    @classmethod
+    def _flush(cls, repository: Optional["_AbstractRepository"] = None):
+        """Write the entities pending in the repository, or in all the repositories if none is given."""
+        if (unit_of_work := cls.__current()) is None or not unit_of_work._pending:
+            return
+        repositories = [repository] if repository is not None else list(unit_of_work._pending)
+        unit_of_work.__write({r: unit_of_work._pending.pop(r) for r in repositories if r in unit_of_work._pending})
+
+    @classmethod
+    def _defer_event(cls, event: "Event") -> bool:
+        if (unit_of_work := cls.__current()) is None:
+            return False
+        unit_of_work._events.append(event)
+        return True
+
+    @classmethod
+    def __current(cls) -> Optional["_UnitOfWork"]:
+        unit_of_work = getattr(cls.__local, "unit_of_work", None)
+        # The repositories save the pending entities for good while they are being written.
+        return None if unit_of_work is None or unit_of_work._is_writing else unit_of_work
+
+    def __commit(self):
+        pending, self._pending = self._pending, {}
+        self.__write(pending)
+
+        from ..notification.notifier import Notifier
+
+        events, self._events = self._events, []
+        for event in events:
+            Notifier.publish(event)
+
+    def __write(self, pending: Dict["_AbstractRepository", Dict[str, Any]]):
+        pending = {repository: entities for repository, entities in pending.items() if entities}
+        self._is_writing = True
+        try:
+            with ExitStack() as stack:
+                for repository in pending:
+                    stack.enter_context(repository._transaction())
+                for repository, entities in pending.items():
+                    repository._save_all(list(entities.values()))
+        finally:
+            self._is_writing = False
@@ -17,10 +17,11 @@ from ..common import _utils
 from ..common._check_dependencies import EnterpriseEditionUtils
 from ._version_fs_repository import _VersionFSRepository
 from ._version_manager import _VersionManager
+from ._version_sqlite_repository import _VersionSQLiteRepository
 
 
 class _VersionManagerFactory(_ManagerFactory):
-    __REPOSITORY_MAP = {"default": _VersionFSRepository}
+    __REPOSITORY_MAP = {"default": _VersionFSRepository, "sqlite": _VersionSQLiteRepository}
 
     @classmethod
     @lru_cache
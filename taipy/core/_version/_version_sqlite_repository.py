@@ -0,0 +1,62 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from .._repository._sqlite_connection import _Connection
+from .._repository._sqlite_repository import _SQLiteRepository
+from ..exceptions import ModelNotFound
+from ._version_converter import _VersionConverter
+from ._version_model import _VersionModel
+
+
+class _VersionSQLiteRepository(_SQLiteRepository):
+    _LATEST_VERSION_KEY = "latest_version"
+    _DEVELOPMENT_VERSION_KEY = "development_version"
+    _SETTINGS_TABLE_NAME = "version_setting"
+
+    def __init__(self) -> None:
+        super().__init__(model_type=_VersionModel, converter=_VersionConverter, table_name="version")
+
+    def _delete_all(self):
+        super()._delete_all()
+        self._connection.execute(f"DELETE FROM {self._SETTINGS_TABLE_NAME}")
+
+    def _set_latest_version(self, version_number):
+        self.__set_setting(self._LATEST_VERSION_KEY, version_number)
+        if self.__get_setting(self._DEVELOPMENT_VERSION_KEY) is None:
+            self.__set_setting(self._DEVELOPMENT_VERSION_KEY, "")
+
+    def _get_latest_version(self) -> str:
+        if (version_number := self.__get_setting(self._LATEST_VERSION_KEY)) is None:
+            raise ModelNotFound(self._SETTINGS_TABLE_NAME, self._LATEST_VERSION_KEY)
+        return version_number
+
+    def _set_development_version(self, version_number):
+        self.__set_setting(self._DEVELOPMENT_VERSION_KEY, version_number)
+        self.__set_setting(self._LATEST_VERSION_KEY, version_number)
+
+    def _get_development_version(self) -> str:
+        if (version_number := self.__get_setting(self._DEVELOPMENT_VERSION_KEY)) is None:
+            raise ModelNotFound(self._SETTINGS_TABLE_NAME, self._DEVELOPMENT_VERSION_KEY)
+        return version_number
+
+    def _create_tables(self, connection: _Connection):
+        super()._create_tables(connection)
+        connection.execute(f"CREATE TABLE IF NOT EXISTS {self._SETTINGS_TABLE_NAME} (key TEXT PRIMARY KEY, value TEXT)")
+
+    def __set_setting(self, key: str, value: str):
+        self._connection.execute(
+            f"INSERT OR REPLACE INTO {self._SETTINGS_TABLE_NAME} (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    def __get_setting(self, key: str):
+        query = f"SELECT value FROM {self._SETTINGS_TABLE_NAME} WHERE key = ?"
+        row = self._connection.execute(query, (key,)).fetchone()
+        return row[0] if row else None
@@ -0,0 +1,69 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import NullPool
+
+
+class _SQLEngineRegistry:
+    """Process-wide registry of the SQLAlchemy engines shared by the SQL data nodes.
+
+    Creating an engine builds its dialect and its connection pool. The data nodes connecting to the same
+    database share a single engine, keyed by connection string and pool options, so that their connections
+    are reused from one read or write to the next, whatever the data node instance.
+
+    The engines inherited from a parent process are forgotten without closing the connections of the parent.
+    """
+
+    __engines: Dict[Tuple[str, Optional[int], bool], Engine] = {}
+    __lock = threading.Lock()
+
+    @classmethod
+    def _get(cls, conn_string: str, pool_size: Optional[int] = None, pool_pre_ping: bool = False) -> Engine:
+        key = (conn_string, pool_size, pool_pre_ping)
+        if (engine := cls.__engines.get(key)) is None:
+            with cls.__lock:
+                if (engine := cls.__engines.get(key)) is None:
+                    engine = cls.__engines[key] = cls.__create_engine(conn_string, pool_size, pool_pre_ping)
+        return engine
+
+    @classmethod
+    def _dispose_all(cls):
+        with cls.__lock:
+            for engine in cls.__engines.values():
+                engine.dispose()
+            cls.__engines.clear()
+
+    @classmethod
+    def _forget_inherited_engines(cls):
+        for engine in cls.__engines.values():
+            engine.dispose(close=False)
+        cls.__engines.clear()
+        cls.__lock = threading.Lock()
+
+    @staticmethod
+    def __create_engine(conn_string: str, pool_size: Optional[int], pool_pre_ping: bool) -> Engine:
+        kwargs: Dict[str, Any] = {"pool_pre_ping": pool_pre_ping}
+        if pool_size is not None:
+            kwargs["pool_size"] = pool_size
+        elif make_url(conn_string).get_backend_name() == "sqlite":
+            # Opening a SQLite file is cheap, and a pooled connection would keep reading a file that was replaced.
+            kwargs["poolclass"] = NullPool
+        return create_engine(conn_string, **kwargs)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_SQLEngineRegistry._forget_inherited_engines)
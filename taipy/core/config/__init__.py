@@ -57,6 +57,7 @@ _inject_section(
         ("configure_excel_data_node", DataNodeConfig._configure_excel),
         ("configure_generic_data_node", DataNodeConfig._configure_generic),
         ("configure_s3_object_data_node", DataNodeConfig._configure_s3_object),
+        ("configure_numpy_data_node", DataNodeConfig._configure_numpy),
     ],
 )
 _inject_section(
@@ -19,7 +19,7 @@ from ..core_section import CoreSection
 
 
 class _CoreSectionChecker(_ConfigChecker):
-    _ACCEPTED_REPOSITORY_TYPES: Set[str] = {"filesystem", "sql"}
+    _ACCEPTED_REPOSITORY_TYPES: Set[str] = {"filesystem", "sql", "sqlite"}
 
     def __init__(self, config: _Config, collector: IssueCollector):
         super().__init__(config, collector)
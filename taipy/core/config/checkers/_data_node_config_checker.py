@@ -80,7 +80,7 @@ class _DataNodeConfigChecker(_ConfigChecker):
                 data_node_config.storage_type,
                 f"`{data_node_config._STORAGE_TYPE_KEY}` field of DataNodeConfig `{data_node_config_id}` must be"
                 f" either csv, sql_table, sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object,"
-                f" or in_memory.",
+                f" numpy, or in_memory.",
             )
 
     def _check_scope(self, data_node_config_id: str, data_node_config: DataNodeConfig):
@@ -154,6 +154,10 @@ class CoreSection(UniqueSection):
     def repository_type(self) -> str:
         """Type of the repository to be used to store Taipy data.
 
+        Possible values are "filesystem", which stores each entity in a JSON file, and "sqlite",
+        which stores the entities in a SQLite database located by the *db_location* repository
+        property (The default location is "<taipy_storage_folder>/taipy.sqlite").
+
         The default value is "filesystem".
         """
         return _tpl._replace_templates(self._repository_type)
@@ -166,7 +170,17 @@ class CoreSection(UniqueSection):
 
     @property
     def repository_properties(self) -> Dict[str, Union[str, int]]:
-        """A dictionary of additional properties to be used by the repository."""
+        """A dictionary of additional properties to be used by the repository.
+
+        With the "filesystem" repository type, the *entity_cache_size* property sets the maximum
+        number of entities kept in memory, so that loading an entity again by id returns the same
+        instance without reading its file. The entities kept are discarded when the repository
+        writes or deletes entities, and an entity file modified by another process is read again,
+        unless it was rewritten with the same size within the time resolution of the file system.
+        The default value is 0, which disables the cache.<br/>
+        The *entity_index* property indicates whether entity lookups by config id, owner id or
+        version use the indexes persisted in the storage folder. The default value is True.
+        """
         return (
             {k: _tpl._replace_templates(v) for k, v in self._repository_properties.items()}
             if self._repository_properties
@@ -177,6 +191,7 @@ class CoreSection(UniqueSection):
     @_ConfigBlocker._check()
     def repository_properties(self, val) -> None:
         self._repository_properties = val
+        CoreSection.__reload_repositories()
 
     @property
     def read_entity_retry(self) -> int:
@@ -400,9 +415,12 @@ class CoreSection(UniqueSection):
                 used in conjunction with the *root_folder* attribute. That means the storage path is
                 <root_folder><storage_folder> (The default path is "./taipy/.taipy/").
             repository_type (Optional[str]): The type of the repository to be used to store Taipy data.
-                The default value is "filesystem".
+                Possible values are *"filesystem"* and *"sqlite"*. The default value is "filesystem".
             repository_properties (Optional[Dict[str, Union[str, int]]]): A dictionary of additional properties
-                to be used by the repository.
+                to be used by the repository. With the "filesystem" repository type, the *entity_cache_size*
+                property sets the maximum number of entities kept in memory. The default value is 0, which
+                disables the cache. The *entity_index* property indicates whether entity lookups use the
+                indexes persisted in the storage folder. The default value is True.
             read_entity_retry (Optional[int]): Number of retries to read an entity from the repository
                 before return failure. The default value is 3.
             mode (Optional[str]): Indicates the mode of the version management system.
@@ -435,7 +453,7 @@ class CoreSection(UniqueSection):
         )
         Config._register(section)
 
-        if repository_type:
+        if repository_type or repository_properties:
             CoreSection.__reload_repositories()
 
         return Config.unique_sections[CoreSection.name]
@@ -450,3 +468,10 @@ class CoreSection(UniqueSection):
         _DataManagerFactory._build_manager.cache_clear()
         _SubmissionManagerFactory._build_manager.cache_clear()
         _VersionManagerFactory._build_manager.cache_clear()
+        _CycleManagerFactory._build_repository.cache_clear()
+        _ScenarioManagerFactory._build_repository.cache_clear()
+        _TaskManagerFactory._build_repository.cache_clear()
+        _JobManagerFactory._build_repository.cache_clear()
+        _DataManagerFactory._build_repository.cache_clear()
+        _SubmissionManagerFactory._build_repository.cache_clear()
+        _VersionManagerFactory._build_repository.cache_clear()
@@ -54,6 +54,7 @@ class DataNodeConfig(Section):
     _STORAGE_TYPE_VALUE_JSON = "json"
     _STORAGE_TYPE_VALUE_PARQUET = "parquet"
     _STORAGE_TYPE_VALUE_S3_OBJECT = "s3_object"
+    _STORAGE_TYPE_VALUE_NUMPY = "numpy"
 
     _DEFAULT_STORAGE_TYPE = _STORAGE_TYPE_VALUE_PICKLE
     _ALL_STORAGE_TYPES = [
@@ -68,6 +69,7 @@ class DataNodeConfig(Section):
         _STORAGE_TYPE_VALUE_JSON,
         _STORAGE_TYPE_VALUE_PARQUET,
         _STORAGE_TYPE_VALUE_S3_OBJECT,
+        _STORAGE_TYPE_VALUE_NUMPY,
     ]
 
     _EXPOSED_TYPE_KEY = "exposed_type"
@@ -97,6 +99,8 @@ class DataNodeConfig(Section):
     _OPTIONAL_EXPOSED_TYPE_CSV_PROPERTY = "exposed_type"
     _OPTIONAL_DEFAULT_PATH_CSV_PROPERTY = "default_path"
     _OPTIONAL_HAS_HEADER_CSV_PROPERTY = "has_header"
+    _OPTIONAL_ENGINE_CSV_PROPERTY = "engine"
+    _OPTIONAL_DTYPE_CSV_PROPERTY = "dtype"
     # Excel
     _OPTIONAL_EXPOSED_TYPE_EXCEL_PROPERTY = "exposed_type"
     _OPTIONAL_DEFAULT_PATH_EXCEL_PROPERTY = "default_path"
@@ -117,6 +121,8 @@ class DataNodeConfig(Section):
     _OPTIONAL_DRIVER_SQL_PROPERTY = "db_driver"
     _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY = "db_extra_args"
     _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY = "exposed_type"
+    _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY = "db_pool_size"
+    _OPTIONAL_DB_POOL_PRE_PING_SQL_PROPERTY = "db_pool_pre_ping"
     # SQL_TABLE
     _REQUIRED_TABLE_NAME_SQL_TABLE_PROPERTY = "table_name"
     # SQL
@@ -136,6 +142,10 @@ class DataNodeConfig(Section):
     # Pickle
     _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY = "default_path"
     _OPTIONAL_DEFAULT_DATA_PICKLE_PROPERTY = "default_data"
+    # Numpy
+    _OPTIONAL_DEFAULT_PATH_NUMPY_PROPERTY = "default_path"
+    _OPTIONAL_DEFAULT_DATA_NUMPY_PROPERTY = "default_data"
+    _OPTIONAL_MMAP_MODE_NUMPY_PROPERTY = "mmap_mode"
     # JSON
     _OPTIONAL_ENCODER_JSON_PROPERTY = "encoder"
     _OPTIONAL_DECODER_JSON_PROPERTY = "decoder"
@@ -179,6 +189,8 @@ class DataNodeConfig(Section):
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: str,
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: dict,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: (str, Callable),
+            _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY: int,
+            _OPTIONAL_DB_POOL_PRE_PING_SQL_PROPERTY: bool,
         },
         _STORAGE_TYPE_VALUE_SQL_TABLE: {
             _REQUIRED_DB_NAME_SQL_PROPERTY: str,
@@ -193,12 +205,16 @@ class DataNodeConfig(Section):
             _OPTIONAL_FILE_EXTENSION_SQLITE_PROPERTY: str,
             _OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY: dict,
             _OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY: (str, Callable),
+            _OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY: int,
+            _OPTIONAL_DB_POOL_PRE_PING_SQL_PROPERTY: bool,
         },
         _STORAGE_TYPE_VALUE_CSV: {
             _OPTIONAL_DEFAULT_PATH_CSV_PROPERTY: str,
             _OPTIONAL_ENCODING_PROPERTY: str,
             _OPTIONAL_HAS_HEADER_CSV_PROPERTY: bool,
             _OPTIONAL_EXPOSED_TYPE_CSV_PROPERTY: (str, Callable),
+            _OPTIONAL_ENGINE_CSV_PROPERTY: str,
+            _OPTIONAL_DTYPE_CSV_PROPERTY: (str, dict),
         },
         _STORAGE_TYPE_VALUE_EXCEL: {
             _OPTIONAL_DEFAULT_PATH_EXCEL_PROPERTY: str,
@@ -213,6 +229,11 @@ class DataNodeConfig(Section):
             _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY: str,
             _OPTIONAL_DEFAULT_DATA_PICKLE_PROPERTY: _ALL_TYPES,
         },
+        _STORAGE_TYPE_VALUE_NUMPY: {
+            _OPTIONAL_DEFAULT_PATH_NUMPY_PROPERTY: str,
+            _OPTIONAL_DEFAULT_DATA_NUMPY_PROPERTY: (list, tuple, int, float, bool),
+            _OPTIONAL_MMAP_MODE_NUMPY_PROPERTY: (str, type(None)),
+        },
         _STORAGE_TYPE_VALUE_JSON: {
             _OPTIONAL_DEFAULT_PATH_JSON_PROPERTY: str,
             _OPTIONAL_ENCODING_PROPERTY: str,
@@ -279,6 +300,7 @@ class DataNodeConfig(Section):
             _REQUIRED_AWS_STORAGE_BUCKET_NAME_PROPERTY,
             _REQUIRED_AWS_S3_OBJECT_KEY_PROPERTY,
         ],
+        _STORAGE_TYPE_VALUE_NUMPY: [],
     }
 
     _OPTIONAL_PROPERTIES = {
@@ -337,6 +359,10 @@ class DataNodeConfig(Section):
             _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY: None,
             _OPTIONAL_DEFAULT_DATA_PICKLE_PROPERTY: None,
         },
+        _STORAGE_TYPE_VALUE_NUMPY: {
+            _OPTIONAL_DEFAULT_PATH_NUMPY_PROPERTY: None,
+            _OPTIONAL_DEFAULT_DATA_NUMPY_PROPERTY: None,
+        },
         _STORAGE_TYPE_VALUE_JSON: {
             _OPTIONAL_DEFAULT_PATH_PICKLE_PROPERTY: None,
             _OPTIONAL_ENCODING_PROPERTY: _DEFAULT_ENCODING_VALUE,
@@ -518,7 +544,7 @@ class DataNodeConfig(Section):
         Arguments:
             storage_type (str): The default storage type for all data node configurations.
                 The possible values are *"pickle"* (the default value), *"csv"*, *"excel"*,
-                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"generic"*,
+                *"sql"*, *"mongo_collection"*, *"in_memory"*, *"json"*, *"parquet"*, *"numpy"*, *"generic"*,
                 or *"s3_object"*.
             scope (Optional[Scope^]): The default scope for all data node configurations.<br/>
                 The default value is `Scope.SCENARIO`.
@@ -578,7 +604,7 @@ class DataNodeConfig(Section):
                 are None (which is the default value of *"pickle"*, unless it has been overloaded by the
                 *storage_type* value set in the default data node configuration
                 (see `(Config.)set_default_data_node_configuration()^`)), *"pickle"*, *"csv"*, *"excel"*,
-                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"mongo_collection"*, *"in_memory"*, or
+                *"sql_table"*, *"sql"*, *"json"*, *"parquet"*, *"numpy"*, *"mongo_collection"*, *"in_memory"*, or
                 *"generic"*.
             scope (Optional[Scope^]): The scope of the data node configuration.<br/>
                 The default value is `Scope.SCENARIO` (or the one specified in
@@ -606,6 +632,7 @@ class DataNodeConfig(Section):
             cls._STORAGE_TYPE_VALUE_JSON: cls._configure_json,
             cls._STORAGE_TYPE_VALUE_PARQUET: cls._configure_parquet,
             cls._STORAGE_TYPE_VALUE_S3_OBJECT: cls._configure_s3_object,
+            cls._STORAGE_TYPE_VALUE_NUMPY: cls._configure_numpy,
         }
 
         if storage_type in cls._ALL_STORAGE_TYPES:
@@ -623,6 +650,8 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        engine: Optional[str] = None,
+        dtype: Optional[Union[str, Dict[str, str]]] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new CSV data node configuration.
@@ -642,6 +671,11 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            engine (Optional[str]): The parser used to read the CSV file. Possible values are *"c"*,
+                *"python"*, or *"pyarrow"* (multi-threaded).<br/>
+                The default value is the default parser of pandas.
+            dtype (Optional[Union[str, dict[str, str]]]): The data type of the columns, or a dictionary
+                mapping column names to data types.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -655,6 +689,10 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_HAS_HEADER_CSV_PROPERTY] = has_header
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_CSV_PROPERTY] = exposed_type
+        if engine is not None:
+            properties[cls._OPTIONAL_ENGINE_CSV_PROPERTY] = engine
+        if dtype is not None:
+            properties[cls._OPTIONAL_DTYPE_CSV_PROPERTY] = dtype
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_CSV, scope, validity_period, **properties)
 
@@ -929,6 +967,51 @@ class DataNodeConfig(Section):
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_PICKLE, scope, validity_period, **properties)
 
+    @classmethod
+    def _configure_numpy(
+        cls,
+        id: str,
+        default_path: Optional[str] = None,
+        default_data: Optional[Any] = None,
+        scope: Optional[Scope] = None,
+        validity_period: Optional[timedelta] = None,
+        mmap_mode: Optional[str] = "r",
+        **properties,
+    ) -> "DataNodeConfig":
+        """Configure a new numpy data node configuration.
+
+        Arguments:
+            id (str): The unique identifier of the new numpy data node configuration.
+            default_path (Optional[str]): The path of the `.npy` file.
+            default_data (Optional[any]): The default data of the data nodes instantiated from
+                this numpy data node configuration.
+                If provided, note that the default_data will be stored as a configuration attribute.
+                So it is designed to handle small data values like parameters, and it must be Json serializable.
+            scope (Optional[Scope^]): The scope of the numpy data node configuration.<br/>
+                The default value is `Scope.SCENARIO`.
+            validity_period (Optional[timedelta]): The duration since the last edit date for which the data node can be
+                considered up-to-date. Once the validity period has passed, the data node is considered stale and
+                relevant tasks will run even if they are skippable (see the Task configuration
+                [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
+                for more details).
+                If *validity_period* is set to None, the data node is always up-to-date.
+            mmap_mode (Optional[str]): The mode used to memory-map the `.npy` file when the data node is read.
+                The possible values are *"r"* (read-only), *"c"* (copy-on-write), or None to load the whole
+                array in memory.<br/>
+                The default value is *"r"*.
+            **properties (dict[str, any]): A keyworded variable length list of additional arguments.
+
+        Returns:
+            The new numpy data node configuration.
+        """  # noqa: E501
+        if default_path is not None:
+            properties[cls._OPTIONAL_DEFAULT_PATH_NUMPY_PROPERTY] = default_path
+        if default_data is not None:
+            properties[cls._OPTIONAL_DEFAULT_DATA_NUMPY_PROPERTY] = default_data
+        properties[cls._OPTIONAL_MMAP_MODE_NUMPY_PROPERTY] = mmap_mode
+
+        return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_NUMPY, scope, validity_period, **properties)
+
     @classmethod
     def _configure_sql_table(
         cls,
@@ -947,6 +1030,8 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        db_pool_size: Optional[int] = None,
+        db_pool_pre_ping: Optional[bool] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL table data node configuration.
@@ -982,6 +1067,13 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            db_pool_size (Optional[int]): The number of connections kept open in the pool of the
+                database engine. The engine and its pool are shared by all the SQL data nodes that
+                connect to the same database.<br/>
+                The default value is the default pool size of SQLAlchemy.
+            db_pool_pre_ping (Optional[bool]): If True, the connections of the pool are tested before
+                being used, so that a connection closed by the database is transparently replaced.<br/>
+                The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -1013,6 +1105,10 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY] = db_extra_args
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY] = exposed_type
+        if db_pool_size is not None:
+            properties[cls._OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY] = db_pool_size
+        if db_pool_pre_ping is not None:
+            properties[cls._OPTIONAL_DB_POOL_PRE_PING_SQL_PROPERTY] = db_pool_pre_ping
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_SQL_TABLE, scope, validity_period, **properties)
 
@@ -1036,6 +1132,8 @@ class DataNodeConfig(Section):
         exposed_type: Optional[str] = None,
         scope: Optional[Scope] = None,
         validity_period: Optional[timedelta] = None,
+        db_pool_size: Optional[int] = None,
+        db_pool_pre_ping: Optional[bool] = None,
         **properties,
     ) -> "DataNodeConfig":
         """Configure a new SQL data node configuration.
@@ -1075,6 +1173,13 @@ class DataNodeConfig(Section):
                 [page](../../../../../../userman/scenario_features/task-orchestration/scenario-config.md#from-task-configurations)
                 for more details).
                 If *validity_period* is set to None, the data node is always up-to-date.
+            db_pool_size (Optional[int]): The number of connections kept open in the pool of the
+                database engine. The engine and its pool are shared by all the SQL data nodes that
+                connect to the same database.<br/>
+                The default value is the default pool size of SQLAlchemy.
+            db_pool_pre_ping (Optional[bool]): If True, the connections of the pool are tested before
+                being used, so that a connection closed by the database is transparently replaced.<br/>
+                The default value is False.
             **properties (dict[str, any]): A keyworded variable length list of additional arguments.
 
         Returns:
@@ -1109,6 +1214,10 @@ class DataNodeConfig(Section):
             properties[cls._OPTIONAL_DB_EXTRA_ARGS_SQL_PROPERTY] = db_extra_args
         if exposed_type is not None:
             properties[cls._OPTIONAL_EXPOSED_TYPE_SQL_PROPERTY] = exposed_type
+        if db_pool_size is not None:
+            properties[cls._OPTIONAL_DB_POOL_SIZE_SQL_PROPERTY] = db_pool_size
+        if db_pool_pre_ping is not None:
+            properties[cls._OPTIONAL_DB_POOL_PRE_PING_SQL_PROPERTY] = db_pool_pre_ping
 
         return cls.__configure(id, DataNodeConfig._STORAGE_TYPE_VALUE_SQL, scope, validity_period, **properties)
 
@@ -28,6 +28,7 @@ class JobConfig(UniqueSection):
     _DEVELOPMENT_MODE = "development"
     _DEFAULT_MODE = _DEVELOPMENT_MODE
     _DEFAULT_MAX_NB_OF_WORKERS = 2
+    _KEEP_OUTPUTS_IN_MEMORY_KEY = "keep_outputs_in_memory"
     _MODES = [_DEVELOPMENT_MODE, _STANDALONE_MODE]
 
     mode: Optional[str]
@@ -61,6 +62,16 @@ class JobConfig(UniqueSection):
         """True if the config is set to development mode"""
         return self.mode == self._DEVELOPMENT_MODE
 
+    @property
+    def keep_outputs_in_memory(self) -> bool:
+        """True if the process executing a job keeps the data written to its pickle outputs in memory.
+
+        The next jobs executed by the same process and reading these data nodes receive the data as it was
+        returned by the task function, without reading the files again, as long as the data nodes have not
+        been edited since. The data is shared by these jobs, so the task functions must not modify it.
+        """
+        return bool(_tpl._replace_templates(self._properties.get(self._KEEP_OUTPUTS_IN_MEMORY_KEY, False), bool))
+
     @classmethod
     def default_config(cls) -> "JobConfig":
         """Return a default configuration for the job execution.
@@ -17,10 +17,11 @@ from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ..cycle._cycle_manager import _CycleManager
 from ._cycle_fs_repository import _CycleFSRepository
+from ._cycle_sqlite_repository import _CycleSQLiteRepository
 
 
 class _CycleManagerFactory(_ManagerFactory):
-    __REPOSITORY_MAP = {"default": _CycleFSRepository}
+    __REPOSITORY_MAP = {"default": _CycleFSRepository, "sqlite": _CycleSQLiteRepository}
 
     @classmethod
     @lru_cache
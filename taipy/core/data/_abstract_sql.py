@@ -14,17 +14,20 @@ import re
 import urllib.parse
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 
+from taipy.common.config.common._template_handler import _TemplateHandler as _tpl
 from taipy.common.config.common.scope import Scope
 
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..common._check_dependencies import _check_dependency_is_installed
+from ..common._sql_connector import _SQLEngineRegistry
 from ..data.operator import JoinOperator, Operator
-from ..exceptions.exceptions import MissingRequiredProperty, UnknownDatabaseEngine
+from ..exceptions.exceptions import MissingRequiredProperty, NoData, UnknownDatabaseEngine
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
@@ -42,6 +45,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
     __DB_ENGINE_KEY = "db_engine"
     __DB_DRIVER_KEY = "db_driver"
     __DB_EXTRA_ARGS_KEY = "db_extra_args"
+    __DB_POOL_SIZE_KEY = "db_pool_size"
+    __DB_POOL_PRE_PING_KEY = "db_pool_pre_ping"
     __SQLITE_FOLDER_PATH = "sqlite_folder_path"
     __SQLITE_FILE_EXTENSION = "sqlite_file_extension"
 
@@ -53,6 +58,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
         __DB_PORT_KEY,
         __DB_DRIVER_KEY,
         __DB_EXTRA_ARGS_KEY,
+        __DB_POOL_SIZE_KEY,
+        __DB_POOL_PRE_PING_KEY,
         __SQLITE_FOLDER_PATH,
         __SQLITE_FILE_EXTENSION,
     ]
@@ -129,6 +136,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
                 self.__DB_ENGINE_KEY,
                 self.__DB_DRIVER_KEY,
                 self.__DB_EXTRA_ARGS_KEY,
+                self.__DB_POOL_SIZE_KEY,
+                self.__DB_POOL_PRE_PING_KEY,
                 self.__SQLITE_FOLDER_PATH,
                 self.__SQLITE_FILE_EXTENSION,
                 self._EXPOSED_TYPE_PROPERTY,
@@ -163,7 +172,15 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
 
     def _get_engine(self):
         if self._engine is None:
-            self._engine = create_engine(self._conn_string())
+            properties = self.properties
+            # The pool properties may be strings when they come from a TOML file or an environment variable.
+            pool_size = properties.get(self.__DB_POOL_SIZE_KEY)
+            pre_ping = properties.get(self.__DB_POOL_PRE_PING_KEY, False)
+            self._engine = _SQLEngineRegistry._get(
+                self._conn_string(),
+                _tpl._to_int(pool_size) if isinstance(pool_size, str) else pool_size,
+                _tpl._to_bool(pre_ping) if isinstance(pre_ping, str) else bool(pre_ping),
+            )
         return self._engine
 
     def _conn_string(self) -> str:
@@ -240,6 +257,63 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
                 return pd.DataFrame(result, columns=keys)[columns]
             return pd.DataFrame(result, columns=keys)
 
+    def read_chunks(
+        self,
+        chunksize: int,
+        operators: Optional[Union[List, Tuple]] = None,
+        join_operator=JoinOperator.AND,
+        as_arrow: bool = False,
+    ) -> Iterator[Any]:
+        """Read the data referenced by this data node by chunks of rows.
+
+        The rows are streamed from the database, so that only one chunk is held in memory at a time.
+        This allows processing tables that do not fit in memory.
+
+        Arguments:
+            chunksize (int): The maximum number of rows of each chunk.
+            operators (Optional[Union[List[Tuple], Tuple]]): A 3-element tuple or a list of 3-element
+                tuples, each is in the form of (key, value, `Operator^`), used to filter the rows.
+            join_operator (JoinOperator^): The operator used to join the multiple filter 3-tuples.
+            as_arrow (bool): If True, each chunk is a `pyarrow.RecordBatch` built from the fetched rows,
+                without an intermediate pandas DataFrame. Otherwise, each chunk has the exposed type of
+                the data node.
+
+        Returns:
+            An iterator over the chunks of data.
+
+        Raises:
+            NoData^: If the data has not been written yet.
+        """
+        if chunksize <= 0:
+            raise ValueError("The chunk size must be a positive number.")
+        if not self.last_edit_date:
+            raise NoData(f"Data node {self.id} from config {self.config_id} has not been written yet.")
+        if as_arrow:
+            _check_dependency_is_installed("Arrow reads of SQL Data Node", "pyarrow")
+        return self.__read_chunks(chunksize, self._get_read_query(operators, join_operator), as_arrow)
+
+    def __read_chunks(self, chunksize: int, query: str, as_arrow: bool) -> Iterator[Any]:
+        with self._get_engine().connect() as connection:
+            result = connection.execution_options(stream_results=True, yield_per=chunksize).execute(text(query))
+            keys = list(result.keys())
+            for rows in result.partitions(chunksize):
+                yield self.__to_record_batch(rows, keys) if as_arrow else self.__to_exposed_type(rows, keys)
+
+    def __to_exposed_type(self, rows: Sequence, keys: List[str]) -> Any:
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type == self._EXPOSED_TYPE_PANDAS:
+            return pd.DataFrame(rows, columns=keys)
+        if exposed_type == self._EXPOSED_TYPE_NUMPY:
+            return pd.DataFrame(rows, columns=keys).to_numpy()
+        return [exposed_type(**row._mapping) for row in rows]
+
+    @staticmethod
+    def __to_record_batch(rows: Sequence, keys: List[str]):
+        import pyarrow as pa
+
+        # The database drivers return rows: they are transposed into columns before being converted.
+        return pa.RecordBatch.from_arrays([pa.array(column) for column in zip(*rows)], names=keys)
+
     @abstractmethod
     def _get_read_query(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
         query = self._get_base_read_query()
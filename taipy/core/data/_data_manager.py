@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import os
-from typing import Dict, Iterable, List, Optional, Set, Union
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from taipy.common.config import Config
 from taipy.common.config._config import _Config
@@ -43,7 +43,14 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
         data_node_configs: List[DataNodeConfig],
         cycle_id: Optional[CycleId] = None,
         scenario_id: Optional[ScenarioId] = None,
+        shared_entities: Optional[Dict[Tuple[Any, Optional[str]], Any]] = None,
     ) -> Dict[DataNodeConfig, DataNode]:
+        """Get or create the data nodes of a scenario.
+
+        When `shared_entities` is provided, the scenario is a new one: its data nodes of scenario scope
+        are created without querying the repository, and the cycle or global data nodes are first looked
+        up in `shared_entities`, indexed by config and owner id, then added to it.
+        """
         data_node_configs = [Config.data_nodes[dnc.id] for dnc in data_node_configs]
         dn_configs_and_owner_id = []
         for dn_config in data_node_configs:
@@ -57,9 +64,20 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
                 owner_id = None
             dn_configs_and_owner_id.append((dn_config, owner_id))
 
-        data_nodes = cls._repository._get_by_configs_and_owner_ids(
-            dn_configs_and_owner_id, cls._build_filters_with_version(None)
-        )
+        if shared_entities is None:
+            data_nodes = cls._repository._get_by_configs_and_owner_ids(
+                dn_configs_and_owner_id, cls._build_filters_with_version(None)
+            )
+        else:
+            shared_keys = [key for key in dn_configs_and_owner_id if key[1] != scenario_id]
+            if missing_keys := [key for key in shared_keys if key not in shared_entities]:
+                shared_entities.update(
+                    cls._repository._get_by_configs_and_owner_ids(missing_keys, cls._build_filters_with_version(None))
+                )
+            for dn_config, owner_id in shared_keys:
+                if (dn_config, owner_id) not in shared_entities:
+                    shared_entities[dn_config, owner_id] = cls._create_and_set(dn_config, owner_id, None)
+            data_nodes = {key: shared_entities[key] for key in shared_keys}
 
         return {
             dn_config: data_nodes.get((dn_config, owner_id)) or cls._create_and_set(dn_config, owner_id, None)
@@ -125,8 +143,11 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
     def _clean_generated_file(cls, data_node: DataNode) -> None:
         if not isinstance(data_node, _FileDataNodeMixin):
             return
-        if data_node.is_generated and os.path.exists(data_node.path):
-            os.remove(data_node.path)
+        if not data_node.is_generated:
+            return
+        for path in data_node._get_file_paths():
+            if os.path.exists(path):
+                os.remove(path)
 
     @classmethod
     def _clean_generated_files(cls, data_nodes: Iterable[DataNode]) -> None:
@@ -17,10 +17,11 @@ from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ._data_fs_repository import _DataFSRepository
 from ._data_manager import _DataManager
+from ._data_sqlite_repository import _DataSQLiteRepository
 
 
 class _DataManagerFactory(_ManagerFactory):
-    __REPOSITORY_MAP = {"default": _DataFSRepository}
+    __REPOSITORY_MAP = {"default": _DataFSRepository, "sqlite": _DataSQLiteRepository}
 
     @classmethod
     @lru_cache
@@ -9,12 +9,15 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import contextlib
 import os
 import pathlib
 import shutil
+import stat
+import uuid
 from datetime import datetime
 from os.path import isfile
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from taipy.common.config import Config
 from taipy.common.logger._taipy_logger import _TaipyLogger
@@ -36,7 +39,14 @@ from .data_node_id import Edit
 class _FileDataNodeMixin:
     """Mixin class designed to handle file-based data nodes."""
 
-    __EXTENSION_MAP = {"csv": "csv", "excel": "xlsx", "parquet": "parquet", "pickle": "p", "json": "json"}
+    __EXTENSION_MAP = {
+        "csv": "csv",
+        "excel": "xlsx",
+        "parquet": "parquet",
+        "pickle": "p",
+        "json": "json",
+        "numpy": "npy",
+    }
 
     _DEFAULT_DATA_KEY = "default_data"
     _PATH_KEY = "path"
@@ -77,6 +87,25 @@ class _FileDataNodeMixin:
         self.properties[self._PATH_KEY] = _path  # type: ignore[attr-defined]
         self.properties[self._IS_GENERATED_KEY] = False  # type: ignore[attr-defined]
 
+    def _get_file_paths(self) -> List[str]:
+        """Return the paths of the files holding the data of the data node."""
+        return [self.path]
+
+    @staticmethod
+    def _create_replacing_file(path: str, suffix: str) -> str:
+        """Create an empty temporary file meant to replace the file at *path* with `os.replace()`.
+
+        The temporary file is created in the same folder, with the permissions of the file to replace,
+        or the default permissions of a new file if there is no file to replace yet.
+        """
+        directory = pathlib.Path(path).parent
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = str(directory / f"{uuid.uuid4().hex}{suffix}")
+        os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        return tmp_path
+
     def is_downloadable(self) -> ReasonCollection:
         """Check if the data node is downloadable.
 
@@ -187,15 +216,15 @@ class _FileDataNodeMixin:
         if default_value is not None and not os.path.exists(self._path):
             self._write(default_value)  # type: ignore[attr-defined]
             self._last_edit_date = DataNode._get_last_modified_datetime(self._path) or datetime.now()
-            self._edits.append(  # type: ignore[attr-defined]
-                Edit(
-                    {
-                        "timestamp": self._last_edit_date,
-                        "editor": "TAIPY",
-                        "comment": "Default data written.",
-                    }
-                )
+            edit = Edit(
+                {
+                    "timestamp": self._last_edit_date,
+                    "editor": "TAIPY",
+                    "comment": "Default data written.",
+                }
             )
+            self._add_fingerprint(edit)  # type: ignore[attr-defined]
+            self._edits.append(edit)  # type: ignore[attr-defined]
 
         if not self._last_edit_date and isfile(self._path):
             self._last_edit_date = datetime.now()
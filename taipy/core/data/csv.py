@@ -10,8 +10,11 @@
 # specific language governing permissions and limitations under the License.
 
 import csv
+import os
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
 
 import numpy as np
 import pandas as pd
@@ -20,6 +23,8 @@ from taipy.common.config.common.scope import Scope
 
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..exceptions.exceptions import NoData
+from ..job.job_id import JobId
 from ._file_datanode_mixin import _FileDataNodeMixin
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
@@ -38,10 +43,18 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         to write the data to the CSV file.
     - *has_header* (`bool`): If True, indicates that the CSV file has a header.
     - *exposed_type*: The exposed type of the data read from CSV file. The default value is `pandas`.
+    - *engine* (`str`): The parser used by *pandas.read_csv()*. Possible values are *"c"*, *"python"*,
+        or *"pyarrow"* (multi-threaded). The default value is the default parser of pandas.
+    - *dtype* (`Union[str, Dict[str, str]]`): The data type of the columns, or a dictionary mapping
+        column names to data types, passed to *pandas.read_csv()*. Declaring the data types avoids
+        inferring them from the whole file.
     """
 
     __STORAGE_TYPE = "csv"
     __ENCODING_KEY = "encoding"
+    __ENGINE_KEY = "engine"
+    __DTYPE_KEY = "dtype"
+    __PYARROW_ENGINE = "pyarrow"
 
     _REQUIRED_PROPERTIES: List[str] = []
 
@@ -108,6 +121,8 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
                 self._HAS_HEADER_PROPERTY,
                 self._EXPOSED_TYPE_PROPERTY,
                 self.__ENCODING_KEY,
+                self.__ENGINE_KEY,
+                self.__DTYPE_KEY,
             }
         )
 
@@ -126,6 +141,55 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         self._write(data, columns)
         self.track_edit(editor_id=editor_id, timestamp=datetime.now())
 
+    def write_chunks(
+        self,
+        chunks: Iterable[Any],
+        job_id: Optional[JobId] = None,
+        editor_id: Optional[str] = None,
+        comment: Optional[str] = None,
+        **kwargs: Any,
+    ):
+        """Write the data by chunks of rows.
+
+        Only one chunk is held in memory at a time. The file is replaced once all the chunks are
+        written, so the chunks can be read from this data node with `read_chunks()`.
+
+        Arguments:
+            chunks (Iterable[Any]): The chunks of data to write, each one being accepted by `write()`.
+            job_id (JobId): An optional identifier of the job writing the data.
+            editor_id (str): An optional identifier of the editor writing the data.
+            comment (str): An optional comment to attach to the edit document.
+            **kwargs (Any): Extra information to attach to the edit document
+                corresponding to this write.
+        """
+        self._write_and_track_edit(partial(self._write_chunks, chunks), job_id, editor_id, comment, **kwargs)
+
+    def read_chunks(self, chunksize: int) -> Iterator[Any]:
+        """Read the data referenced by this data node by chunks of rows.
+
+        Only one chunk is held in memory at a time, so that files larger than the memory can be
+        processed. The *"pyarrow"* engine does not read by chunks, the *"c"* parser is used instead.
+
+        Arguments:
+            chunksize (int): The maximum number of rows of each chunk.
+
+        Returns:
+            An iterator over the chunks of data, each having the exposed type of the data node.
+
+        Raises:
+            NoData^: If the data has not been written yet.
+        """
+        if chunksize <= 0:
+            raise ValueError("The chunk size must be a positive number.")
+        if not self.last_edit_date:
+            raise NoData(f"Data node {self.id} from config {self.config_id} has not been written yet.")
+        exposed_type = self.properties[self._EXPOSED_TYPE_PROPERTY]
+        if exposed_type in [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_PANDAS_DATAFRAME]:
+            return self.__read_pandas_chunks(self._path, chunksize)
+        if exposed_type in [self._EXPOSED_TYPE_NUMPY, self._EXPOSED_TYPE_NUMPY_NDARRAY]:
+            return (chunk.to_numpy() for chunk in self.__read_pandas_chunks(self._path, chunksize))
+        return self.__read_chunks_as(self._path, chunksize)
+
     def _read(self):
         return self._read_from_path()
 
@@ -161,24 +225,66 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     ) -> pd.DataFrame:
         try:
             properties = self.properties
+            read_kwargs = self.__read_csv_kwargs()
             if properties[self._HAS_HEADER_PROPERTY]:
                 if column_names:
-                    return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY])[column_names]
-                return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY])
+                    return pd.read_csv(path, **read_kwargs)[column_names]
+                return pd.read_csv(path, **read_kwargs)
             else:
                 if usecols:
-                    return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY], header=None, usecols=usecols)
-                return pd.read_csv(path, encoding=properties[self.__ENCODING_KEY], header=None)
+                    return pd.read_csv(path, usecols=usecols, **read_kwargs)
+                return pd.read_csv(path, **read_kwargs)
         except pd.errors.EmptyDataError:
             return pd.DataFrame()
 
-    def _append(self, data: Any):
+    def __read_pandas_chunks(self, path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        read_kwargs = self.__read_csv_kwargs()
+        if read_kwargs.get(self.__ENGINE_KEY) == self.__PYARROW_ENGINE:
+            read_kwargs.pop(self.__ENGINE_KEY)
+        try:
+            with pd.read_csv(path, chunksize=chunksize, **read_kwargs) as reader:
+                yield from reader
+        except pd.errors.EmptyDataError:
+            return
+
+    def __read_chunks_as(self, path: str, chunksize: int) -> Iterator[List]:
         properties = self.properties
-        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
-        data = self._convert_data_to_dataframe(exposed_type, data)
-        data.to_csv(self._path, mode="a", index=False, encoding=properties[self.__ENCODING_KEY], header=False)
+        with open(path, encoding=properties[self.__ENCODING_KEY]) as csvFile:
+            reader = csv.DictReader(csvFile) if properties[self._HAS_HEADER_PROPERTY] else csv.reader(csvFile)
+            while lines := list(islice(reader, chunksize)):
+                yield [self._decoder(line) for line in lines]
+
+    def __read_csv_kwargs(self) -> Dict[str, Any]:
+        properties = self.properties
+        read_kwargs: Dict[str, Any] = {"encoding": properties[self.__ENCODING_KEY]}
+        if not properties[self._HAS_HEADER_PROPERTY]:
+            read_kwargs["header"] = None
+        for key in (self.__ENGINE_KEY, self.__DTYPE_KEY):
+            if properties.get(key) is not None:
+                read_kwargs[key] = properties[key]
+        return read_kwargs
+
+    def _append(self, data: Any):
+        self.__write_csv(self._path, data, mode="a")
 
     def _write(self, data: Any, columns: Optional[List[str]] = None):
+        self.__write_csv(self._path, data, columns)
+
+    def _write_chunks(self, chunks: Iterable[Any]):
+        # The chunks are written to a temporary file that replaces the data file once complete, so that
+        # they can be read from the data file itself.
+        tmp_path = self._create_replacing_file(self._path, ".csv.tmp")
+        try:
+            chunks = iter(chunks)
+            self.__write_csv(tmp_path, next(chunks, []))
+            for chunk in chunks:
+                self.__write_csv(tmp_path, chunk, mode="a")
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def __write_csv(self, path: str, data: Any, columns: Optional[List[str]] = None, mode: str = "w"):
         properties = self.properties
         exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
         data = self._convert_data_to_dataframe(exposed_type, data)
@@ -187,8 +293,9 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             data.columns = pd.Index(columns, dtype="object")
 
         data.to_csv(
-            self._path,
+            path,
+            mode=mode,
             index=False,
             encoding=properties[self.__ENCODING_KEY],
-            header=properties[self._HAS_HEADER_PROPERTY],
+            header=properties[self._HAS_HEADER_PROPERTY] and mode == "w",
         )
@@ -10,14 +10,17 @@
 # specific language governing permissions and limitations under the License.
 
 import functools
+import hashlib
 import os
+import pickle
 import typing
 import uuid
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union, cast
 
-import networkx as nx
+import numpy as np
+import pandas as pd
 
 from taipy.common.config import Config
 from taipy.common.config.common._validate_id import _validate_id
@@ -35,7 +38,15 @@ from ..job.job_id import JobId
 from ..notification.event import Event, EventEntityType, EventOperation, _make_event
 from ..reason import DataNodeEditInProgress, DataNodeIsNotWritten
 from ._filter import _FilterDataNode
-from .data_node_id import EDIT_COMMENT_KEY, EDIT_EDITOR_ID_KEY, EDIT_JOB_ID_KEY, EDIT_TIMESTAMP_KEY, DataNodeId, Edit
+from .data_node_id import (
+    EDIT_COMMENT_KEY,
+    EDIT_EDITOR_ID_KEY,
+    EDIT_FINGERPRINT_KEY,
+    EDIT_JOB_ID_KEY,
+    EDIT_TIMESTAMP_KEY,
+    DataNodeId,
+    Edit,
+)
 from .operator import JoinOperator
 
 
@@ -109,9 +120,11 @@ class DataNode(_Entity, _Labeled):
     _logger = _TaipyLogger._get_logger()
     _REQUIRED_PROPERTIES: List[str] = []
     _PATH_KEY = "path"
+    _FINGERPRINT_KEY = "fingerprint"
     __EDIT_TIMEOUT = 30
+    __FINGERPRINT_BLOCK_SIZE = 1 << 20
 
-    _TAIPY_PROPERTIES: Set[str] = set()
+    _TAIPY_PROPERTIES: Set[str] = {_FINGERPRINT_KEY}
 
     id: DataNodeId
     """The unique identifier of the data node."""
@@ -373,16 +386,22 @@ class DataNode(_Entity, _Labeled):
         if self.is_valid:
             from ..scenario.scenario import Scenario
             from ..taipy import get_parents
+            from ._data_manager_factory import _DataManagerFactory
 
+            data_manager = _DataManagerFactory._build_manager()
+            last_edit_date = cast(datetime, self.last_edit_date)
+            checked_ids: Set[DataNodeId] = set()
             parent_scenarios: Set[Scenario] = get_parents(self)["scenario"]  # type: ignore
             for parent_scenario in parent_scenarios:
-                for ancestor_node in nx.ancestors(parent_scenario._build_dag(), self):
-                    if (
-                        isinstance(ancestor_node, DataNode)
-                        and ancestor_node.last_edit_date
-                        and ancestor_node.last_edit_date > cast(datetime, self.last_edit_date)
-                    ):
-                        return False
+                # The lineage saved with the scenario gives the ancestors without loading the scenario graph.
+                for ancestor_id in parent_scenario._get_ancestor_ids(self.id):
+                    if ancestor_id in checked_ids:
+                        continue
+                    checked_ids.add(ancestor_id)
+                    ancestor_node = data_manager._get(ancestor_id)
+                    with _Reloader():
+                        if ancestor_node.last_edit_date and ancestor_node.last_edit_date > last_edit_date:
+                            return False
             return True
         return False
 
@@ -432,16 +451,7 @@ class DataNode(_Entity, _Labeled):
             **kwargs (Any): Extra information to attach to the edit document
                 corresponding to this write.
         """
-        from ._data_manager_factory import _DataManagerFactory
-        if (editor_id
-            and self.edit_in_progress
-            and self.editor_id != editor_id
-            and (not self.editor_expiration_date or self.editor_expiration_date > datetime.now())):
-            raise DataNodeIsBeingEdited(self.id, self.editor_id)
-        self._append(data)
-        self.track_edit(editor_id=editor_id, comment=comment, **kwargs)
-        self.unlock_edit()
-        _DataManagerFactory._build_manager()._set(self)
+        self._write_and_track_edit(functools.partial(self._append, data), None, editor_id, comment, **kwargs)
 
     def write(self,
               data,
@@ -461,12 +471,37 @@ class DataNode(_Entity, _Labeled):
             **kwargs (Any): Extra information to attach to the edit document
                 corresponding to this write.
         """
+        self._write_and_track_edit(
+            functools.partial(self._write, data),
+            job_id,
+            editor_id,
+            comment,
+            self._compute_data_fingerprint(data),
+            **kwargs,
+        )
+
+    def _write_and_track_edit(self,
+                              write: Callable[[], Any],
+                              job_id: Optional[JobId] = None,
+                              editor_id: Optional[str] = None,
+                              comment: Optional[str] = None,
+                              fingerprint: Optional[str] = None,
+                              **kwargs: Any):
+        """Write some data with the *write* function, then track the edit, unlock and save the data node.
+
+        The *fingerprint* of the written data, if known, is recorded in the edit.
+
+        Raises:
+            DataNodeIsBeingEdited^: If the data node is locked by another editor.
+        """
         if (editor_id
             and self.edit_in_progress
             and self.editor_id != editor_id
             and (not self.editor_expiration_date or self.editor_expiration_date > datetime.now())):
             raise DataNodeIsBeingEdited(self.id, self.editor_id)
-        self._write(data)
+        write()
+        if fingerprint:
+            kwargs[EDIT_FINGERPRINT_KEY] = fingerprint
         self.track_edit(job_id=job_id, editor_id=editor_id, comment=comment, **kwargs)
         self.unlock_edit()
         from ._data_manager_factory import _DataManagerFactory
@@ -481,6 +516,11 @@ class DataNode(_Entity, _Labeled):
                    **options: Any):
         """Creates and adds a new entry in the edits attribute without writing the data.
 
+        If the *fingerprint* property of the data node is True, a hash of the data node files is
+        attached to the edit, unless a *fingerprint* option is given. Data nodes that are not stored in
+        files are not read again: their fingerprint is the hash of the data given to `write()`. It
+        lets skippable tasks be skipped when their inputs are rewritten with identical data.
+
         Arguments:
             job_id (Optional[str]): The optional identifier of the job writing the data.
             editor_id (Optional[str]): The optional identifier of the editor writing the data.
@@ -496,6 +536,8 @@ class DataNode(_Entity, _Labeled):
             edit[EDIT_EDITOR_ID_KEY] = editor_id
         if comment:
             edit[EDIT_COMMENT_KEY] = comment
+        if EDIT_FINGERPRINT_KEY not in options:
+            self._add_fingerprint(edit)
         if not timestamp:
             timestamp = self._get_last_modified_datetime(self._properties.get(self._PATH_KEY)) or datetime.now()
         edit[EDIT_TIMESTAMP_KEY] = timestamp
@@ -676,6 +718,106 @@ class DataNode(_Entity, _Labeled):
 
         return last_modified_datetime
 
+    def _add_fingerprint(self, edit: Dict[str, Any]):
+        if self._properties.get(self._FINGERPRINT_KEY) and (fingerprint := self._compute_fingerprint()):
+            edit[EDIT_FINGERPRINT_KEY] = fingerprint
+
+    def _get_fingerprint(self) -> Optional[str]:
+        """Get the fingerprint of the current content of the data node.
+
+        Returns:
+            None if the *fingerprint* property is not True or if no fingerprint is known.
+        """
+        if not self.properties.get(self._FINGERPRINT_KEY):
+            return None
+        if self._is_stored_in_files():
+            # The files may have been modified since the last edit.
+            return self._compute_fingerprint()
+        edits = self.edits
+        return edits[-1].get(EDIT_FINGERPRINT_KEY) if edits else None
+
+    def _get_written_fingerprint(self, data: Any) -> Optional[str]:
+        """Get the fingerprint of the data that has just been written to the data node.
+
+        Returns:
+            The hash of the data files, or of the data if the data node is not stored in files. None if the
+            *fingerprint* property is not True.
+        """
+        if self._properties.get(self._PATH_KEY):
+            return self._compute_fingerprint() if self._properties.get(self._FINGERPRINT_KEY) else None
+        return self._compute_data_fingerprint(data)
+
+    def _compute_fingerprint(self) -> Optional[str]:
+        """Hash the bytes of the data files, or return None if the data node is not stored in files."""
+        if not self._is_stored_in_files():
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            path = self._properties[self._PATH_KEY]
+            for file_path in self.__list_files(path):
+                digest.update(os.path.relpath(file_path, path).encode())
+                with open(file_path, "rb") as f:
+                    while block := f.read(self.__FINGERPRINT_BLOCK_SIZE):
+                        digest.update(block)
+        except Exception as e:
+            self._logger.warning(f"The fingerprint of data node {self.id} cannot be computed: {e}")
+            return None
+        return digest.hexdigest()
+
+    def _compute_data_fingerprint(self, data: Any) -> Optional[str]:
+        """Hash the data written to a data node that is not stored in files.
+
+        Returns:
+            None if the *fingerprint* property is not True, or if the data node is stored in files, whose
+            bytes are hashed once written.
+        """
+        if not self._properties.get(self._FINGERPRINT_KEY) or self._properties.get(self._PATH_KEY):
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            self.__update_digest(digest, data)
+        except Exception as e:
+            self._logger.warning(f"The fingerprint of data node {self.id} cannot be computed: {e}")
+            return None
+        return digest.hexdigest()
+
+    @classmethod
+    def __update_digest(cls, digest, data: Any):
+        # Equal data must give equal bytes, whatever the memory layout of frames or the order of dict keys.
+        digest.update(type(data).__qualname__.encode())
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            digest.update(repr(data.columns.tolist() if isinstance(data, pd.DataFrame) else data.name).encode())
+            digest.update(repr(data.dtypes.tolist() if isinstance(data, pd.DataFrame) else data.dtype).encode())
+            try:
+                digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+            except TypeError:
+                # Some values are not hashable, lists for instance.
+                digest.update(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        elif isinstance(data, np.ndarray) and not data.dtype.hasobject:
+            digest.update(f"{data.dtype.str}{data.shape}".encode())
+            digest.update(np.ascontiguousarray(data).tobytes())
+        elif isinstance(data, dict):
+            digest.update(str(len(data)).encode())
+            for key, value in sorted(data.items(), key=lambda item: repr(item[0])):
+                cls.__update_digest(digest, key)
+                cls.__update_digest(digest, value)
+        elif isinstance(data, (list, tuple)):
+            digest.update(str(len(data)).encode())
+            for value in data:
+                cls.__update_digest(digest, value)
+        else:
+            digest.update(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _is_stored_in_files(self) -> bool:
+        path = self._properties.get(self._PATH_KEY)
+        return bool(path) and os.path.exists(path)
+
+    @staticmethod
+    def __list_files(path: str) -> List[str]:
+        if os.path.isfile(path):
+            return [path]
+        return sorted(os.path.join(root, name) for root, _, names in os.walk(path) for name in names)
+
     @staticmethod
     def _class_map():
         def all_subclasses(cls):
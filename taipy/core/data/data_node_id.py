@@ -21,3 +21,5 @@ EDIT_TIMESTAMP_KEY = "timestamp"
 EDIT_JOB_ID_KEY = "job_id"
 EDIT_COMMENT_KEY = "comment"
 EDIT_EDITOR_ID_KEY = "editor_id"
+EDIT_FINGERPRINT_KEY = "fingerprint"
+EDIT_INPUT_FINGERPRINTS_KEY = "input_fingerprints"
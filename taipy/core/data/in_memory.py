@@ -16,7 +16,7 @@ from taipy.common.config.common.scope import Scope
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from .data_node import DataNode
-from .data_node_id import DataNodeId, Edit
+from .data_node_id import EDIT_FINGERPRINT_KEY, DataNodeId, Edit
 
 in_memory_storage: Dict[str, Any] = {}
 
@@ -76,15 +76,16 @@ class InMemoryDataNode(DataNode):
         if default_value is not None and self.id not in in_memory_storage:
             self._write(default_value)
             self._last_edit_date = datetime.now()
-            self._edits.append(
-                Edit(
-                    {
-                        "timestamp": self._last_edit_date,
-                        "editor": "TAIPY",
-                        "comment": "Default data written.",
-                    }
-                )
+            edit = Edit(
+                {
+                    "timestamp": self._last_edit_date,
+                    "editor": "TAIPY",
+                    "comment": "Default data written.",
+                }
             )
+            if fingerprint := self._compute_data_fingerprint(default_value):
+                edit[EDIT_FINGERPRINT_KEY] = fingerprint
+            self._edits.append(edit)
 
         self._TAIPY_PROPERTIES.update({self.__DEFAULT_DATA_VALUE})
 
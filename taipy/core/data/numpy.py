@@ -0,0 +1,185 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import contextlib
+import glob
+import os
+import re
+import sys
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Set
+
+import numpy as np
+
+from taipy.common.config.common.scope import Scope
+
+from .._entity._reload import _Reloader
+from .._version._version_manager_factory import _VersionManagerFactory
+from ..exceptions.exceptions import UnsupportedMmapMode
+from ._file_datanode_mixin import _FileDataNodeMixin
+from .data_node import DataNode
+from .data_node_id import DataNodeId, Edit
+
+
+class NumpyDataNode(DataNode, _FileDataNodeMixin):
+    """Data Node stored as a NumPy `.npy` file.
+
+    The data of the data node is a NumPy array. By default, the file is memory-mapped when the
+    data node is read: the returned array is backed by the file pages instead of being copied
+    in memory, so reading a large array is immediate and its pages are shared by all the
+    processes reading the same file.
+
+    The *properties* attribute can contain the following optional entries:
+
+    - *default_path* (`str`): The default path of the `.npy` file used at the instantiation of the
+        data node.
+    - *default_data*: The default data of the data node. It is used at the data node instantiation
+        to write the data to the `.npy` file.
+    - *mmap_mode* (`Optional[str]`): The mode used to memory-map the file when the data node is read.
+        The possible values are *"r"* (read-only, the default value), *"c"* (copy-on-write), or None
+        to load the whole array in memory. The modified arrays are saved with `write()` only, so the
+        modes mapping the file for writing are not supported.
+
+    On Windows, a file cannot be replaced while an array read from it is still memory-mapped. The
+    data is then written to a new version of the file, next to the previous one, and the *path*
+    property of the data node is updated.
+    """
+
+    __STORAGE_TYPE = "numpy"
+    __MMAP_MODE_PROPERTY = "mmap_mode"
+    __DEFAULT_MMAP_MODE = "r"
+    __VALID_MMAP_MODES = ["r", "c", None]
+    __VERSION_PATTERN = re.compile(r"\.\d{20}$")
+
+    _REQUIRED_PROPERTIES: List[str] = []
+
+    def __init__(
+        self,
+        config_id: str,
+        scope: Scope,
+        id: Optional[DataNodeId] = None,
+        owner_id: Optional[str] = None,
+        parent_ids: Optional[Set[str]] = None,
+        last_edit_date: Optional[datetime] = None,
+        edits: Optional[List[Edit]] = None,
+        version: str = None,
+        validity_period: Optional[timedelta] = None,
+        edit_in_progress: bool = False,
+        editor_id: Optional[str] = None,
+        editor_expiration_date: Optional[datetime] = None,
+        properties=None,
+    ) -> None:
+        self.id = id or self._new_id(config_id)
+
+        if properties is None:
+            properties = {}
+
+        if self.__MMAP_MODE_PROPERTY not in properties:
+            properties[self.__MMAP_MODE_PROPERTY] = self.__DEFAULT_MMAP_MODE
+        if properties[self.__MMAP_MODE_PROPERTY] not in self.__VALID_MMAP_MODES:
+            raise UnsupportedMmapMode(
+                f"Unsupported memory-map mode: {properties[self.__MMAP_MODE_PROPERTY]}. "
+                f"Supported modes are {', '.join(str(mode) for mode in self.__VALID_MMAP_MODES)}"
+            )
+
+        default_value = properties.pop(self._DEFAULT_DATA_KEY, None)
+        _FileDataNodeMixin.__init__(self, properties)
+
+        DataNode.__init__(
+            self,
+            config_id,
+            scope,
+            self.id,
+            owner_id,
+            parent_ids,
+            last_edit_date,
+            edits,
+            version or _VersionManagerFactory._build_manager()._get_latest_version(),
+            validity_period,
+            edit_in_progress,
+            editor_id,
+            editor_expiration_date,
+            **properties,
+        )
+
+        with _Reloader():
+            self._write_default_data(default_value)
+
+        self._TAIPY_PROPERTIES.update(
+            {
+                self._PATH_KEY,
+                self._DEFAULT_PATH_KEY,
+                self._DEFAULT_DATA_KEY,
+                self._IS_GENERATED_KEY,
+                self.__MMAP_MODE_PROPERTY,
+            }
+        )
+
+    @classmethod
+    def storage_type(cls) -> str:
+        """Return the storage type of the data node: "numpy"."""
+        return cls.__STORAGE_TYPE
+
+    def _read(self):
+        return self._read_from_path()
+
+    def _read_from_path(self, path: Optional[str] = None, **read_kwargs) -> Any:
+        if path is None:
+            path = self._path
+
+        mmap_mode = read_kwargs.get(self.__MMAP_MODE_PROPERTY, self.properties[self.__MMAP_MODE_PROPERTY])
+        return np.load(path, mmap_mode=mmap_mode, allow_pickle=False)
+
+    def _write(self, data):
+        # The array is written to a temporary file that replaces the data file once complete. The arrays
+        # memory-mapped by previous reads keep mapping the replaced file, so they are never seen half-written.
+        tmp_path = self._create_replacing_file(self._path, ".npy.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.asanyarray(data), allow_pickle=False)
+            self.__replace(tmp_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _get_file_paths(self) -> List[str]:
+        return [self.path, *self.__previous_versions()]
+
+    def __replace(self, tmp_path: str):
+        try:
+            os.replace(tmp_path, self._path)
+        except PermissionError:
+            if sys.platform != "win32":
+                raise
+            # On Windows, a memory-mapped file cannot be replaced. The data is moved to a new version of the file.
+            root, extension = os.path.splitext(self._path)
+            path = f"{self.__VERSION_PATTERN.sub('', root)}.{datetime.now():%Y%m%d%H%M%S%f}{extension}"
+            os.replace(tmp_path, path)
+            # The path is not set by the user: the versions of a generated file are still removed with the data node.
+            self._path = path
+            self.properties[self._PATH_KEY] = path
+            self.properties[self._IS_GENERATED_KEY] = self._is_generated
+        if self.__VERSION_PATTERN.search(os.path.splitext(self._path)[0]):
+            for path in self.__previous_versions():
+                # The previous versions that are still memory-mapped are removed by a next write.
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+    def __previous_versions(self) -> List[str]:
+        root, extension = os.path.splitext(self._path)
+        root = self.__VERSION_PATTERN.sub("", root)
+        versions = re.compile(rf"{re.escape(root)}(\.\d{{20}})?{re.escape(extension)}")
+        return [
+            path
+            for path in glob.glob(f"{glob.escape(root)}*{extension}")
+            if path != self._path and versions.fullmatch(path)
+        ]
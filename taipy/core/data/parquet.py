@@ -10,21 +10,32 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime, timedelta
+from functools import reduce
+from importlib import util
+from operator import and_, or_
 from os.path import isdir, isfile
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+if util.find_spec("pyarrow"):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
 from taipy.common.config.common.scope import Scope
 
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..exceptions.exceptions import UnknownCompressionAlgorithm, UnknownParquetEngine
 from ._file_datanode_mixin import _FileDataNodeMixin
+from ._filter import _FilterDataNode
 from ._tabular_datanode_mixin import _TabularDataNodeMixin
 from .data_node import DataNode
 from .data_node_id import DataNodeId, Edit
+from .operator import JoinOperator, Operator
 
 
 class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
@@ -52,6 +63,10 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         *pandas.DataFrame.write_parquet()* function when writing the data. <br/>
         The parameters in *"write_kwargs"* have a **higher precedence** than the
         top-level parameters which are also passed to Pandas.
+
+    With the *"pyarrow"* engine, the filters of the `filter()` method and the columns selected by
+    name are pushed down to the Parquet reader, so that only the matching row groups, partitions,
+    and columns are read.
     """
 
     __STORAGE_TYPE = "parquet"
@@ -61,6 +76,7 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     __VALID_COMPRESSION_ALGORITHMS = ["snappy", "gzip", "brotli", "none"]
     __READ_KWARGS_PROPERTY = "read_kwargs"
     __WRITE_KWARGS_PROPERTY = "write_kwargs"
+    __ROW_NUMBER = "__taipy_row_number"
     _REQUIRED_PROPERTIES: List[str] = []
 
     def __init__(
@@ -201,6 +217,63 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         """
         return self._read_from_path(**read_kwargs)
 
+    def __getitem__(self, item) -> Any:
+        if (isinstance(item, str) or self.__is_list_of_columns(item)) and self.__can_push_down():
+            try:
+                data = self._read_from_path(columns=[item] if isinstance(item, str) else item)
+                return _FilterDataNode._filter_by_key(data, item)
+            except pa.ArrowException:
+                # The Parquet reader rejects unknown columns, the data node returns None for them.
+                pass
+        return super().__getitem__(item)
+
+    def filter(
+        self,
+        operators: Union[List, Tuple],
+        join_operator=JoinOperator.AND,
+        columns: Optional[List[str]] = None,
+    ) -> Any:
+        """Read and filter the data referenced by this data node.
+
+        The data is filtered by the provided list of 3-tuples (key, value, `Operator^`).
+
+        With the *"pyarrow"* engine and an exposed type other than numpy, the filters are
+        translated into Arrow expressions evaluated by the Parquet reader. The row groups and
+        the partitions whose statistics do not match the filters are not read. The result is the
+        same as when the data is filtered in memory: the rows filtered by a single 3-tuple keep
+        their index labels, and the rows filtered by several 3-tuples are still merged in memory.
+        The rows read from a partitioned dataset only keep their index labels if the index is
+        stored in the dataset. Otherwise, they are indexed from 0.
+
+        Arguments:
+            operators (Union[List[Tuple], Tuple]): A 3-element tuple or a list of 3-element tuples,
+                each is in the form of (key, value, `Operator^`).
+            join_operator (JoinOperator^): The operator used to join the multiple filter
+                3-tuples.
+            columns (Optional[List[str]]): If provided, the names of the columns to return.
+                With a pandas exposed type, only these columns are read, unless the rows of
+                several 3-tuples are merged, which compares all their columns.
+
+        Returns:
+            The filtered data.
+        """
+        is_single_tuple = bool(operators) and not isinstance(operators[0], (list, tuple))
+        filters = [operators] if is_single_tuple else list(operators)
+        is_merged = len(filters) > 1
+        data, is_filtered = None, False
+        if self.__can_push_down() and filters:
+            try:
+                is_filtered, data = self.__read_filtered(filters, join_operator, columns, is_merged)
+            except pa.ArrowException:
+                # The filters cannot be evaluated by Arrow, e.g., a value of another type than the column.
+                pass
+        if not is_filtered:
+            data = _FilterDataNode._filter(self._read(), operators, join_operator)
+        elif is_merged and data is not None:
+            # The rows read match at least one 3-tuple: merging them gives the same rows as in memory.
+            data = _FilterDataNode._filter(data, operators, join_operator)
+        return _FilterDataNode._filter_by_key(data, columns) if columns and data is not None else data
+
     def _read(self):
         return self._read_from_path()
 
@@ -247,5 +320,86 @@ class ParquetDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
     def _append(self, data: Any):
         self._write_with_kwargs(data, engine="fastparquet", append=True)
 
+    def __read_filtered(
+        self, filters: List, join_operator, columns: Optional[List[str]], is_merged: bool
+    ) -> Tuple[bool, Any]:
+        # Returns whether the data could be filtered by the Parquet reader, and the filtered data.
+        expression = self.__to_expression(filters, join_operator)
+        keys = list(dict.fromkeys(key for key, _, _ in filters))
+        read_kwargs: Dict[str, Any] = {"filters": expression}
+        pandas_types = [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_PANDAS_DATAFRAME]
+        if columns and not is_merged and self.properties[self._EXPOSED_TYPE_PROPERTY] in pandas_types:
+            read_kwargs["columns"] = list(dict.fromkeys([*columns, *keys]))
+        data = self._read_from_path(**read_kwargs)
+        if not isinstance(data, pd.DataFrame) or is_merged or not isfile(self._path):
+            return True, data
+        index = self.__filtered_index(keys, expression)
+        if index is not None:
+            data.index = index
+        return True, data
+
+    def __filtered_index(self, keys: List[str], expression: "pc.Expression") -> Optional[pd.Index]:
+        # An index stored as columns is restored by the Parquet reader. Otherwise, the reader indexes
+        # the filtered rows from 0: their positions in the file are computed from the row groups that
+        # match the filters, of which only the filtered columns are read.
+        parquet_file = pq.ParquetFile(self._path)
+        metadata = parquet_file.metadata
+        index_columns = (parquet_file.schema_arrow.pandas_metadata or {}).get("index_columns", [])
+        if any(not isinstance(column, dict) for column in index_columns):
+            return None
+        if index_columns and index_columns[0].get("kind") == "range":
+            start, stop, step = (index_columns[0][key] for key in ("start", "stop", "step"))
+            labels = pd.RangeIndex(start, stop, step, name=index_columns[0].get("name"))
+        else:
+            labels = pd.RangeIndex(metadata.num_rows)
+        offsets = np.cumsum([0] + [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)])
+        fragment = next(iter(ds.dataset(self._path, format="parquet").get_fragments()))
+        positions = [np.array([], dtype=np.int64)]
+        for row_group_fragment in fragment.split_by_row_group(expression):
+            row_group = row_group_fragment.row_groups[0].id
+            table = row_group_fragment.to_table(columns=keys)
+            row_numbers = pa.array(np.arange(offsets[row_group], offsets[row_group + 1]))
+            table = table.append_column(self.__ROW_NUMBER, row_numbers)
+            positions.append(table.filter(expression)[self.__ROW_NUMBER].to_numpy())
+        return labels[np.concatenate(positions)]
+
+    def __can_push_down(self) -> bool:
+        properties = self.properties
+        numpy_types = [self._EXPOSED_TYPE_NUMPY, self._EXPOSED_TYPE_NUMPY_NDARRAY]
+        return (
+            properties[self.__ENGINE_PROPERTY] == "pyarrow"
+            and properties[self._EXPOSED_TYPE_PROPERTY] not in numpy_types
+            and "filters" not in properties[self.__READ_KWARGS_PROPERTY]
+            and util.find_spec("pyarrow") is not None
+        )
+
+    @staticmethod
+    def __is_list_of_columns(item) -> bool:
+        return isinstance(item, list) and len(item) > 0 and all(isinstance(column, str) for column in item)
+
+    @staticmethod
+    def __to_expression(operators: Union[List, Tuple], join_operator) -> "pc.Expression":
+        expressions = []
+        for key, value, operator in operators:
+            field = pc.field(key)
+            if operator == Operator.EQUAL:
+                expressions.append(field == value)
+            elif operator == Operator.NOT_EQUAL:
+                # As in pandas, missing values are different from any value.
+                expressions.append((field != value) | field.is_null())
+            elif operator == Operator.LESS_THAN:
+                expressions.append(field < value)
+            elif operator == Operator.LESS_OR_EQUAL:
+                expressions.append(field <= value)
+            elif operator == Operator.GREATER_THAN:
+                expressions.append(field > value)
+            elif operator == Operator.GREATER_OR_EQUAL:
+                expressions.append(field >= value)
+        if join_operator == JoinOperator.AND:
+            return reduce(and_, expressions)
+        if join_operator == JoinOperator.OR:
+            return reduce(or_, expressions)
+        raise NotImplementedError(f"Join operator {join_operator} not implemented.")
+
     def _write(self, data: Any):
         self._write_with_kwargs(data)
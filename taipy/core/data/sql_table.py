@@ -46,6 +46,10 @@ class SQLTableDataNode(_AbstractSQLDataNode):
     - *sqlite_file_extension* (str): The filename extension of the SQLite file. The default value is ".db".
     - *db_extra_args* (`Dict[str, Any]`): A dictionary of additional arguments to be passed into database
         connection string.
+    - *db_pool_size* (`int`): The number of connections kept open in the pool of the database engine.
+        The engine is shared by all the SQL data nodes connecting to the same database.
+    - *db_pool_pre_ping* (`bool`): If True, the pooled connections are tested before being used.
+        The default value is False.
     """
 
     __STORAGE_TYPE = "sql_table"
@@ -76,6 +76,10 @@ class UnknownCompressionAlgorithm(Exception):
     """Raised if the compression algorithm is not supported by ParquetDataNode."""
 
 
+class UnsupportedMmapMode(Exception):
+    """Raised if the memory-map mode is not supported by NumpyDataNode."""
+
+
 class NonExistingDataNode(Exception):
     """Raised if a requested DataNode is not known by the DataNode Manager."""
 
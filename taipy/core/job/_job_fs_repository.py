@@ -14,5 +14,7 @@ from ._job_model import _JobModel
 
 
 class _JobFSRepository(_FileSystemRepository):
+    _INDEXED_ATTRIBUTES = ("version", "task_id", "submit_id", "creation_date")
+
     def __init__(self) -> None:
         super().__init__(model_type=_JobModel, converter=_JobConverter, dir_name="jobs")
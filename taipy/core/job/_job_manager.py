@@ -79,13 +79,8 @@ class _JobManager(_Manager[Job], _VersionMixin):
 
     @classmethod
     def _get_latest(cls, task: Task) -> Optional[Job]:
-        jobs_of_task = list(filter(lambda job: task in job, cls._get_all()))
-        if len(jobs_of_task) == 0:
-            return None
-        if len(jobs_of_task) == 1:
-            return jobs_of_task[0]
-        else:
-            return max(jobs_of_task)
+        filters = cls._build_filters_with_version(None)
+        return cls._repository._get_latest("task_id", task.id, filters)
 
     @classmethod
     def _is_deletable(cls, job: Union[Job, JobId]) -> ReasonCollection:
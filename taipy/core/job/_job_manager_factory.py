@@ -17,10 +17,11 @@ from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ._job_fs_repository import _JobFSRepository
 from ._job_manager import _JobManager
+from ._job_sqlite_repository import _JobSQLiteRepository
 
 
 class _JobManagerFactory(_ManagerFactory):
-    __REPOSITORY_MAP = {"default": _JobFSRepository}
+    __REPOSITORY_MAP = {"default": _JobFSRepository, "sqlite": _JobSQLiteRepository}
 
     @classmethod
     @lru_cache
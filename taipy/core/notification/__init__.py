@@ -27,5 +27,6 @@ from ._registration import _Registration
 from ._topic import _Topic
 from .core_event_consumer import CoreEventConsumerBase
 from .event import Event, EventEntityType, EventOperation, _make_event
+from .event_queue import EventQueue, OverflowPolicy
 from .notifier import Notifier, _publish_event
 from .registration_id import RegistrationId
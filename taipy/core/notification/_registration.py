@@ -10,11 +10,12 @@
 # specific language governing permissions and limitations under the License.
 
 from queue import SimpleQueue
-from typing import Optional
+from typing import Optional, Union
 from uuid import uuid4
 
 from ._topic import _Topic
 from .event import EventEntityType, EventOperation
+from .event_queue import EventQueue, OverflowPolicy
 from .registration_id import RegistrationId
 
 
@@ -29,11 +30,15 @@ class _Registration:
         entity_id: Optional[str] = None,
         operation: Optional[EventOperation] = None,
         attribute_name: Optional[str] = None,
+        max_size: Optional[int] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
     ):
 
         self.registration_id: str = self._new_id()
         self.topic: _Topic = _Topic(entity_type, entity_id, operation, attribute_name)
-        self.queue: SimpleQueue = SimpleQueue()
+        self.queue: Union[SimpleQueue, EventQueue] = (
+            SimpleQueue() if max_size is None else EventQueue(max_size, overflow_policy)
+        )
 
     @staticmethod
     def _new_id() -> RegistrationId:
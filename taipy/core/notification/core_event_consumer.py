@@ -11,9 +11,12 @@
 
 import abc
 import threading
+import time
 from queue import Empty, SimpleQueue
+from typing import List, Optional, Union
 
 from .event import Event
+from .event_queue import EventQueue
 
 
 class CoreEventConsumerBase(threading.Thread):
@@ -51,20 +54,47 @@ class CoreEventConsumerBase(threading.Thread):
         Then, we would specify the type of event we want to receive by registering with the Notifier.
         After that, we create an object of the consumer class by providing
         the registration_id and registered_queue and start consuming the event.
+
+    ??? example "Batch processing"
+
+        ```python
+        class MyBatchConsumer(CoreEventConsumerBase):
+            def process_events(self, events: List[Event]):
+                # Custom logic processing several events at once, e.g., a single database insert
+                print(f"Received {len(events)} events")
+        ```
+
+        When a *batch_size* is provided to the consumer, the events are handed over to
+        the `process_events` method as a list. A batch holds up to *batch_size* events
+        and is processed at the latest *batch_timeout* seconds after its first event was
+        received.
     """
 
-    def __init__(self, registration_id: str, queue: SimpleQueue) -> None:
+    def __init__(
+        self,
+        registration_id: str,
+        queue: Union[SimpleQueue, EventQueue],
+        batch_size: Optional[int] = None,
+        batch_timeout: float = 0.1,
+    ) -> None:
         """Initialize a CoreEventConsumerBase instance.
 
         Arguments:
             registration_id (str): A unique identifier of the registration. You can get a
                 registration id invoking `Notifier.register()^` method.
-            queue (SimpleQueue): The queue from which events will be consumed. You can get a
-                queue invoking `Notifier.register()^` method.
+            queue (Union[SimpleQueue, EventQueue^]): The queue from which events will be consumed.
+                You can get a queue invoking `Notifier.register()^` method.
+            batch_size (Optional[int]): If provided, the maximum number of events processed
+                at once by the `process_events` method. Otherwise, each event is processed
+                by the `process_event` method as soon as it is received.
+            batch_timeout (float): The maximum number of seconds to wait for more events
+                before processing a batch that is not full. The default value is 0.1.
         """
         threading.Thread.__init__(self, name=f"Thread-Taipy-Core-Consumer-{registration_id}")
         self.daemon = True
         self.queue = queue
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
         self.__STOP_FLAG = False
         self._TIMEOUT = 0.1
 
@@ -81,7 +111,10 @@ class CoreEventConsumerBase(threading.Thread):
         while not self.__STOP_FLAG:
             try:
                 event: Event = self.queue.get(block=True, timeout=self._TIMEOUT)
-                self.process_event(event)
+                if self.batch_size is None:
+                    self.process_event(event)
+                else:
+                    self.process_events(self.__collect_batch(event))
             except Empty:
                 pass
 
@@ -89,3 +122,26 @@ class CoreEventConsumerBase(threading.Thread):
     def process_event(self, event: Event) -> None:
         """This method should be overridden in subclasses to define how events are processed."""
         raise NotImplementedError
+
+    def process_events(self, events: List[Event]) -> None:
+        """Process a batch of events, when the consumer was created with a *batch_size*.
+
+        The default implementation calls `process_event` for each event. This method can be
+        overridden in subclasses that are more efficient at processing several events at once.
+
+        Arguments:
+            events (List[Event^]): The events received, in the order they were published.
+        """
+        for event in events:
+            self.process_event(event)
+
+    def __collect_batch(self, first_event: Event) -> List[Event]:
+        events = [first_event]
+        deadline = time.monotonic() + self.batch_timeout
+        while len(events) < self.batch_size:  # type: ignore[operator]
+            remaining = deadline - time.monotonic()
+            try:
+                events.append(self.queue.get(block=remaining > 0, timeout=max(remaining, 0)))
+            except Empty:
+                break
+        return events
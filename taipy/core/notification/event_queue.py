@@ -0,0 +1,143 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+import time
+from collections import deque
+from queue import Empty
+from typing import Deque, Dict, List, Optional, Tuple
+
+from ..common._repr_enum import _ReprEnum
+from .event import Event, EventEntityType, EventOperation
+
+
+class OverflowPolicy(_ReprEnum):
+    """Enum representing what an `EventQueue^` does with a new event when it is full.
+
+    The possible policies are:
+
+    - `DROP_OLDEST`: The oldest event of the queue is dropped.
+    - `BLOCK`: The publisher waits until the consumer gets an event from the queue.
+    - `COALESCE`: An update event replaces the queued update event of the same entity attribute,
+        even if the queue is not full. Otherwise, the oldest event of the queue is dropped.
+    """
+
+    DROP_OLDEST = 1
+    BLOCK = 2
+    COALESCE = 3
+
+
+class EventQueue:
+    """A bounded queue of events, returned by `Notifier.register()^` when a maximum size is given.
+
+    The queue can be used as a `SimpleQueue` by the event consumers. It also exposes the number of
+    events waiting to be consumed and the number of events dropped or coalesced because the consumer
+    did not keep up with the publishers.
+
+    Attributes:
+        max_size (int): The maximum number of events in the queue.
+        overflow_policy (OverflowPolicy^): What the queue does with a new event when it is full.
+        nb_dropped_events (int): The number of events dropped from the queue.
+        nb_coalesced_events (int): The number of update events replaced by a later update.
+    """
+
+    def __init__(self, max_size: int, overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST):
+        if max_size <= 0:
+            raise ValueError("The maximum size of an event queue must be a positive number.")
+        self.max_size = max_size
+        self.overflow_policy = overflow_policy
+        self.nb_dropped_events = 0
+        self.nb_coalesced_events = 0
+        # Each queued event is held in a list, so that a coalesced update replaces it in place.
+        self._slots: Deque[List[Event]] = deque()
+        self._update_slots: Dict[Tuple[EventEntityType, Optional[str], Optional[str]], List[Event]] = {}
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, event: Event, block: bool = True, timeout: Optional[float] = None):
+        """Put an event in the queue, applying the overflow policy if the queue is full.
+
+        Arguments:
+            event (Event^): The event to put in the queue.
+            block (bool): Only used by the `BLOCK` policy. If False, the event is dropped if the queue is full.
+            timeout (Optional[float]): Only used by the `BLOCK` policy. If not None, the event is dropped
+                if the queue is still full after waiting for *timeout* seconds.
+        """
+        with self._lock:
+            if self.overflow_policy == OverflowPolicy.COALESCE and (slot := self.__update_slot(event)) is not None:
+                slot[0] = event
+                self.nb_coalesced_events += 1
+                return
+            if len(self._slots) >= self.max_size:
+                if self.overflow_policy == OverflowPolicy.BLOCK:
+                    if not block or not self._not_full.wait_for(lambda: len(self._slots) < self.max_size, timeout):
+                        self.nb_dropped_events += 1
+                        return
+                else:
+                    self.__forget(self._slots.popleft())
+                    self.nb_dropped_events += 1
+            slot = [event]
+            self._slots.append(slot)
+            if (key := self.__update_key(event)) is not None:
+                self._update_slots[key] = slot
+            self._not_empty.notify()
+
+    def put_nowait(self, event: Event):
+        self.put(event, block=False)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Event:
+        """Remove and return the oldest event of the queue.
+
+        Raises:
+            Empty: If no event is available, without blocking or after waiting for *timeout* seconds.
+        """
+        with self._lock:
+            if not block:
+                if not self._slots:
+                    raise Empty
+            elif timeout is None:
+                self._not_empty.wait_for(lambda: self._slots)
+            elif timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            else:
+                end_time = time.monotonic() + timeout
+                while not self._slots:
+                    if (remaining := end_time - time.monotonic()) <= 0:
+                        raise Empty
+                    self._not_empty.wait(remaining)
+            slot = self._slots.popleft()
+            self.__forget(slot)
+            self._not_full.notify()
+            return slot[0]
+
+    def get_nowait(self) -> Event:
+        return self.get(block=False)
+
+    def qsize(self) -> int:
+        """Return the number of events waiting to be consumed."""
+        return len(self._slots)
+
+    def empty(self) -> bool:
+        return not self._slots
+
+    def __update_slot(self, event: Event) -> Optional[List[Event]]:
+        key = self.__update_key(event)
+        return None if key is None else self._update_slots.get(key)
+
+    def __forget(self, slot: List[Event]):
+        if (key := self.__update_key(slot[0])) is not None and self._update_slots.get(key) is slot:
+            del self._update_slots[key]
+
+    def __update_key(self, event: Event) -> Optional[Tuple[EventEntityType, Optional[str], Optional[str]]]:
+        if self.overflow_policy != OverflowPolicy.COALESCE or event.operation != EventOperation.UPDATE:
+            return None
+        return event.entity_type, event.entity_id, event.attribute_name
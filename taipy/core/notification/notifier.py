@@ -10,11 +10,15 @@
 # specific language governing permissions and limitations under the License.
 
 from queue import SimpleQueue
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
+from .._repository._unit_of_work import _UnitOfWork
 from ._registration import _Registration
 from ._topic import _Topic
 from .event import Event, EventEntityType, EventOperation
+from .event_queue import EventQueue, OverflowPolicy
+
+_TopicKey = Tuple[Optional[EventEntityType], Optional[str], Optional[EventOperation]]
 
 
 def _publish_event(
@@ -54,6 +58,8 @@ class Notifier:
     """A class for managing event registrations and publishing a Taipy application events."""
 
     _topics_registrations_list: Dict[_Topic, Set[_Registration]] = {}
+    # The registered topics by entity type, entity id and operation, then by attribute name.
+    _topics_index: Dict[_TopicKey, Dict[Optional[str], _Topic]] = {}
 
     @classmethod
     def register(
@@ -62,7 +68,9 @@ class Notifier:
         entity_id: Optional[str] = None,
         operation: Optional[EventOperation] = None,
         attribute_name: Optional[str] = None,
-    ) -> Tuple[str, SimpleQueue]:
+        max_size: Optional[int] = None,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> Tuple[str, Union[SimpleQueue, EventQueue]]:
         """Register a listener for a specific event topic.
 
         The topic is defined by the combination of an optional entity type, an optional
@@ -118,16 +126,26 @@ class Notifier:
             attribute_name (Optional[str]): If provided, the listener will be notified
                 for all events related to this entity's attribute. Otherwise, the listener
                 will be notified for events related to all attributes.
+            max_size (Optional[int]): If provided, the maximum number of events waiting in
+                the queue of the listener. The queue is then an `EventQueue^` that exposes
+                its depth and the number of events it dropped or coalesced. Otherwise, the
+                queue is unbounded.
+            overflow_policy (OverflowPolicy^): What the queue does with a new event when it
+                holds *max_size* events. The default policy drops the oldest event.<br>
+                The `BLOCK` policy makes the publishers wait for the listener, so it must only
+                be used if the listener consumes its events without calling Taipy.
 
         Returns:
             A tuple containing the registration id and the event queue.
         """
-        registration = _Registration(entity_type, entity_id, operation, attribute_name)
+        registration = _Registration(entity_type, entity_id, operation, attribute_name, max_size, overflow_policy)
 
         if registrations := cls._topics_registrations_list.get(registration.topic, None):
             registrations.add(registration)
         else:
-            cls._topics_registrations_list[registration.topic] = {registration}
+            topic = registration.topic
+            cls._topics_registrations_list[topic] = {registration}
+            cls._topics_index.setdefault(cls.__key(topic), {})[topic.attribute_name] = topic
 
         return registration.registration_id, registration.queue
 
@@ -162,7 +180,13 @@ class Notifier:
             registrations = cls._topics_registrations_list[to_remove_registration.topic]
             registrations.remove(to_remove_registration)
             if len(registrations) == 0:
-                del cls._topics_registrations_list[to_remove_registration.topic]
+                topic = to_remove_registration.topic
+                del cls._topics_registrations_list[topic]
+                key = cls.__key(topic)
+                topics = cls._topics_index.get(key, {})
+                topics.pop(topic.attribute_name, None)
+                if not topics:
+                    cls._topics_index.pop(key, None)
 
     @classmethod
     def publish(cls, event: Event) -> None:
@@ -171,10 +195,38 @@ class Notifier:
         Arguments:
             event (`Event^`): The event to publish.
         """
-        for topic, registrations in cls._topics_registrations_list.items():
-            if Notifier._is_matching(event, topic):
-                for registration in registrations:
-                    registration.queue.put(event)
+        if _UnitOfWork._defer_event(event):
+            # Published when the entities written in the current batch are saved.
+            return
+        for topic in cls.__matching_topics(event):
+            for registration in cls._topics_registrations_list.get(topic, ()):
+                registration.queue.put(event)
+
+    @classmethod
+    def __matching_topics(cls, event: Event) -> List[_Topic]:
+        """Find the topics matching an event, looking up each combination of its attributes and wildcards."""
+        topics: List[_Topic] = []
+        for entity_type in cls.__or_wildcard(event.entity_type):
+            for entity_id in cls.__or_wildcard(event.entity_id):
+                for operation in cls.__or_wildcard(event.operation):
+                    if not (attribute_topics := cls._topics_index.get((entity_type, entity_id, operation))):
+                        continue
+                    if not event.attribute_name:
+                        topics.extend(attribute_topics.values())
+                        continue
+                    if (topic := attribute_topics.get(None)) is not None:
+                        topics.append(topic)
+                    if (topic := attribute_topics.get(event.attribute_name)) is not None:
+                        topics.append(topic)
+        return topics
+
+    @staticmethod
+    def __or_wildcard(value: Any) -> Tuple[Any, ...]:
+        return (None,) if value is None else (value, None)
+
+    @staticmethod
+    def __key(topic: _Topic) -> _TopicKey:
+        return topic.entity_type, topic.entity_id, topic.operation
 
     @staticmethod
     def _is_matching(event: Event, topic: _Topic) -> bool:
@@ -51,6 +51,7 @@ class _ScenarioConverter(_AbstractConverter):
             version=scenario._version,
             cycle=scenario._cycle.id if scenario._cycle else None,
             sequences=sequences if sequences else None,
+            lineage=scenario._lineage,
         )
 
     @classmethod
@@ -66,7 +67,7 @@ class _ScenarioConverter(_AbstractConverter):
                         for it in subscribers
                     ]
 
-        return Scenario(
+        scenario = Scenario(
             scenario_id=model.id,
             config_id=model.config_id,
             tasks=tasks,
@@ -83,6 +84,8 @@ class _ScenarioConverter(_AbstractConverter):
             version=model.version,
             sequences=model.sequences,
         )
+        scenario._lineage = model.lineage
+        return scenario
 
     @staticmethod
     def __to_cycle(cycle_id: Optional[CycleId] = None) -> Optional[Cycle]:
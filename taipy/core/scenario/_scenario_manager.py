@@ -11,18 +11,20 @@
 
 from datetime import datetime
 from functools import partial
-from typing import Any, Callable, Dict, List, Literal, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
 
 from taipy.common.config import Config
 
 from .._entity._entity_ids import _EntityIds
 from .._manager._manager import _Manager
 from .._repository._abstract_repository import _AbstractRepository
+from .._repository._unit_of_work import _UnitOfWork
 from .._version._version_mixin import _VersionMixin
 from ..common.warn_if_inputs_not_ready import _warn_if_inputs_not_ready
 from ..config.scenario_config import ScenarioConfig
 from ..cycle._cycle_manager_factory import _CycleManagerFactory
 from ..cycle.cycle import Cycle
+from ..cycle.cycle_id import CycleId
 from ..data._data_manager_factory import _DataManagerFactory
 from ..exceptions.exceptions import (
     DeletingPrimaryScenario,
@@ -131,21 +133,84 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
         creation_date: Optional[datetime] = None,
         name: Optional[str] = None,
     ) -> Scenario:
-        _task_manager = _TaskManagerFactory._build_manager()
-        _data_manager = _DataManagerFactory._build_manager()
-
-        scenario_id = Scenario._new_id(str(config.id))
         cycle = (
             _CycleManagerFactory._build_manager()._get_or_create(config.frequency, creation_date)
             if config.frequency
             else None
         )
+        is_primary_scenario = len(cls._get_all_by_cycle(cycle)) == 0 if cycle else False
+        return cls.__create(config, creation_date, name, cycle, is_primary_scenario, cls._get_latest_version())
+
+    @classmethod
+    def _bulk_create(
+        cls,
+        config: ScenarioConfig,
+        creation_dates: List[Optional[datetime]],
+        names: List[Optional[str]],
+    ) -> List[Scenario]:
+        """Create several scenarios from the same configuration.
+
+        The cycles, the primary scenarios of the cycles and the data nodes and tasks shared by the
+        scenarios are looked up once. The entities are saved and the creation events are published
+        together, when all the scenarios are created.
+        """
+        _cycle_manager = _CycleManagerFactory._build_manager()
+        cycles_by_start_date: Dict[datetime, Cycle] = {}
+        cycles_with_scenarios: Set[CycleId] = set()
+        shared_entities: Dict[Tuple[Any, Optional[str]], Any] = {}
+        version = cls._get_latest_version()
+
+        cycles: List[Optional[Cycle]] = []
+        scenarios = []
+        with _UnitOfWork._open():
+            # The cycles are resolved first: listing the scenarios of a cycle flushes the pending
+            # scenarios, which must not happen in the middle of the creations.
+            for creation_date in creation_dates:
+                cycle = None
+                if config.frequency:
+                    start_date = _cycle_manager._get_start_date_of_cycle(
+                        config.frequency, creation_date or datetime.now()
+                    )
+                    if (cycle := cycles_by_start_date.get(start_date)) is None:
+                        cycle = _cycle_manager._get_or_create(config.frequency, creation_date)
+                        cycles_by_start_date[start_date] = cycle
+                        if cls._get_all_by_cycle(cycle):
+                            cycles_with_scenarios.add(cycle.id)
+                cycles.append(cycle)
+            for creation_date, name, cycle in zip(creation_dates, names, cycles):
+                is_primary_scenario = cycle is not None and cycle.id not in cycles_with_scenarios
+                if cycle is not None:
+                    cycles_with_scenarios.add(cycle.id)
+                scenarios.append(
+                    cls.__create(config, creation_date, name, cycle, is_primary_scenario, version, shared_entities)
+                )
+        return scenarios
+
+    @classmethod
+    def __create(
+        cls,
+        config: ScenarioConfig,
+        creation_date: Optional[datetime],
+        name: Optional[str],
+        cycle: Optional[Cycle],
+        is_primary_scenario: bool,
+        version: str,
+        shared_entities: Optional[Dict[Tuple[Any, Optional[str]], Any]] = None,
+    ) -> Scenario:
+        _task_manager = _TaskManagerFactory._build_manager()
+        _data_manager = _DataManagerFactory._build_manager()
+
+        scenario_id = Scenario._new_id(str(config.id))
         cycle_id = cycle.id if cycle else None
         tasks = (
-            _task_manager._bulk_get_or_create(config.task_configs, cycle_id, scenario_id) if config.task_configs else []
+            _task_manager._bulk_get_or_create(config.task_configs, cycle_id, scenario_id, shared_entities)
+            if config.task_configs
+            else []
         )
         additional_data_nodes = (
-            _data_manager._bulk_get_or_create(config.additional_data_node_configs, cycle_id, scenario_id)
+            _data_manager._bulk_get_or_create(
+                config.additional_data_node_configs, cycle_id, scenario_id, shared_entities
+            )
             if config.additional_data_node_configs
             else {}
         )
@@ -166,11 +231,9 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
                 )
             sequences[sequence_name] = {Scenario._SEQUENCE_TASKS_KEY: sequence_tasks}
 
-        is_primary_scenario = len(cls._get_all_by_cycle(cycle)) == 0 if cycle else False
         props = config._properties.copy()
         if name:
             props["name"] = name
-        version = cls._get_latest_version()
 
         scenario = Scenario(
             config_id=str(config.id),
@@ -195,6 +258,8 @@ class _ScenarioManager(_Manager[Scenario], _VersionMixin):
                 dn._parent_ids.update([scenario_id])
                 _data_manager._set(dn)
 
+        # The tasks are already loaded, so the lineage saved with the scenario is computed now.
+        scenario._get_lineage()
         cls._set(scenario)
 
         if not scenario._is_consistent():
@@ -17,10 +17,11 @@ from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ._scenario_fs_repository import _ScenarioFSRepository
 from ._scenario_manager import _ScenarioManager
+from ._scenario_sqlite_repository import _ScenarioSQLiteRepository
 
 
 class _ScenarioManagerFactory(_ManagerFactory):
-    __REPOSITORY_MAP = {"default": _ScenarioFSRepository}
+    __REPOSITORY_MAP = {"default": _ScenarioFSRepository, "sqlite": _ScenarioSQLiteRepository}
 
     @classmethod
     @lru_cache
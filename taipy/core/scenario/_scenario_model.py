@@ -33,6 +33,7 @@ class _ScenarioModel(_BaseModel):
     version: str
     sequences: Optional[Dict[str, Dict]] = None
     cycle: Optional[CycleId] = None
+    lineage: Optional[Dict[DataNodeId, List[DataNodeId]]] = None
 
     @staticmethod
     def from_dict(data: Dict[str, Any]):
@@ -49,6 +50,7 @@ class _ScenarioModel(_BaseModel):
             version=data["version"],
             sequences=_BaseModel._deserialize_attribute(data["sequences"]),
             cycle=CycleId(data["cycle"]) if "cycle" in data else None,
+            lineage=_BaseModel._deserialize_attribute(data["lineage"]) if "lineage" in data else None,
         )
 
     def to_list(self):
@@ -65,4 +67,5 @@ class _ScenarioModel(_BaseModel):
             self.version,
             _BaseModel._serialize_attribute(self.sequences),
             self.cycle,
+            _BaseModel._serialize_attribute(self.lineage),
         ]
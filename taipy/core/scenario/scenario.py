@@ -11,8 +11,9 @@
 from __future__ import annotations
 
 import uuid
+from collections import deque
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
 
 import networkx as nx
 
@@ -134,6 +135,7 @@ class Scenario(_Entity, Submittable, _Labeled):
         self._tags = tags or set()
         self._properties = _Properties(self, **properties)
         self._sequences: Dict[str, Dict] = sequences or {}
+        self._lineage: Optional[Dict[DataNodeId, List[DataNodeId]]] = None
 
         _scenario_task_ids = {task.id if isinstance(task, Task) else task for task in self._tasks}
         for sequence_name, sequence_data in self._sequences.items():
@@ -234,6 +236,7 @@ class Scenario(_Entity, Submittable, _Labeled):
     @_self_setter(_MANAGER_NAME)
     def tasks(self, val: Union[Set[TaskId], Set[Task]]) -> None:
         self._tasks = set(val)
+        self._lineage = None
 
     @property  # type: ignore
     @_self_reload(_MANAGER_NAME)
@@ -632,6 +635,41 @@ class Scenario(_Entity, Submittable, _Labeled):
     def _get_set_of_tasks(self) -> Set[Task]:
         return set(self.tasks.values())
 
+    def _get_lineage(self) -> Dict[DataNodeId, List[DataNodeId]]:
+        """Get the ids of the data nodes that each data node of the scenario is computed from.
+
+        The lineage is the scenario graph reduced to the data node ids. It is saved with the
+        scenario so that the ancestors of a data node are found without loading the scenario tasks.
+        It is computed on first use when the scenario was saved without it, e.g., by a previous
+        version or after its tasks changed.
+        """
+        if self._lineage is None:
+            from ..task._task_manager_factory import _TaskManagerFactory
+
+            task_manager = _TaskManagerFactory._build_manager()
+            lineage: Dict[DataNodeId, List[DataNodeId]] = {}
+            for task_or_id in self._tasks:
+                task = task_or_id if isinstance(task_or_id, Task) else task_manager._get(task_or_id)
+                if not isinstance(task, Task):
+                    raise NonExistingTask(task_or_id)
+                input_ids = [dn.id for dn in task.input.values()]
+                for output in task.output.values():
+                    lineage.setdefault(output.id, []).extend(input_ids)
+            self._lineage = lineage
+        return self._lineage
+
+    def _get_ancestor_ids(self, data_node_id: DataNodeId) -> Iterator[DataNodeId]:
+        """Iterate over the ids of the data nodes a data node is computed from, the closest ones first."""
+        lineage = self._get_lineage()
+        visited = {data_node_id}
+        to_visit = deque([data_node_id])
+        while to_visit:
+            for ancestor_id in lineage.get(to_visit.popleft(), ()):
+                if ancestor_id not in visited:
+                    visited.add(ancestor_id)
+                    to_visit.append(ancestor_id)
+                    yield ancestor_id
+
     def __get_data_nodes(self) -> Dict[str, DataNode]:
         data_nodes_dict = self.__get_additional_data_nodes()
         for _, task in self.__get_tasks().items():
@@ -17,10 +17,11 @@ from ..common._check_dependencies import EnterpriseEditionUtils
 from ..common._utils import _load_fct
 from ._submission_fs_repository import _SubmissionFSRepository
 from ._submission_manager import _SubmissionManager
+from ._submission_sqlite_repository import _SubmissionSQLiteRepository
 
 
 class _SubmissionManagerFactory(_ManagerFactory):
-    __REPOSITORY_MAP = {"default": _SubmissionFSRepository}
+    __REPOSITORY_MAP = {"default": _SubmissionFSRepository, "sqlite": _SubmissionSQLiteRepository}
 
     @classmethod
     @lru_cache
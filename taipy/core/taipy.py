@@ -9,13 +9,15 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Literal, Optional, Set, Union, overload
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Literal, Optional, Set, Union, overload
 
 from taipy.common.config import Scope
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from ._entity._entity import _Entity
+from ._repository._unit_of_work import _UnitOfWork
 from ._version._version_manager_factory import _VersionManagerFactory
 from .common._check_instance import (
     _is_cycle,
@@ -79,6 +81,38 @@ def set(entity: Union[DataNode, Task, Sequence, Scenario, Cycle, Submission]):
         return _SubmissionManagerFactory._build_manager()._set(entity)
 
 
+@contextmanager
+def batch() -> Iterator[None]:
+    """Group the entity writes made in the context.
+
+    Within the context, the entities created or updated are kept in memory and saved once, when the
+    context exits, in a single transaction when the repository supports it. An entity updated several
+    times in the context is saved only once. The events related to these entities are published once
+    they are saved.
+
+    Within the context, the entities retrieved by id are the ones created or updated in the context.
+    The entities are saved before any other query on their repository, before a submission, and when
+    the context exits. If an exception is raised in the context, the entities that are not saved yet
+    are discarded, along with their events.
+
+    Nested contexts are part of the outermost one. Each thread has its own context.
+
+    !!! example
+
+        ```python
+        import taipy as tp
+
+        with tp.batch():
+            scenario = tp.create_scenario(scenario_config)
+            scenario.name = "What-if"
+            scenario.properties["region"] = "EMEA"
+            scenario.add_tag("draft")
+        ```
+    """
+    with _UnitOfWork._open():
+        yield
+
+
 def is_submittable(entity: Union[Scenario, ScenarioId, Sequence, SequenceId, Task, TaskId, str]) -> ReasonCollection:
     """Indicate if an entity can be submitted.
 
@@ -909,6 +943,61 @@ def create_scenario(
     return _ScenarioManagerFactory._build_manager()._create(config, creation_date, name)
 
 
+def create_scenarios(
+    config: ScenarioConfig,
+    scenarios: Union[int, str, Iterable[Union[str, datetime]]],
+    creation_date: Optional[datetime] = None,
+) -> List[Scenario]:
+    """Create and return several new scenarios based on the same scenario configuration.
+
+    This function is equivalent to calling `create_scenario()^` for each scenario to create, but
+    it is much faster when many scenarios are created: the cycles and the entities shared by the
+    scenarios are retrieved once, all the entities are saved together, and the creation events are
+    published together once the scenarios are created.
+
+    Arguments:
+        config (ScenarioConfig^): The scenario configuration used to create the new scenarios.
+        scenarios (Union[int, str, Iterable[Union[str, datetime.datetime]]]): The scenarios to create.<br/>
+            - If an integer, the number of scenarios to create.
+            - If an iterable, one scenario is created for each item. A string is the displayable name
+              of the scenario, and a datetime is its creation date.
+            - If a string, a single scenario is created with this displayable name.
+        creation_date (Optional[datetime.datetime]): The creation date of the scenarios that are
+            not given one in *scenarios*. If None, the current date time is used.
+
+    Returns:
+        The list of the new scenarios.
+
+    Raises:
+        SystemExit: If the configuration check returns some errors.
+
+    !!! example
+
+        ```python
+        import taipy as tp
+
+        scenarios = tp.create_scenarios(scenario_config, 10_000)
+        scenarios = tp.create_scenarios(scenario_config, ["low", "medium", "high"])
+        ```
+    """
+    if isinstance(scenarios, str):
+        scenarios = [scenarios]
+    items: Iterable[Union[str, datetime, None]] = [None] * scenarios if isinstance(scenarios, int) else scenarios
+    creation_dates: List[Optional[datetime]] = []
+    names: List[Optional[str]] = []
+    for scenario in items:
+        if isinstance(scenario, datetime):
+            creation_dates.append(scenario)
+            names.append(None)
+        else:
+            creation_dates.append(creation_date)
+            names.append(scenario)
+
+    Orchestrator._manage_version_and_block_config()
+
+    return _ScenarioManagerFactory._build_manager()._bulk_create(config, creation_dates, names)
+
+
 def create_global_data_node(config: DataNodeConfig) -> DataNode:
     """Create and return a new GLOBAL data node from a data node configuration.
 
@@ -992,13 +1081,6 @@ def get_parents(
         ModelNotFound^: If _entity_ does not match a correct entity pattern.
     """
 
-    def update_parent_dict(parents_set, parent_dict):
-        for k, value in parents_set.items():
-            if k in parent_dict.keys():
-                parent_dict[k].update(value)
-            else:
-                parent_dict[k] = value
-
     if isinstance(entity, str):
         entity = get(entity)
 
@@ -1007,28 +1089,23 @@ def get_parents(
     if isinstance(entity, (Scenario, Cycle)):
         return parent_dict
 
-    current_parent_dict: Dict[str, Set] = {}
-    for parent in entity.parent_ids:
-        parent_entity = get(parent)
-        if parent_entity._MANAGER_NAME in current_parent_dict.keys():
-            current_parent_dict[parent_entity._MANAGER_NAME].add(parent_entity)
-        else:
-            current_parent_dict[parent_entity._MANAGER_NAME] = {parent_entity}
-
-    if isinstance(entity, Sequence):
-        update_parent_dict(current_parent_dict, parent_dict)
-
-    if isinstance(entity, Task):
-        parent_entity_key_to_search_next = "scenario"
-        update_parent_dict(current_parent_dict, parent_dict)
-        for parent in parent_dict.get(parent_entity_key_to_search_next, []):
-            get_parents(parent, parent_dict)
-
-    if isinstance(entity, DataNode):
-        parent_entity_key_to_search_next = "task"
-        update_parent_dict(current_parent_dict, parent_dict)
-        for parent in parent_dict.get(parent_entity_key_to_search_next, []):
-            get_parents(parent, parent_dict)
+    # Each parent is loaded once, even when it is shared by several children. Only the parent tasks of a
+    # data node have parents to look for, namely their scenarios and sequences.
+    loaded_ids = {parent.id for parents in parent_dict.values() for parent in parents}
+    children = [entity]
+    while children:
+        child = children.pop()
+        for parent_id in child.parent_ids:
+            if parent_id in loaded_ids:
+                continue
+            loaded_ids.add(parent_id)
+            parent_entity = get(parent_id)
+            if parent_entity._MANAGER_NAME in parent_dict:
+                parent_dict[parent_entity._MANAGER_NAME].add(parent_entity)
+            else:
+                parent_dict[parent_entity._MANAGER_NAME] = {parent_entity}
+            if isinstance(child, DataNode) and isinstance(parent_entity, Task):
+                children.append(parent_entity)
 
     return parent_dict
 
@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Callable, List, Optional, Type, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
 
 from taipy.common.config import Config
 from taipy.common.config.common.scope import Scope
@@ -63,14 +63,21 @@ class _TaskManager(_Manager[Task], _VersionMixin):
         task_configs: List[TaskConfig],
         cycle_id: Optional[CycleId] = None,
         scenario_id: Optional[ScenarioId] = None,
+        shared_entities: Optional[Dict[Tuple[Any, Optional[str]], Any]] = None,
     ) -> List[Task]:
+        """Get or create the tasks of a scenario, with their data nodes.
+
+        When `shared_entities` is provided, the scenario is a new one: its tasks and data nodes of
+        scenario scope are created without querying the repository, and the cycle or global ones are
+        first looked up in `shared_entities`, indexed by config and owner id, then added to it.
+        """
         data_node_configs = set()
         for task_config in task_configs:
             data_node_configs.update([Config.data_nodes[dnc.id] for dnc in task_config.input_configs])
             data_node_configs.update([Config.data_nodes[dnc.id] for dnc in task_config.output_configs])
 
         data_nodes = _DataManagerFactory._build_manager()._bulk_get_or_create(
-            list(data_node_configs), cycle_id, scenario_id
+            list(data_node_configs), cycle_id, scenario_id, shared_entities
         )
         tasks_configs_and_owner_id = []
         for task_config in task_configs:
@@ -89,9 +96,19 @@ class _TaskManager(_Manager[Task], _VersionMixin):
 
             tasks_configs_and_owner_id.append((task_config, owner_id))
 
-        tasks_by_config = cls._repository._get_by_configs_and_owner_ids(  # type: ignore
-            tasks_configs_and_owner_id, cls._build_filters_with_version(None)
-        )
+        if shared_entities is None:
+            tasks_by_config = cls._repository._get_by_configs_and_owner_ids(  # type: ignore
+                tasks_configs_and_owner_id, cls._build_filters_with_version(None)
+            )
+        else:
+            shared_keys = [key for key in tasks_configs_and_owner_id if key[1] != scenario_id]
+            if missing_keys := [key for key in shared_keys if key not in shared_entities]:
+                shared_entities.update(
+                    cls._repository._get_by_configs_and_owner_ids(  # type: ignore
+                        missing_keys, cls._build_filters_with_version(None)
+                    )
+                )
+            tasks_by_config = {key: shared_entities[key] for key in shared_keys if key in shared_entities}
 
         tasks = []
         for task_config, owner_id in tasks_configs_and_owner_id:
@@ -125,6 +142,8 @@ class _TaskManager(_Manager[Task], _VersionMixin):
                 cls._set(task)
                 Notifier.publish(_make_event(task, EventOperation.CREATION))
                 tasks.append(task)
+                if shared_entities is not None and owner_id != scenario_id:
+                    shared_entities[task_config, owner_id] = task
         return tasks
 
     @classmethod
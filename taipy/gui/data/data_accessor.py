@@ -64,6 +64,10 @@ class _DataAccessor(ABC):
     def to_csv(self, var_name: str, value: t.Any) -> t.Optional[str]:
         pass
 
+    def invalidate(self, var_name: str) -> None:  # noqa: B027
+        """Forget what was computed from the value of a variable that was updated."""
+        pass
+
 
 class _InvalidDataAccessor(_DataAccessor):
     @staticmethod
@@ -178,3 +182,7 @@ class _DataAccessors(object):
 
     def to_pandas(self, value: t.Any):
         return self.__get_instance(value).to_pandas(value.get())
+
+    def invalidate(self, var_name: str):
+        for access in set(self.__access_4_type.values()):
+            access.invalidate(var_name)
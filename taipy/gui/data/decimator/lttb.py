@@ -52,12 +52,6 @@ class LTTB(Decimator):
         super().__init__(threshold, zoom)
         self._n_out = n_out
 
-    @staticmethod
-    def _areas_of_triangles(a, bs, c):
-        bs_minus_a = bs - a
-        a_minus_bs = a - bs
-        return 0.5 * abs((a[0] - c[0]) * (bs_minus_a[:, 1]) - (a_minus_bs[:, 0]) * (c[1] - a[1]))
-
     def _decimate(self, data: np.ndarray, payload: t.Dict[str, t.Any]) -> np.ndarray:
         n_out = self._n_out
         if n_out >= data.shape[0]:
@@ -66,12 +60,20 @@ class LTTB(Decimator):
         if n_out < 3:
             raise ValueError("Can only down-sample to a minimum of 3 points")
 
-        # Split data into bins
+        # Split data into bins, with the same bounds as np.array_split(data[1:-1], n_bins)
         n_bins = n_out - 2
-        data_bins = np.array_split(data[1:-1], n_bins)
+        bin_size, n_larger_bins = divmod(data.shape[0] - 2, n_bins)
+        bin_sizes = np.full(n_bins, bin_size)
+        bin_sizes[:n_larger_bins] += 1
+        bounds = np.concatenate(([1], 1 + np.cumsum(bin_sizes)))
+
+        # The centroids of all the bins, followed by the last point
+        centroids = np.add.reduceat(data[1:-1, :2], bounds[:-1] - 1, axis=0) / bin_sizes[:, None]
+        centroids = np.concatenate((centroids, data[-1:, :2]))
 
-        prev_a = data[0]
-        start_pos = 0
+        x = data[:, 0]
+        y = data[:, 1]
+        a_x, a_y = x[0], y[0]
 
         # Prepare output mask array
         # First and last points are the same as in the input.
@@ -83,17 +85,15 @@ class LTTB(Decimator):
         # In each bin, find the point that makes the largest triangle
         # with the point saved in the previous bin
         # and the centroid of the points in the next bin.
-        for i in range(len(data_bins)):
-            this_bin = data_bins[i]
-            next_bin = data_bins[i + 1] if i < n_bins - 1 else data[-1:]
-            a = prev_a
-            bs = this_bin
-            c = next_bin.mean(axis=0)
-
-            areas = LTTB._areas_of_triangles(a, bs, c)
-            bs_pos = np.argmax(areas)
-            prev_a = bs[bs_pos]
-            out_mask[start_pos + bs_pos] = True
-            start_pos += len(this_bin)
+        # Each bin depends on the point selected in the previous one, so the bins are processed in order.
+        bounds = bounds.tolist()
+        for i, (c_x, c_y) in enumerate(centroids[1:].tolist()):
+            start, end = bounds[i], bounds[i + 1]
+            bs_x = x[start:end]
+            bs_y = y[start:end]
+            areas = np.abs((a_x - c_x) * (bs_y - a_y) - (a_x - bs_x) * (c_y - a_y))
+            selected = start + int(np.argmax(areas))
+            out_mask[selected] = True
+            a_x, a_y = x[selected], y[selected]
 
         return out_mask
@@ -27,6 +27,8 @@ class RDP(Decimator):
     """
 
     _CHART_MODES = ["lines+markers", "lines", "markers"]
+    # Segments with fewer points are processed together, by batches of about that many points.
+    __BATCH_SIZE = 1 << 16
 
     def __init__(
         self,
@@ -60,55 +62,100 @@ class RDP(Decimator):
         self._n_out = n_out
 
     @staticmethod
-    def __dsquared_line_points(P1, P2, points):
+    def __dsquared_line_points(x1, y1, x2, y2, xs, ys):
         """
         Calculate only squared distance, only needed for comparison
         """
-        xdiff = P2[0] - P1[0]
-        ydiff = P2[1] - P1[1]
-        nom = (ydiff * points[:, 0] - xdiff * points[:, 1] + P2[0] * P1[1] - P2[1] * P1[0]) ** 2
+        xdiff = x2 - x1
+        ydiff = y2 - y1
+        nom = (ydiff * xs - xdiff * ys + x2 * y1 - y2 * x1) ** 2
         denom = ydiff**2 + xdiff**2
-        return np.divide(nom, denom)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dsq = np.divide(nom, denom)
+        if np.any(same_ends := denom == 0):
+            # The distance to a line which ends are the same point is the distance to that point
+            dsq = np.where(same_ends, (xs - x1) ** 2 + (ys - y1) ** 2, dsq)
+        # Points that cannot be compared are kept
+        dsq[np.isnan(dsq)] = np.inf
+        return dsq
+
+    @staticmethod
+    def __farthest_points(x, y, starts, ends):
+        """
+        Find the point that is the farthest from the line joining the ends of each segment.
+
+        The segments must have at least one point between their ends. Large segments are processed
+        one by one, small ones are processed together.
+
+        Returns:
+            The indices of the farthest points and their squared distances.
+        """
+        indices = np.empty(len(starts), dtype=np.intp)
+        distances = np.empty(len(starts))
+        sizes = ends - starts - 1
+
+        is_large = sizes >= RDP.__BATCH_SIZE
+        for i in np.flatnonzero(is_large):
+            start, end = starts[i], ends[i]
+            dsq = RDP.__dsquared_line_points(x[start], y[start], x[end], y[end], x[start + 1 : end], y[start + 1 : end])
+            farthest = np.argmax(dsq)
+            indices[i] = start + 1 + farthest
+            distances[i] = dsq[farthest]
+
+        small = np.flatnonzero(~is_large)
+        if not len(small):
+            return indices, distances
+        cumulated_sizes = np.cumsum(sizes[small])
+        splits = np.searchsorted(cumulated_sizes, np.arange(RDP.__BATCH_SIZE, cumulated_sizes[-1], RDP.__BATCH_SIZE))
+        for batch in np.split(small, splits):
+            batch_starts = starts[batch]
+            batch_ends = ends[batch]
+            batch_sizes = sizes[batch]
+            offsets = np.cumsum(batch_sizes) - batch_sizes
+            # The segment of each point between the ends of the segments of the batch, and its index
+            segments = np.repeat(np.arange(len(batch)), batch_sizes)
+            points = np.arange(len(segments)) - offsets[segments] + batch_starts[segments] + 1
+            x1, y1 = x[batch_starts][segments], y[batch_starts][segments]
+            x2, y2 = x[batch_ends][segments], y[batch_ends][segments]
+            dsq = RDP.__dsquared_line_points(x1, y1, x2, y2, x[points], y[points])
+
+            batch_distances = np.maximum.reduceat(dsq, offsets)
+            # Like np.argmax, select the first point at the maximum distance in each segment
+            candidates = np.flatnonzero(dsq == batch_distances[segments])
+            candidate_segments = segments[candidates]
+            is_first = np.concatenate(([True], candidate_segments[1:] != candidate_segments[:-1]))
+            indices[batch] = points[candidates[is_first]]
+            distances[batch] = batch_distances
+        return indices, distances
+
+    @staticmethod
+    def __split(starts, ends, indices=None):
+        """
+        Split the segments at the given indices, and keep the segments with points between their ends.
+        """
+        if indices is not None:
+            starts, ends = np.concatenate((starts, indices)), np.concatenate((indices, ends))
+        has_points = ends - starts > 1
+        return starts[has_points], ends[has_points]
 
     @staticmethod
     def __rdp_epsilon(data, epsilon: int):
-        # initiate mask array
-        # same amount of points
-        mask = np.empty(data.shape[0], dtype=bool)
-
-        # Assume all points are valid and falsify those which are found
-        mask.fill(True)
-
-        # The stack to select start and end index
-        stack: t.List[t.Tuple[int, int]] = [(0, data.shape[0] - 1)]  # type: ignore
-
-        while stack:
-            # Pop the last item
-            (start, end) = stack.pop()
-
-            # nothing to calculate if no points in between
-            if end - start <= 1:
-                continue
-            # Calculate distance to points
-            P1 = data[start]
-            P2 = data[end]
-            points = data[start + 1 : end]
-            dsq = RDP.__dsquared_line_points(P1, P2, points)
-
-            mask_eps = dsq > epsilon**2
-
-            if mask_eps.any():
-                # max point outside eps
-                # Include index that was sliced out
-                # Also include the start index to get absolute index
-                # And not relative
-                mid = np.argmax(dsq) + 1 + start
-                stack.append((start, mid))  # type: ignore
-                stack.append((mid, end))  # type: ignore
-            else:
-                # Points in between are redundant
-                mask[start + 1 : end] = False
-        return mask
+        x = data[:, 0]
+        y = data[:, 1]
+
+        # Counts the ranges of removed points that hold each point, using +1 at their start and -1 after their end
+        removed = np.zeros(data.shape[0] + 1, dtype=np.intp)
+
+        # The segments at the same depth of the recursion are processed together
+        starts, ends = RDP.__split(np.array([0]), np.array([data.shape[0] - 1]))
+        while len(starts):
+            indices, distances = RDP.__farthest_points(x, y, starts, ends)
+            is_far = distances > epsilon**2
+            # Points in between are redundant
+            np.add.at(removed, starts[~is_far] + 1, 1)
+            np.add.at(removed, ends[~is_far], -1)
+            starts, ends = RDP.__split(starts[is_far], ends[is_far], indices[is_far])
+        return np.cumsum(removed[:-1]) == 0
 
     @staticmethod
     def __rdp_points(M, n_out):
@@ -118,23 +165,20 @@ class RDP(Decimator):
             mask = np.empty(M_len, dtype=bool)
             mask.fill(True)
             return mask
+        x = M[:, 0]
+        y = M[:, 1]
         weights = np.empty(M_len)
-        # weights.fill(0)
         weights[0] = float("inf")
         weights[M_len - 1] = float("inf")
 
-        stack = [(0, M_len - 1)]
-
-        while stack:
-            (start, end) = stack.pop()
-            if end - start <= 1:
-                continue
-            dsq = RDP.__dsquared_line_points(M[start], M[end], M[start + 1 : end])
-            max_dist_index = np.argmax(dsq) + start + 1
-            weights[max_dist_index] = np.amax(dsq)
-            stack.append((start, max_dist_index))
-            stack.append((max_dist_index, end))
-        maxTolerance = np.sort(weights)[M_len - n_out]
+        # Each point between the ends is the farthest point of a segment at some depth of the recursion.
+        # The segments at the same depth are processed together.
+        starts, ends = RDP.__split(np.array([0]), np.array([M_len - 1]))
+        while len(starts):
+            indices, distances = RDP.__farthest_points(x, y, starts, ends)
+            weights[indices] = distances
+            starts, ends = RDP.__split(starts, ends, indices)
+        maxTolerance = np.partition(weights, M_len - n_out)[M_len - n_out]
 
         return weights >= maxTolerance
 
@@ -9,15 +9,17 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
 import os
 import typing as t
+import weakref
 from datetime import datetime
 from importlib import util
 from tempfile import mkstemp
 
 import numpy as np
 import pandas as pd
-from pandas.api.types import is_numeric_dtype
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
 
 from .._warnings import _warn
 from ..gui import Gui
@@ -40,6 +42,15 @@ class _PandasDataAccessor(_DataAccessor):
 
     __AGGREGATE_FUNCTIONS: t.List[str] = ["count", "sum", "mean", "median", "min", "max", "std", "first", "last"]
 
+    __MAX_VIEWS = 32
+    # Number of rows of the Arrow record batches
+    __ARROW_BATCH_SIZE = 65536
+
+    def __init__(self, gui: Gui) -> None:
+        super().__init__(gui)
+        # Filtered and sorted rows of the data frames sent to the clients, by client, variable and column prefix.
+        self.__views: t.Dict[t.Tuple[str, str, str], _PandasDataView] = {}
+
     def to_pandas(self, value: t.Union[pd.DataFrame, pd.Series]) -> t.Union[t.List[pd.DataFrame], pd.DataFrame]:
         return self.__to_dataframe(value)
 
@@ -204,19 +215,16 @@ class _PandasDataAccessor(_DataAccessor):
         if data_format is _DataFormat.APACHE_ARROW:
             if not _has_arrow_module:
                 raise RuntimeError("Cannot use Arrow as pyarrow package is not installed")
-            # Convert from pandas to Arrow
-            table = pa.Table.from_pandas(data)  # type: ignore[reportPossiblyUnboundVariable]
+            # Convert from pandas to Arrow, sharing the column buffers when possible
+            # The index is not sent, as for JSON: the row index is sent in its own column when needed
+            table = pa.Table.from_pandas(data, preserve_index=False)  # type: ignore[reportPossiblyUnboundVariable]
             # Create sink buffer stream
             sink = pa.BufferOutputStream()  # type: ignore[reportPossiblyUnboundVariable]
-            # Create Stream writer
-            writer = pa.ipc.new_stream(sink, table.schema)  # type: ignore[reportPossiblyUnboundVariable]
-            # Write data to table
-            writer.write_table(table)
-            writer.close()
-            # End buffer stream
-            buf = sink.getvalue()
+            # Write the table as a stream of record batches
+            with pa.ipc.new_stream(sink, table.schema) as writer:  # type: ignore[reportPossiblyUnboundVariable]
+                writer.write_table(table, max_chunksize=_PandasDataAccessor.__ARROW_BATCH_SIZE)
             # Convert buffer to Python bytes and return
-            ret["data"] = buf.to_pybytes()
+            ret["data"] = sink.getvalue().to_pybytes()
             ret["orient"] = orient
         else:
             # Workaround for Python built in JSON encoder that does not yet support ignore_nan
@@ -233,6 +241,77 @@ class _PandasDataAccessor(_DataAccessor):
             return ret_dict
         return {str(k): v for k, v in self.__to_dataframe(value).dtypes.apply(lambda x: x.name.lower()).items()}
 
+    def __add_index_col(self, df: pd.DataFrame) -> pd.DataFrame:
+        if _PandasDataAccessor.__INDEX_COL in df.columns:
+            return df
+        return df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
+
+    def __get_view(self, var_name: str, col_prefix: str, df: pd.DataFrame, filters: t.Any) -> "_PandasDataView":
+        key = (self._gui._get_client_id(), var_name, col_prefix)
+        filters_key = json.dumps(filters, sort_keys=True, default=str)
+        view = self.__views.pop(key, None)
+        if view is None or not view.is_valid(df, filters_key):
+            view = _PandasDataView(df, filters_key, self.__get_filtered_rows(df, filters))
+        # keep the most recently used views
+        self.__views[key] = view
+        while len(self.__views) > _PandasDataAccessor.__MAX_VIEWS:
+            del self.__views[next(iter(self.__views))]
+        return view
+
+    def __get_filtered_rows(self, df: pd.DataFrame, filters: t.Any) -> t.Optional[np.ndarray]:
+        if not isinstance(filters, list) or len(filters) == 0:
+            return None
+        query = ""
+        vars = []
+        for fd in filters:
+            col = fd.get("col")
+            val = fd.get("value")
+            action = fd.get("action")
+            match_case = fd.get("matchCase", False) is not False  # Ensure it's a boolean
+            right = None
+            col_expr = f"`{col}`"
+
+            if isinstance(val, str):
+                if self.__is_date_column(t.cast(pd.DataFrame, df), col):
+                    val = datetime.fromisoformat(val[:-1])
+                elif not match_case:
+                    if action != "contains":
+                        col_expr = f"{col_expr}.str.lower()"
+                    val = val.lower()
+                vars.append(val)
+                val_var = f"@vars[{len(vars) - 1}]"
+                if action == "contains":
+                    right = f".str.contains({val_var}{'' if match_case else ', case=False'})"
+            else:
+                vars.append(val)
+                val_var = f"@vars[{len(vars) - 1}]"
+
+            if right is None:
+                right = f" {action} {val_var}"
+
+            if query:
+                query += " and "
+            query += f"{col_expr}{right}"
+
+        # Apply filters using df.eval()
+        try:
+            if query:
+                mask = df.eval(query, local_dict={"vars": vars})
+                if not is_bool_dtype(mask):
+                    raise TypeError(f"Filtering query returned {mask.dtype} values.")
+                return np.flatnonzero(mask.to_numpy())
+        except Exception as e:
+            _warn(f"Dataframe filtering: invalid query '{query}' on {df.head()}", e)
+        return None
+
+    def invalidate(self, var_name: str) -> None:
+        for key in [k for k in self.__views if k[1] == var_name]:
+            del self.__views[key]
+
+    def __discard_views(self, df: pd.DataFrame):
+        for key in [k for k, v in self.__views.items() if v.df() is df]:
+            del self.__views[key]
+
     def __get_data(  # noqa: C901
         self,
         var_name: str,
@@ -250,56 +329,14 @@ class _PandasDataAccessor(_DataAccessor):
 
         orig_df = df
         # add index if not chart
-        if paged:
-            if _PandasDataAccessor.__INDEX_COL not in df.columns:
-                is_copied = True
-                df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index})
-            if columns and _PandasDataAccessor.__INDEX_COL not in columns:
-                columns.append(_PandasDataAccessor.__INDEX_COL)
+        if paged and columns and _PandasDataAccessor.__INDEX_COL not in columns:
+            columns.append(_PandasDataAccessor.__INDEX_COL)
 
         fullrowcount = len(df)
         # filtering
-        filters = payload.get("filters")
-        if isinstance(filters, list) and len(filters) > 0:
-            query = ""
-            vars = []
-            for fd in filters:
-                col = fd.get("col")
-                val = fd.get("value")
-                action = fd.get("action")
-                match_case = fd.get("matchCase", False) is not False  # Ensure it's a boolean
-                right = None
-                col_expr = f"`{col}`"
-
-                if isinstance(val, str):
-                    if self.__is_date_column(t.cast(pd.DataFrame, df), col):
-                        val = datetime.fromisoformat(val[:-1])
-                    elif not match_case:
-                        if action != "contains":
-                            col_expr = f"{col_expr}.str.lower()"
-                        val = val.lower()
-                    vars.append(val)
-                    val_var = f"@vars[{len(vars) - 1}]"
-                    if action == "contains":
-                        right = f".str.contains({val_var}{'' if match_case else ', case=False'})"
-                else:
-                    vars.append(val)
-                    val_var = f"@vars[{len(vars) - 1}]"
-
-                if right is None:
-                    right = f" {action} {val_var}"
-
-                if query:
-                    query += " and "
-                query += f"{col_expr}{right}"
-
-            # Apply filters using df.query()
-            try:
-                if query:
-                    df = df.query(query)
-                    is_copied = True
-            except Exception as e:
-                _warn(f"Dataframe filtering: invalid query '{query}' on {df.head()}", e)
+        view = self.__get_view(var_name, t.cast(str, col_prefix), df, payload.get("filters"))
+        # positions of the filtered rows, None if no filter applies
+        rows = view.rows
 
         dict_ret: t.Optional[t.Dict[str, t.Any]]
         if paged:
@@ -315,14 +352,18 @@ class _PandasDataAccessor(_DataAccessor):
                     if col not in applies_with_fn.keys():
                         applies_with_fn[col] = "first"
                 try:
-                    df = t.cast(pd.DataFrame, df).groupby(aggregates).agg(applies_with_fn)
+                    filtered_df = self.__add_index_col(df if rows is None else df.iloc[rows])
+                    aggregated_df = t.cast(pd.DataFrame, filtered_df).groupby(aggregates).agg(applies_with_fn)
+                    # the rows of the aggregated data frame are not cached
+                    df, rows, view = aggregated_df, None, None
+                    is_copied = True
                 except Exception:
                     _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
             inf = payload.get("infinite")
             if inf is not None:
                 ret_payload["infinite"] = inf
             # real number of rows is needed to calculate the number of pages
-            rowcount = len(df)
+            rowcount = len(df) if rows is None else len(rows)
             # here we'll deal with start and end values from payload if present
             if isinstance(payload.get("start", 0), int):
                 start = int(payload.get("start", 0))
@@ -357,23 +398,27 @@ class _PandasDataAccessor(_DataAccessor):
                 try:
                     if df.columns.dtype.name == "int64":
                         order_by = int(order_by)
-                    new_indexes = t.cast(pd.DataFrame, df)[order_by].values.argsort(axis=0)
+                    if view is None:
+                        new_indexes = t.cast(pd.DataFrame, df)[order_by].values.argsort(axis=0)
+                    else:
+                        new_indexes = view.get_sorted_rows(t.cast(pd.DataFrame, df), order_by)
                     if payload.get("sort") == "desc":
                         # reverse order
                         new_indexes = new_indexes[::-1]
                     new_indexes = new_indexes[slice(start, end + 1)]
                 except Exception:
                     _warn(f"Cannot sort {var_name} on columns {order_by}.")
-                    new_indexes = slice(start, end + 1)  # type: ignore
+                    new_indexes = slice(start, end + 1) if rows is None else rows[start : end + 1]  # type: ignore
             else:
-                new_indexes = slice(start, end + 1)  # type: ignore
+                new_indexes = slice(start, end + 1) if rows is None else rows[start : end + 1]  # type: ignore
+            # only the rows of the page are copied
+            df = df.iloc[new_indexes] if view is None else self.__add_index_col(df.iloc[new_indexes])
             df = self.__build_transferred_cols(
                 columns,
                 t.cast(pd.DataFrame, df),
                 styles=payload.get("styles"),
                 tooltips=payload.get("tooltips"),
-                is_copied=is_copied,
-                new_indexes=t.cast(np.ndarray, new_indexes),
+                is_copied=True,
                 handle_nan=payload.get("handlenan", False),
                 formats=payload.get("formats"),
             )
@@ -407,6 +452,9 @@ class _PandasDataAccessor(_DataAccessor):
 
         else:
             ret_payload["alldata"] = True
+            if rows is not None:
+                df = df.iloc[rows]
+                is_copied = True
             decimator_payload: t.Dict[str, t.Any] = payload.get("decimatorPayload", {})
             decimators = decimator_payload.get("decimators", [])
             decimated_dfs: t.List[pd.DataFrame] = []
@@ -513,6 +561,8 @@ class _PandasDataAccessor(_DataAccessor):
         if not isinstance(df, pd.DataFrame):
             raise ValueError(f"Cannot edit {type(value)}.")
         df.at[payload["index"], payload["col"]] = payload["value"]
+        # the data frame is modified in place
+        self.__discard_views(df)
         return self._from_pandas(df, type(value))
 
     def on_delete(self, value: t.Any, payload: t.Dict[str, t.Any]):
@@ -560,3 +610,31 @@ class _PandasDataAccessor(_DataAccessor):
 
                 return temp_path
         return None
+
+
+class _PandasDataView:
+    """Filtered and sorted rows of a data frame.
+
+    A view stays valid as long as it is requested for the same data frame instance and filters.
+    """
+
+    def __init__(self, df: pd.DataFrame, filters_key: str, rows: t.Optional[np.ndarray]) -> None:
+        self.df = weakref.ref(df)
+        self.filters_key = filters_key
+        # positions of the filtered rows, None if no filter applies
+        self.rows = rows
+        # positions of the filtered rows, sorted on a column in ascending order
+        self.__sorted_rows: t.Tuple[t.Any, t.Optional[np.ndarray]] = (None, None)
+
+    def is_valid(self, df: pd.DataFrame, filters_key: str) -> bool:
+        return self.df() is df and self.filters_key == filters_key
+
+    def get_sorted_rows(self, df: pd.DataFrame, order_by: t.Any) -> np.ndarray:
+        col, sorted_rows = self.__sorted_rows
+        if sorted_rows is None or col != order_by:
+            if self.rows is None:
+                sorted_rows = df[order_by].values.argsort(axis=0)
+            else:
+                sorted_rows = self.rows[df[order_by].values[self.rows].argsort(axis=0)]
+            self.__sorted_rows = (order_by, sorted_rows)
+        return t.cast(np.ndarray, sorted_rows)
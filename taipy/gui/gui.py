@@ -1125,6 +1125,8 @@ class Gui:
             resource_handler = get_current_resource_handler()
             custom_page_filtered_types = resource_handler.data_layer_supported_types if resource_handler else ()
             if isinstance(newvalue, (_TaipyData)) or isinstance(newvalue, custom_page_filtered_types):
+                # the data may have been modified in place
+                self._get_accessor().invalidate(_var)
                 newvalue = {"__taipy_refresh": True}
             else:
                 if isinstance(newvalue, (_TaipyContent, _TaipyContentImage)):
@@ -85,6 +85,8 @@ class _GuiCoreContext(CoreEventConsumerBase):
     __ACTION = "action"
     _CORE_CHANGED_NAME = "core_changed"
     _AUTH_CHANGED_NAME = "auth_changed"
+    _EVENTS_BATCH_SIZE = 1000
+    _EVENTS_BATCH_TIMEOUT = 0.05
 
     def __init__(self, gui: Gui) -> None:
         self.gui = gui
@@ -103,7 +105,7 @@ class _GuiCoreContext(CoreEventConsumerBase):
         # Gui event listener
         gui._add_event_listener("authorization", self._auth_listener, with_state=True)
         # super
-        super().__init__(reg_id, reg_queue)
+        super().__init__(reg_id, reg_queue, self._EVENTS_BATCH_SIZE, self._EVENTS_BATCH_TIMEOUT)
 
     def on_user_init(self, state: State):
         self.gui._fire_event("authorization", get_state_id(state), {})
@@ -146,11 +148,32 @@ class _GuiCoreContext(CoreEventConsumerBase):
         elif event.entity_type is EventEntityType.SUBMISSION:
             self.submission_status_callback(event.entity_id, event)
         elif event.entity_type is EventEntityType.DATA_NODE:
-            with self.lock:
-                self.data_nodes_by_owner = None
-            self.broadcast_core_changed(
-                {"datanode": event.entity_id if event.operation != EventOperation.DELETION else True}
-            )
+            self.data_nodes_refresh([event])
+
+    def process_events(self, events: t.List[Event]):
+        # Consecutive data node events are refreshed at once, so that the front-end receives a single broadcast
+        # for them. The events are still processed in their original order.
+        data_node_events: t.List[Event] = []
+        for event in events:
+            if event.entity_type is EventEntityType.DATA_NODE:
+                data_node_events.append(event)
+                continue
+            if data_node_events:
+                self.data_nodes_refresh(data_node_events)
+                data_node_events = []
+            self.process_event(event)
+        if data_node_events:
+            self.data_nodes_refresh(data_node_events)
+
+    def data_nodes_refresh(self, events: t.List[Event]):
+        with self.lock:
+            self.data_nodes_by_owner = None
+        if updated_ids := list(
+            dict.fromkeys(event.entity_id for event in events if event.operation is not EventOperation.DELETION)
+        ):
+            self.broadcast_core_changed({"datanode": updated_ids})
+        if any(event.operation is EventOperation.DELETION for event in events):
+            self.broadcast_core_changed({"datanode": True})
 
     def broadcast_core_changed(self, payload: t.Dict[str, t.Any], client_id: t.Optional[str] = None):
         self.gui._broadcast(_GuiCoreContext._CORE_CHANGED_NAME, payload, client_id)
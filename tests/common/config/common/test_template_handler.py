@@ -15,6 +15,7 @@ from unittest import mock
 
 import pytest
 
+from taipy.common.config import Config
 from taipy.common.config.common._template_handler import _TemplateHandler
 from taipy.common.config.common.frequency import Frequency
 from taipy.common.config.common.scope import Scope
@@ -121,6 +122,46 @@ def test_replace_tuple_list_dict():
         assert actual == (True, now, 3, "qux", "quz")
 
 
+def test_replace_non_string_values():
+    class Unprintable:
+        def __str__(self):
+            raise AssertionError("Values that are not strings must not be converted.")
+
+    value = Unprintable()
+    assert _TemplateHandler._replace_templates(value) is value
+
+
+def test_frozen_environment():
+    with mock.patch.dict(os.environ, {"FOO": "bar"}):
+        Config.freeze_environment()
+        try:
+            with mock.patch.dict(os.environ, {"FOO": "baz"}):
+                assert _TemplateHandler._replace_templates("ENV[FOO]") == "bar"
+
+                # The environment is copied again when the configuration is updated
+                Config.configure_global_app(foo="ENV[FOO]")
+                assert Config.global_config.foo == "baz"
+        finally:
+            Config.unfreeze_environment()
+
+        assert _TemplateHandler._replace_templates("ENV[FOO]") == "bar"
+
+
+
+def test_frozen_environment_only_caches_templates():
+    Config.freeze_environment()
+    try:
+        assert _TemplateHandler._replace_templates("ENVIRONMENT/foo") == "ENVIRONMENT/foo"
+        assert _TemplateHandler._replace_templates("ENV[FOO") == "ENV[FOO"
+        assert _TemplateHandler._TemplateHandler__frozen_values == {}
+
+        with mock.patch.dict(os.environ, {"FOO": "bar"}):
+            Config.freeze_environment()
+            assert _TemplateHandler._replace_templates("ENV[FOO]") == "bar"
+        assert list(_TemplateHandler._TemplateHandler__frozen_values) == [("ENV[FOO]", str, True, None)]
+    finally:
+        Config.unfreeze_environment()
+
 def test_to_bool():
     with pytest.raises(InconsistentEnvVariableError):
         _TemplateHandler._to_bool("okhds")
@@ -30,6 +30,38 @@ def pytest_addoption(parser: pytest.Parser) -> None:
     parser.addoption("--e2e-port", action="store", default="5000", help="port for e2e testing")
 
 
+_benchmark_reports_key = pytest.StashKey[t.List[str]]()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: t.List[pytest.Item]) -> None:
+    """Skip the benchmarks unless they are explicitly selected."""
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks only run when selected with -m benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+def pytest_terminal_summary(terminalreporter, config: pytest.Config) -> None:
+    """Display the measures reported by the benchmarks."""
+    if reports := config.stash.get(_benchmark_reports_key, []):
+        terminalreporter.write_sep("=", "benchmarks")
+        for report in reports:
+            terminalreporter.write_line(report)
+
+
+@pytest.fixture
+def benchmark_report(request: pytest.FixtureRequest, record_property) -> t.Callable:
+    """Fixture to report a measure of a benchmark in the terminal summary and in the test report."""
+    def _benchmark_report(name: str, value: float, unit: str = "s") -> None:
+        record_property(name, value)
+        reports = request.config.stash.setdefault(_benchmark_reports_key, [])
+        reports.append(f"{request.node.nodeid} - {name}: {value:.4f} {unit}")
+
+    return _benchmark_report
+
+
 @pytest.fixture(scope="session")
 def e2e_base_url(request: pytest.FixtureRequest) -> str:
     """Fixture to get the base URL for e2e testing."""
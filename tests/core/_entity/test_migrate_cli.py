@@ -77,6 +77,24 @@ def test_migrate_fs_specified_folder(caplog, mocker):
         assert not subdir.diff_files and not subdir.left_only and not subdir.right_only
 
 
+def test_migrate_fs_removes_indexes(caplog, mocker):
+    mocker.patch("taipy.core._entity._migrate._utils.version", return_value="3.1.0")
+    _MigrateCLI.create_parser()
+
+    data_sample_path = "tests/core/_entity/data_sample"
+    data_path = "tests/core/_entity/.data"
+    shutil.copytree(data_sample_path, data_path)
+    index_files = [os.path.join(data_path, name) for name in ["scenarios.index", "scenarios.index.lock"]]
+    for index_file in index_files:
+        open(index_file, "w").close()
+
+    with pytest.raises(SystemExit):
+        with patch("sys.argv", ["prog", "migrate", "--repository-type", "filesystem", data_path, "--skip-backup"]):
+            _MigrateCLI.handle_command()
+
+    assert not any(os.path.exists(index_file) for index_file in index_files)
+
+
 def test_migrate_fs_backup_and_remove(caplog, mocker):
     mocker.patch("taipy.core._entity._migrate._utils.version", return_value="3.1.0")
     _MigrateCLI.create_parser()
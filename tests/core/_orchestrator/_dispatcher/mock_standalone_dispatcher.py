@@ -19,8 +19,9 @@ from taipy.core._orchestrator._dispatcher import _StandaloneJobDispatcher
 
 
 class MockProcessPoolExecutor(Executor):
-    submit_called: List = []
-    f: List = []
+    def __init__(self):
+        self.submit_called: List = []
+        self.f: List = []
 
     def submit(self, fn, *args, **kwargs):
         self.submit_called.append((fn, args, kwargs))
@@ -38,13 +39,17 @@ class MockProcessPoolExecutor(Executor):
 class MockStandaloneDispatcher(_StandaloneJobDispatcher):
     def __init__(self, orchestrator: _AbstractOrchestrator):
         super(_StandaloneJobDispatcher, self).__init__(orchestrator)
-        self._executor: Executor = MockProcessPoolExecutor()
+        self._executor: Executor = self._create_executor()
         self._nb_available_workers = 1
         self._nb_available_workers_lock = Lock()
 
         self.dispatch_calls: List = []
         self.update_job_status_from_future_calls: List = []
 
+    def _create_executor(self) -> Executor:
+        self._workers_config_generation, _ = self._get_config_payload()
+        return MockProcessPoolExecutor()
+
     def mock_exception_for_job(self, task_id, e: Exception):
         self.exceptions[task_id] = e  # type: ignore[attr-defined]
 
@@ -36,7 +36,7 @@ def test_dispatch_executes_the_function_no_exception():
     dispatcher = _OrchestratorFactory._build_dispatcher()
 
     with patch("taipy.core._orchestrator._dispatcher._task_function_wrapper._TaskFunctionWrapper.execute") as mck:
-        mck.return_value = []
+        mck.return_value = [], {}
         dispatcher._dispatch(job)
 
         mck.assert_called_once()
@@ -53,7 +53,7 @@ def test_dispatch_executes_the_function_with_exceptions():
     e_2 = Exception("test")
 
     with patch("taipy.core._orchestrator._dispatcher._task_function_wrapper._TaskFunctionWrapper.execute") as mck:
-        mck.return_value = [e_1, e_2]
+        mck.return_value = [e_1, e_2], {}
         dispatcher._dispatch(job)
 
         mck.assert_called_once()
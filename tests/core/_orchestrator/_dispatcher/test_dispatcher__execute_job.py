@@ -45,7 +45,7 @@ def test_execute_job():
             dispatcher = _JobDispatcher(_OrchestratorFactory._build_orchestrator())
             dispatcher._execute_job(job)
 
-            mck_2.assert_called_once_with(job.task)  # This should be called to check if job needs to run
+            mck_2.assert_called_once_with(job.task, {})  # This should be called to check if job needs to run
             mck_1.assert_called_once_with(job)
             assert job.is_running()  # The job is not executed since the dispatch is mocked
             assert scenario.dn.edit_in_progress  # outputs must NOT have been unlocked because the dispatch is mocked
@@ -65,7 +65,7 @@ def test_execute_job_to_skip():
 
             assert job.is_skipped()
             mck_1.assert_not_called()  # The job is expecting to be skipped, so it must not be dispatched
-            mck_2.assert_called_once_with(job.task)  # this must be called to check if the job needs to run
+            mck_2.assert_called_once_with(job.task, {})  # this must be called to check if the job needs to run
             assert not scenario.dn.edit_in_progress  # outputs must have been unlocked
 
 
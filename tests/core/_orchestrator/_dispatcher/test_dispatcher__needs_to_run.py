@@ -9,13 +9,17 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import os
 from datetime import datetime, timedelta
+from unittest import mock
 
 import freezegun
 
+import taipy
 from taipy.common.config import Config
 from taipy.core._orchestrator._dispatcher import _JobDispatcher
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.data.data_node import DataNode
 from taipy.core.task._task_manager import _TaskManager
 
 
@@ -23,6 +27,10 @@ def nothing(*args):
     pass
 
 
+def greet(name):
+    return f"Hello {name}!"
+
+
 def _create_task_from_config(task_cfg):
     return _TaskManager()._bulk_get_or_create([task_cfg])[0]
 
@@ -100,3 +108,96 @@ def test_need_to_run_skippable_task_but_input_edited_after_output():
     with freezegun.freeze_time(output_edit_time + timedelta(minutes=30)):  # 30 min after output_edit_time
         task.data_nodes["input"].write("Yellow !")
         assert dispatcher._needs_to_run(task)  # output data is written but validity period expired
+
+
+def test_need_to_run_skippable_task_with_fingerprinted_file_input():
+    input_cfg = Config.configure_pickle_data_node("input", default_data="world", fingerprint=True)
+    output_cfg = Config.configure_pickle_data_node("output")
+    task_cfg = Config.configure_task("name", greet, [input_cfg], [output_cfg], skippable=True)
+    task = _create_task_from_config(task_cfg)
+    dispatcher = _JobDispatcher(_OrchestratorFactory._build_orchestrator())
+    assert dispatcher._needs_to_run(task)  # output data is not written
+
+    taipy.submit(task)
+    assert task.output["output"].read() == "Hello world!"
+    assert task.output["output"].edits[-1]["input_fingerprints"] == {
+        task.input["input"].id: task.input["input"].edits[-1]["fingerprint"]
+    }
+    assert not dispatcher._needs_to_run(task)
+
+    task.input["input"].write("world")  # input data is rewritten with the same content
+    assert not dispatcher._needs_to_run(task)
+
+    os.utime(task.input["input"].path)  # input file is touched
+    assert not dispatcher._needs_to_run(task)
+
+    task.input["input"].write("Taipy")
+    assert dispatcher._needs_to_run(task)
+
+
+def test_execute_job_computes_input_fingerprints_once():
+    input_cfg = Config.configure_pickle_data_node("input", default_data="world", fingerprint=True)
+    output_cfg = Config.configure_pickle_data_node("output")
+    task_cfg = Config.configure_task("name", greet, [input_cfg], [output_cfg], skippable=True)
+    task = _create_task_from_config(task_cfg)
+    taipy.submit(task)
+
+    compute_fingerprint = DataNode._compute_fingerprint
+    with mock.patch.object(DataNode, "_compute_fingerprint", autospec=True, side_effect=compute_fingerprint) as mck:
+        job = taipy.submit(task).jobs[0]
+        assert job.is_skipped()
+        mck.assert_called_once()
+
+        task.input["input"].write("Taipy")
+        mck.reset_mock()
+        job = taipy.submit(task).jobs[0]
+        assert job.is_completed()
+        mck.assert_called_once()
+    assert task.output["output"].read() == "Hello Taipy!"
+
+
+def test_need_to_run_skippable_task_with_fingerprinted_in_memory_input():
+    input_cfg = Config.configure_in_memory_data_node("input", default_data="world", fingerprint=True)
+    output_cfg = Config.configure_in_memory_data_node("output")
+    task_cfg = Config.configure_task("name", greet, [input_cfg], [output_cfg], skippable=True)
+    task = _create_task_from_config(task_cfg)
+    dispatcher = _JobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    taipy.submit(task)
+    assert not dispatcher._needs_to_run(task)
+
+    task.input["input"].write("world")
+    assert not dispatcher._needs_to_run(task)
+
+    task.input["input"].write("Taipy")
+    assert dispatcher._needs_to_run(task)
+
+
+def test_job_records_the_fingerprint_of_the_written_output():
+    input_cfg = Config.configure_in_memory_data_node("input", default_data="world", fingerprint=True)
+    output_cfg = Config.configure_in_memory_data_node("output", fingerprint=True)
+    task_cfg = Config.configure_task("name", greet, [input_cfg], [output_cfg], skippable=True)
+    task = _create_task_from_config(task_cfg)
+
+    with mock.patch.object(DataNode, "_compute_fingerprint", autospec=True) as mck:
+        taipy.submit(task)
+        mck.assert_not_called()
+
+    output = task.output["output"]
+    assert output.read() == "Hello world!"
+    assert output.edits[-1]["fingerprint"] == output._compute_data_fingerprint("Hello world!")
+
+
+def test_need_to_run_skippable_task_with_input_without_fingerprint():
+    input_cfg = Config.configure_pickle_data_node("input", default_data="world")
+    output_cfg = Config.configure_pickle_data_node("output")
+    task_cfg = Config.configure_task("name", greet, [input_cfg], [output_cfg], skippable=True)
+    task = _create_task_from_config(task_cfg)
+    dispatcher = _JobDispatcher(_OrchestratorFactory._build_orchestrator())
+
+    taipy.submit(task)
+    assert "input_fingerprints" not in task.output["output"].edits[-1]
+    assert not dispatcher._needs_to_run(task)
+
+    task.input["input"].write("world")  # the last edit dates are compared
+    assert dispatcher._needs_to_run(task)
@@ -9,12 +9,19 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 import traceback
+from unittest import mock
 
 from taipy import Job, JobId, Scope, Status, Task
 from taipy.core._orchestrator._dispatcher import _JobDispatcher
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
-from taipy.core.data import InMemoryDataNode
-from taipy.core.data.data_node_id import EDIT_JOB_ID_KEY, EDIT_TIMESTAMP_KEY
+from taipy.core.data import InMemoryDataNode, PickleDataNode
+from taipy.core.data.data_node import DataNode
+from taipy.core.data.data_node_id import (
+    EDIT_FINGERPRINT_KEY,
+    EDIT_INPUT_FINGERPRINTS_KEY,
+    EDIT_JOB_ID_KEY,
+    EDIT_TIMESTAMP_KEY,
+)
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 
@@ -47,6 +54,26 @@ def test_update_job_status_no_exception():
     assert not output.edit_in_progress
 
 
+def test_update_job_status_records_output_fingerprints_without_computing_them():
+    output = PickleDataNode("data_node", scope=Scope.SCENARIO, properties={"fingerprint": True})
+    output._write(42)
+    other_output = PickleDataNode("other_data_node", scope=Scope.SCENARIO, properties={"fingerprint": True})
+    other_output._write(43)
+    task = Task("config_id", {}, nothing, output=[output, other_output])
+    _TaskManagerFactory._build_manager()._set(task)
+    job = Job(JobId("id"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+
+    with mock.patch.object(DataNode, "_compute_fingerprint") as mck:
+        _JobDispatcher(_OrchestratorFactory._orchestrator)._update_job_status(job, [], {output.id: "fingerprint"})
+        mck.assert_not_called()
+
+    assert job.status == Status.COMPLETED
+    assert output.edits[-1][EDIT_FINGERPRINT_KEY] == "fingerprint"
+    assert EDIT_FINGERPRINT_KEY not in other_output.edits[-1]
+    assert EDIT_INPUT_FINGERPRINTS_KEY not in output.edits[-1]
+
+
 def test_update_job_status_with_one_exception():
     task = Task("config_id", {}, nothing)
     _TaskManagerFactory._build_manager()._set(task)
@@ -22,7 +22,10 @@ from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.job.job import Job
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 from taipy.core.task.task import Task
-from tests.core._orchestrator._dispatcher.mock_standalone_dispatcher import MockStandaloneDispatcher
+from tests.core._orchestrator._dispatcher.mock_standalone_dispatcher import (
+    MockProcessPoolExecutor,
+    MockStandaloneDispatcher,
+)
 from tests.core.utils import assert_true_after_time
 
 
@@ -68,8 +71,10 @@ def test_dispatch_job():
     submit_first_call = dispatcher._executor.submit_called[0]
     assert submit_first_call[0].job_id == job.id
     assert submit_first_call[0].task == task
+    assert submit_first_call[0].by_id
     assert submit_first_call[1] == ()
-    assert submit_first_call[2]["config_as_string"] == _TomlSerializer()._serialize(Config._applied_config)
+    # The workers received the configuration when they started
+    assert submit_first_call[2] == {"config_generation": dispatcher._workers_config_generation}
 
     # test that the job status is updated after execution on future
     assert len(dispatcher.update_job_status_from_future_calls) == 1
@@ -77,6 +82,49 @@ def test_dispatch_job():
     assert dispatcher.update_job_status_from_future_calls[0][1] == dispatcher._executor.f[0]
 
 
+def test_config_is_serialized_once_per_generation():
+    dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._build_orchestrator())
+    generation, config_as_string = dispatcher._get_config_payload()
+    assert dispatcher._workers_config_generation == generation
+    assert config_as_string == _TomlSerializer()._serialize(Config._applied_config)
+
+    with mock.patch.object(_TomlSerializer, "_serialize") as mck:
+        assert dispatcher._get_config_payload() == (generation, config_as_string)
+        mck.assert_not_called()
+
+    Config.unblock_update()
+    Config.configure_data_node("new_dn")
+    new_generation, new_config_as_string = dispatcher._get_config_payload()
+    assert new_generation != generation
+    assert "new_dn" in new_config_as_string
+
+
+def test_workers_are_restarted_when_config_is_updated():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    dispatcher = MockStandaloneDispatcher(_OrchestratorFactory._build_orchestrator())
+    executor = dispatcher._executor
+    generation = dispatcher._workers_config_generation
+
+    dispatcher._dispatch(job)
+    dispatcher._dispatch(job)
+    assert dispatcher._executor is executor
+    assert [call[2] for call in executor.submit_called] == [{"config_generation": generation}] * 2
+
+    Config.unblock_update()
+    Config.configure_data_node("new_dn")
+    with mock.patch.object(MockProcessPoolExecutor, "shutdown") as shutdown:
+        dispatcher._dispatch(job)
+        dispatcher._dispatch(job)
+        shutdown.assert_called_once_with(wait=False)
+    assert dispatcher._executor is not executor
+    assert dispatcher._workers_config_generation != generation
+    # The configuration is sent once, to the new workers, rather than with the jobs
+    new_generation = dispatcher._workers_config_generation
+    assert len(executor.submit_called) == 2
+    assert [call[2] for call in dispatcher._executor.submit_called] == [{"config_generation": new_generation}] * 2
+
+
 def test_can_execute():
     dispatcher = _StandaloneJobDispatcher(_OrchestratorFactory._orchestrator)
     assert dispatcher._nb_available_workers == 2
@@ -95,7 +143,7 @@ def test_update_job_status_from_future():
     orchestrator = _OrchestratorFactory._build_orchestrator()
     dispatcher = _StandaloneJobDispatcher(orchestrator)
     ft = Future()
-    ft.set_result(None)
+    ft.set_result(([], {}))
     assert dispatcher._nb_available_workers == 2
     dispatcher._update_job_status_from_future(job, ft)
     assert dispatcher._nb_available_workers == 3
@@ -124,3 +172,21 @@ def test_run():
         assert_true_after_time(lambda: mck.call_count == 4, time=5, msg="The 4 jobs were not dequeued.")
         dispatcher.stop()
         mck.assert_has_calls([call(job_1), call(job_2), call(job_3), call(job_4)])
+
+
+def test_run_is_woken_up_by_notifications():
+    task = create_task()
+    job = Job(JobId("job"), task, "s_id", task.id)
+    _JobManagerFactory._build_manager()._set(job)
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+
+    with mock.patch("taipy.core._orchestrator._dispatcher._job_dispatcher._JobDispatcher._execute_job") as mck:
+        dispatcher = _StandaloneJobDispatcher(orchestrator)
+        dispatcher._MAX_WAITING_TIME = 60
+        dispatcher.start()
+        orchestrator.jobs_to_run.put(job)
+        orchestrator._notify_dispatcher()
+        assert_true_after_time(lambda: mck.call_count == 1, time=5, msg="The job was not dequeued.")
+
+        dispatcher.stop(timeout=5)
+        assert not dispatcher.is_running()
@@ -9,15 +9,21 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import pickle
 import random
 import string
+from unittest import mock
 
 from taipy.common.config import Config
 from taipy.common.config._serializer._toml_serializer import _TomlSerializer
 from taipy.common.config.common.scope import Scope
 from taipy.common.config.exceptions import ConfigurationUpdateBlocked
+from taipy.core._orchestrator._dispatcher._standalone_job_dispatcher import _initialize_worker
 from taipy.core._orchestrator._dispatcher._task_function_wrapper import _TaskFunctionWrapper
 from taipy.core.data._data_manager import _DataManager
+from taipy.core.data.pickle import PickleDataNode
+from taipy.core.exceptions import NonExistingTask
+from taipy.core.task._task_manager import _TaskManager
 from taipy.core.task.task import Task
 
 
@@ -92,7 +98,7 @@ def test_data_node_not_written_due_to_wrong_result_nb():
 
     task_expecting_3_outputs = _create_task(fct_2_outputs, 3)
 
-    exceptions = _TaskFunctionWrapper("job_id", task_expecting_3_outputs).execute()
+    exceptions, _ = _TaskFunctionWrapper("job_id", task_expecting_3_outputs).execute()
 
     assert len(exceptions) == 1
     assert isinstance(exceptions[0], Exception)
@@ -107,7 +113,7 @@ def test_cannot_exec_task_that_update_config():
 
     task_updating_cfg = _create_task(update_config_fct)
     cfg_as_str = _TomlSerializer()._serialize(Config._applied_config)
-    res = _TaskFunctionWrapper("job_id", task_updating_cfg).execute(config_as_string=cfg_as_str)
+    res, _ = _TaskFunctionWrapper("job_id", task_updating_cfg).execute(config_as_string=cfg_as_str)
 
     assert len(res) == 1
     assert isinstance(res[0], ConfigurationUpdateBlocked)
@@ -125,6 +131,104 @@ def test_can_execute_task_with_a_modified_config():
 
     task_asserting_cfg_is_correct = _create_task(assert_config_is_correct_after_serialization)
     cfg_as_str = _TomlSerializer()._serialize(Config._applied_config)
-    res = _TaskFunctionWrapper("job_id", task_asserting_cfg_is_correct).execute(config_as_string=cfg_as_str)
+    res, _ = _TaskFunctionWrapper("job_id", task_asserting_cfg_is_correct).execute(config_as_string=cfg_as_str)
 
     assert len(res) == 0  # no exception raised so the asserts in the fct passed
+
+
+def test_config_is_applied_once_per_generation():
+    task = _create_task(multiply)
+    cfg_as_str = _TomlSerializer()._serialize(Config._applied_config)
+
+    with mock.patch.object(_TomlSerializer, "_deserialize", wraps=_TomlSerializer()._deserialize) as mck:
+        _TaskFunctionWrapper("job_id_1", task).execute(config_as_string=cfg_as_str, config_generation="generation_1")
+        _TaskFunctionWrapper("job_id_2", task).execute(config_as_string=cfg_as_str, config_generation="generation_1")
+        assert mck.call_count == 1
+
+        _TaskFunctionWrapper("job_id_3", task).execute(config_as_string=cfg_as_str, config_generation="generation_2")
+        assert mck.call_count == 2
+
+        # Jobs carrying only the generation of the applied configuration do not apply it again
+        _TaskFunctionWrapper("job_id_4", task).execute(config_generation="generation_2")
+        assert mck.call_count == 2
+    assert _TaskFunctionWrapper._applied_config_generation == "generation_2"
+
+
+def test_task_is_resolved_from_its_id_once_sent_to_another_process():
+    task = _create_task(multiply)
+    _TaskManager._set(task)
+
+    wrapper = pickle.loads(pickle.dumps(_TaskFunctionWrapper("job_id", task, by_id=True)))
+    assert wrapper.task_id == task.id
+    assert wrapper.task is None
+
+    with mock.patch.object(_TaskManager, "_get", wraps=_TaskManager._get) as mck:
+        wrapper.execute()
+        pickle.loads(pickle.dumps(_TaskFunctionWrapper("other_job_id", task, by_id=True))).execute()
+        # The task is resolved once, then kept in the cache of the process
+        assert [c.args[0] for c in mck.call_args_list].count(task.id) == 1
+    assert wrapper.task == task
+    assert _DataManager._get(task.output[f"{task.config_id}_output0"].id).read() == 42
+
+
+def test_execute_task_that_does_not_exist():
+    task = _create_task(multiply)
+    wrapper = pickle.loads(pickle.dumps(_TaskFunctionWrapper("job_id", task, by_id=True)))
+
+    errors, _ = wrapper.execute()
+    assert len(errors) == 1
+    assert isinstance(errors[0], NonExistingTask)
+
+
+def test_task_is_sent_to_another_process_if_not_resolved_by_id():
+    task = _create_task(multiply)
+
+    wrapper = pickle.loads(pickle.dumps(_TaskFunctionWrapper("job_id", task)))
+    assert wrapper.task == task
+    assert wrapper.execute() == ([], {})
+
+
+def test_outputs_kept_in_memory_are_read_by_next_jobs():
+    Config.configure_job_executions(keep_outputs_in_memory=True)
+    result = {"a": [1, 2, 3]}
+    task_1 = _create_task(lambda nb1, nb2: result)
+    intermediate_dn = list(task_1.output.values())[0]
+    task_2 = Task("task_2", {}, function=lambda data: data, input=[intermediate_dn], output=[])
+
+    assert _TaskFunctionWrapper("job_1", task_1).execute() == ([], {})
+    intermediate_dn.track_edit(job_id="job_1")
+    with mock.patch.object(PickleDataNode, "_read") as mck:
+        assert _TaskFunctionWrapper("job_2", task_2)._read_inputs([intermediate_dn])[0] is result
+        mck.assert_not_called()
+
+    # Once the data node is edited by another job or editor, its data is read again
+    intermediate_dn.write({"b": 1})
+    assert _TaskFunctionWrapper("job_3", task_2)._read_inputs([intermediate_dn]) == [{"b": 1}]
+
+
+def test_outputs_are_not_kept_in_memory_by_default():
+    task_1 = _create_task(multiply)
+    output_dn = list(task_1.output.values())[0]
+    task_2 = Task("task_2", {}, function=lambda data: data, input=[output_dn], output=[])
+
+    assert _TaskFunctionWrapper("job_1", task_1).execute() == ([], {})
+    output_dn.track_edit(job_id="job_1")
+    with mock.patch.object(PickleDataNode, "_read", return_value=42) as mck:
+        assert _TaskFunctionWrapper("job_2", task_2)._read_inputs([output_dn]) == [42]
+        mck.assert_called_once()
+
+
+def test_error_applying_config_in_worker_initializer_is_raised_by_each_job():
+    task = _create_task(multiply)
+
+    with mock.patch.object(_TaskFunctionWrapper, "_config_error", None), mock.patch.object(
+        _TaskFunctionWrapper, "_apply_config", side_effect=ImportError("No module named 'missing'")
+    ):
+        # The initializer does not raise, which would break the whole pool of workers
+        _initialize_worker("config_as_string", "generation", None)
+
+        for job_id in ["job_id_1", "job_id_2"]:
+            errors, _ = _TaskFunctionWrapper(job_id, task).execute(config_generation="generation")
+            assert len(errors) == 1
+            assert isinstance(errors[0], ImportError)
+        assert _DataManager._get(task.output[f"{task.config_id}_output0"].id).read() == 0
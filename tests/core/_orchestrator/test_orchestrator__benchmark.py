@@ -0,0 +1,52 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.core._orchestrator._orchestrator import _Orchestrator
+from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core.config.job_config import JobConfig
+from taipy.core.scenario._scenario_manager import _ScenarioManager
+from taipy.core.submission.submission_status import SubmissionStatus
+
+NB_TASKS = 100
+
+
+def increment(n):
+    return n + 1
+
+
+@pytest.mark.benchmark
+@pytest.mark.standalone
+def test_submit_linear_scenario(benchmark_report):
+    Config.configure_job_executions(mode=JobConfig._STANDALONE_MODE, max_nb_of_workers=2)
+    dn_configs = [Config.configure_data_node(f"dn_{i}", default_data=0) for i in range(NB_TASKS + 1)]
+    task_configs = [
+        Config.configure_task(f"task_{i}", increment, dn_configs[i], dn_configs[i + 1], skippable=False)
+        for i in range(NB_TASKS)
+    ]
+    scenario = _ScenarioManager._create(Config.configure_scenario("linear", task_configs))
+    _OrchestratorFactory._build_dispatcher(force_restart=True)
+
+    # A first submission starts the workers.
+    _Orchestrator.submit(scenario, wait=True)
+
+    start = time.perf_counter()
+    submission = _Orchestrator.submit(scenario, wait=True)
+    wall_time = time.perf_counter() - start
+
+    assert submission.submission_status == SubmissionStatus.COMPLETED
+    assert scenario.data_nodes[f"dn_{NB_TASKS}"].read() == NB_TASKS
+    benchmark_report("wall_time", wall_time)
+    benchmark_report("wall_time_per_task", wall_time / NB_TASKS)
@@ -13,6 +13,7 @@ from typing import cast
 from taipy import Job, JobId, Status
 from taipy.common.config import Config
 from taipy.core import taipy
+from taipy.core._orchestrator._dispatcher import _JobDispatcher
 from taipy.core._orchestrator._orchestrator import _Orchestrator
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
 from taipy.core.job._job_manager_factory import _JobManagerFactory
@@ -83,6 +84,24 @@ def test_cancel_job_with_subsequent_blocked_jobs():
     assert orchestrator.blocked_jobs == []
 
 
+def test_cancel_job_discards_input_fingerprints():
+    scenario = create_scenario()
+    orchestrator = cast(_Orchestrator, _OrchestratorFactory._build_orchestrator())
+    job1 = orchestrator._lock_dn_output_and_create_job(scenario.t1, "s_id", "e_id")
+    job2 = orchestrator._lock_dn_output_and_create_job(scenario.t2, "s_id", "e_id")
+    job1.pending()
+    job2.blocked()
+    orchestrator.blocked_jobs = [job2]
+    input_fingerprints = _JobDispatcher._JobDispatcher__input_fingerprints  # type: ignore[attr-defined]
+    input_fingerprints[job1.id] = {scenario.dn_0.id: "fingerprint"}
+    input_fingerprints[job2.id] = {scenario.dn_1.id: "fingerprint"}
+
+    orchestrator.cancel_job(job1)
+
+    assert job1.id not in input_fingerprints
+    assert job2.id not in input_fingerprints
+
+
 def test_cancel_job_with_subsequent_jobs_and_parallel_jobs():
     scenario = create_scenario()
     orchestrator = _OrchestratorFactory._build_orchestrator()
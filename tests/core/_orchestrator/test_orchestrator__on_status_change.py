@@ -162,3 +162,73 @@ def test_on_status_change_on_failed_job():
     assert j3.is_blocked()
     assert len(orchestrator.blocked_jobs) == 1
     assert orchestrator.jobs_to_run.qsize() == 0
+
+
+def test_on_status_change_only_checks_jobs_waiting_for_outputs_of_completed_job():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    scenario = create_scenario()
+    j1 = create_job_from_task("j1", scenario.t1)
+    j2 = create_job_from_task("j2", scenario.t2)
+    j3 = create_job_from_task("j3", scenario.t3)
+    scenario.dn_0.write(0)
+    scenario.dn_0.lock_edit()
+    orchestrator._orchestrate_job_to_run_or_block([j1, j2, j3])
+    assert orchestrator.blocked_jobs == [j1, j2, j3]
+    assert orchestrator._awaited_data_nodes == {
+        j1.id: {scenario.dn_0.id},
+        j2.id: {scenario.dn_1.id},
+        j3.id: {scenario.dn_0.id},
+    }
+
+    with mock.patch("taipy.core._orchestrator._orchestrator._Orchestrator._is_blocked") as mck:
+        mck.return_value = False
+        # j1 completes without unlocking dn_0: only j2 is checked and unblocked
+        scenario.dn_1.write(1)
+        j1.status = Status.COMPLETED
+        orchestrator._on_status_change(j1)
+
+        mck.assert_called_once_with(j2)
+        assert orchestrator.blocked_jobs == [j1, j3]
+        assert j2.is_pending()
+        assert orchestrator.jobs_to_run.get() == j2
+        assert orchestrator._awaited_data_nodes == {j1.id: {scenario.dn_0.id}, j3.id: {scenario.dn_0.id}}
+
+        # j2 does not output any data node awaited by the blocked jobs
+        mck.reset_mock()
+        scenario.dn_2.write(2)
+        j2.status = Status.COMPLETED
+        orchestrator._on_status_change(j2)
+
+        mck.assert_not_called()
+        assert orchestrator.blocked_jobs == [j1, j3]
+        assert orchestrator.jobs_to_run.qsize() == 0
+
+
+def test_on_status_change_keeps_blocked_job_whose_other_input_has_been_locked():
+    orchestrator = _OrchestratorFactory._build_orchestrator()
+    # dn_0 --> t1 --> dn_1 --\
+    #                          --> t2 --> dn_3
+    #                  dn_2 --/
+    dn_0_cfg = Config.configure_pickle_data_node("dn_0", default_data=0)
+    dn_1_cfg = Config.configure_pickle_data_node("dn_1")
+    dn_2_cfg = Config.configure_pickle_data_node("dn_2", default_data=2)
+    dn_3_cfg = Config.configure_pickle_data_node("dn_3")
+    t1_cfg = Config.configure_task("t1", nothing, [dn_0_cfg], [dn_1_cfg])
+    t2_cfg = Config.configure_task("t2", nothing, [dn_1_cfg, dn_2_cfg], [dn_3_cfg])
+    scenario = taipy.create_scenario(Config.configure_scenario("scenario_cfg", [t1_cfg, t2_cfg]))
+    j1 = create_job_from_task("j1", scenario.t1)
+    j2 = create_job_from_task("j2", scenario.t2)
+    orchestrator._orchestrate_job_to_run_or_block([j2])
+    assert orchestrator.blocked_jobs == [j2]
+    assert orchestrator._awaited_data_nodes == {j2.id: {scenario.dn_1.id}}
+
+    # dn_2 is locked by another submission before dn_1 is written
+    scenario.dn_2.lock_edit()
+    scenario.dn_1.write(1)
+    j1.status = Status.COMPLETED
+    orchestrator._on_status_change(j1)
+
+    assert orchestrator.blocked_jobs == [j2]
+    assert j2.is_blocked()
+    assert orchestrator.jobs_to_run.qsize() == 0
+    assert orchestrator._awaited_data_nodes == {j2.id: {scenario.dn_2.id}}
@@ -15,26 +15,30 @@ import pytest
 
 from taipy.core._version._version import _Version
 from taipy.core._version._version_fs_repository import _VersionFSRepository
+from taipy.core._version._version_sqlite_repository import _VersionSQLiteRepository
 from taipy.core.exceptions import ModelNotFound
 
 
-class TestVersionFSRepository:
-    def test_save_and_load(self, _version):
-        repository = _VersionFSRepository()
+class TestVersionRepository:
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_save_and_load(self, _version, repo):
+        repository = repo()
         repository._save(_version)
 
         obj = repository._load(_version.id)
         assert isinstance(obj, _Version)
 
-    def test_exists(self, _version):
-        repository = _VersionFSRepository()
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_exists(self, _version, repo):
+        repository = repo()
         repository._save(_version)
 
         assert repository._exists(_version.id)
         assert not repository._exists("not-existed-version")
 
-    def test_load_all(self, _version):
-        repository = _VersionFSRepository()
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_load_all(self, _version, repo):
+        repository = repo()
         for i in range(10):
             _version.id = f"_version_{i}"
             repository._save(_version)
@@ -42,8 +46,9 @@ class TestVersionFSRepository:
 
         assert len(data_nodes) == 10
 
-    def test_load_all_with_filters(self, _version):
-        repository = _VersionFSRepository()
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_load_all_with_filters(self, _version, repo):
+        repository = repo()
 
         for i in range(10):
             _version.id = f"_version_{i}"
@@ -53,8 +58,9 @@ class TestVersionFSRepository:
 
         assert len(objs) == 1
 
-    def test_delete(self, _version):
-        repository = _VersionFSRepository()
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_delete(self, _version, repo):
+        repository = repo()
         repository._save(_version)
 
         repository._delete(_version.id)
@@ -62,8 +68,9 @@ class TestVersionFSRepository:
         with pytest.raises(ModelNotFound):
             repository._load(_version.id)
 
-    def test_delete_all(self, _version):
-        repository = _VersionFSRepository()
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_delete_all(self, _version, repo):
+        repository = repo()
 
         for i in range(10):
             _version.id = f"_version_{i}"
@@ -75,8 +82,9 @@ class TestVersionFSRepository:
 
         assert len(repository._load_all()) == 0
 
-    def test_delete_many(self, _version):
-        repository = _VersionFSRepository()
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_delete_many(self, _version, repo):
+        repository = repo()
 
         for i in range(10):
             _version.id = f"_version_{i}"
@@ -89,8 +97,9 @@ class TestVersionFSRepository:
 
         assert len(repository._load_all()) == 7
 
-    def test_search(self, _version):
-        repository = _VersionFSRepository()
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_search(self, _version, repo):
+        repository = repo()
 
         for i in range(10):
             _version.id = f"_version_{i}"
@@ -103,11 +112,40 @@ class TestVersionFSRepository:
         assert len(objs) == 1
         assert isinstance(objs[0], _Version)
 
-    def test_export(self, tmpdir, _version):
-        repository = _VersionFSRepository()
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_set_and_get_latest_and_development_versions(self, repo):
+        repository = repo()
+
+        repository._set_latest_version("1.0")
+        assert repository._get_latest_version() == "1.0"
+
+        repository._set_development_version("dev")
+        assert repository._get_latest_version() == "dev"
+        assert repository._get_development_version() == "dev"
+
+        repository._set_latest_version("2.0")
+        assert repository._get_latest_version() == "2.0"
+        assert repository._get_development_version() == "dev"
+
+    def test_delete_all_deletes_sqlite_version_settings(self, _version):
+        repository = _VersionSQLiteRepository()
+        repository._save(_version)
+        repository._set_development_version("dev")
+
+        repository._delete_all()
+
+        assert len(repository._load_all()) == 0
+        with pytest.raises(ModelNotFound):
+            repository._get_latest_version()
+        with pytest.raises(ModelNotFound):
+            repository._get_development_version()
+
+    @pytest.mark.parametrize("repo", [_VersionFSRepository, _VersionSQLiteRepository])
+    def test_export(self, tmpdir, _version, repo):
+        repository = repo()
         repository._save(_version)
 
         repository._export(_version.id, tmpdir.strpath)
-        dir_path = repository.dir_path
+        dir_path = repository.dir_path if repo == _VersionFSRepository else os.path.join(tmpdir.strpath, "version")
 
         assert os.path.exists(os.path.join(dir_path, f"{_version.id}.json"))
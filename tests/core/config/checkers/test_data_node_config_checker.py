@@ -130,7 +130,7 @@ class TestDataNodeConfigChecker:
         assert len(Config._collector.errors) == 1
         expected_error_message = (
             "`storage_type` field of DataNodeConfig `new` must be either csv, sql_table,"
-            " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, or in_memory."
+            " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, numpy, or in_memory."
             ' Current value of property `storage_type` is "bar".'
         )
         assert expected_error_message in caplog.text
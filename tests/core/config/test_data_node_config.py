@@ -132,7 +132,7 @@ def test_data_node_config_check(caplog):
         Config.check()
     expected_error_message = (
         "`storage_type` field of DataNodeConfig `data_nodes` must be either csv, sql_table,"
-        " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, or in_memory. Current"
+        " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, numpy, or in_memory. Current"
         ' value of property `storage_type` is "bar".'
     )
     assert expected_error_message in caplog.text
@@ -154,7 +154,7 @@ def test_data_node_config_check(caplog):
         Config.check()
     expected_error_message = (
         "`storage_type` field of DataNodeConfig `data_nodes` must be either csv, sql_table,"
-        " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, or in_memory."
+        " sql, mongo_collection, pickle, excel, generic, json, parquet, s3_object, numpy, or in_memory."
         ' Current value of property `storage_type` is "bar".'
     )
     assert expected_error_message in caplog.text
@@ -216,6 +216,37 @@ def test_configure_data_node_from_another_configuration():
     assert d3_cfg.foo == "baz"
 
 
+def test_configure_sql_data_node_pool_options():
+    sql_table_cfg = Config.configure_sql_table_data_node(
+        "sql_table", db_name="db", db_engine="sqlite", table_name="foo", db_pool_size=5, db_pool_pre_ping=True
+    )
+    assert sql_table_cfg.db_pool_size == 5
+    assert sql_table_cfg.db_pool_pre_ping is True
+
+    sql_cfg = Config.configure_sql_data_node(
+        "sql", db_name="db", db_engine="sqlite", read_query="SELECT * FROM foo", write_query_builder=print
+    )
+    assert "db_pool_size" not in sql_cfg.properties
+    assert "db_pool_pre_ping" not in sql_cfg.properties
+
+
+def test_configure_csv_data_node_parser_options():
+    csv_cfg = Config.configure_csv_data_node("csv", engine="pyarrow", dtype={"foo": "int64"})
+    assert csv_cfg.engine == "pyarrow"
+    assert csv_cfg.dtype == {"foo": "int64"}
+
+
+def test_configure_numpy_data_node():
+    numpy_cfg = Config.configure_numpy_data_node("numpy", default_path="foo.npy")
+    assert numpy_cfg.storage_type == "numpy"
+    assert numpy_cfg.default_path == "foo.npy"
+    assert numpy_cfg.mmap_mode == "r"
+
+    numpy_cfg = Config.configure_data_node("not_mapped", "numpy", mmap_mode=None)
+    assert numpy_cfg.storage_type == "numpy"
+    assert numpy_cfg.mmap_mode is None
+
+
 def test_data_node_count():
     Config.configure_data_node("data_nodes1", "pickle")
     assert len(Config.data_nodes) == 2
@@ -26,6 +26,17 @@ def test_job_config():
     assert Config.job_config.foo == "bar"
 
 
+def test_keep_outputs_in_memory(monkeypatch):
+    assert not Config.job_config.keep_outputs_in_memory
+
+    Config.configure_job_executions(keep_outputs_in_memory=True)
+    assert Config.job_config.keep_outputs_in_memory
+
+    monkeypatch.setenv("KEEP_OUTPUTS", "false")
+    Config.configure_job_executions(keep_outputs_in_memory="ENV[KEEP_OUTPUTS]")
+    assert not Config.job_config.keep_outputs_in_memory
+
+
 def test_clean_config():
     job_config = Config.configure_job_executions(mode="standalone", max_nb_of_workers=3, prop="foo")
 
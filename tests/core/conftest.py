@@ -26,6 +26,8 @@ from taipy.common.config.checker._checker import _Checker
 from taipy.common.config.common.frequency import Frequency
 from taipy.common.config.common.scope import Scope
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core._repository._sqlite_connection import _SQLiteConnection
+from taipy.core._repository._sqlite_repository import _SQLiteRepository
 from taipy.core._version._version import _Version
 from taipy.core._version._version_manager_factory import _VersionManagerFactory
 from taipy.core.config import (
@@ -320,9 +322,12 @@ def cleanup_files():
 
 
 @pytest.fixture(scope="function", autouse=True)
-def clean_repository(init_config, init_managers, init_orchestrator, init_notifier, clean_argparser):
+def clean_repository(
+    init_config, init_managers, init_orchestrator, init_notifier, clean_argparser, clean_sqlite_repositories
+):
     clean_argparser()
     close_all_sessions()
+    clean_sqlite_repositories()
     init_config()
     init_orchestrator()
     init_managers()
@@ -334,12 +339,25 @@ def clean_repository(init_config, init_managers, init_orchestrator, init_notifie
 
     clean_argparser()
     close_all_sessions()
+    clean_sqlite_repositories()
     init_orchestrator()
     init_managers()
     init_config()
     init_notifier()
 
 
+@pytest.fixture
+def clean_sqlite_repositories():
+    def _clean_sqlite_repositories():
+        _SQLiteConnection._close_all()
+        db_path = os.path.join(Config.core.taipy_storage_folder, _SQLiteRepository._DEFAULT_DB_FILE_NAME)
+        for suffix in ["", "-wal", "-shm"]:
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    return _clean_sqlite_repositories
+
+
 @pytest.fixture
 def init_config(reset_configuration_singleton, inject_core_sections):
     def _init_config():
@@ -385,6 +403,8 @@ def init_orchestrator():
         _OrchestratorFactory._build_dispatcher(force_restart=True)
         _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
         _OrchestratorFactory._orchestrator.blocked_jobs = []
+        _OrchestratorFactory._orchestrator._awaited_data_nodes = {}
+        _OrchestratorFactory._orchestrator._awaiting_jobs = {}
 
     return _init_orchestrator
 
@@ -393,6 +413,7 @@ def init_orchestrator():
 def init_notifier():
     def _init_notifier():
         Notifier._topics_registrations_list = {}
+        Notifier._topics_index = {}
 
     return _init_notifier
 
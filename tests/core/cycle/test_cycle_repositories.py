@@ -14,13 +14,15 @@ import os
 import pytest
 
 from taipy.core.cycle._cycle_fs_repository import _CycleFSRepository
+from taipy.core.cycle._cycle_sqlite_repository import _CycleSQLiteRepository
 from taipy.core.cycle.cycle import Cycle, CycleId
 from taipy.core.exceptions import ModelNotFound
 
 
 class TestCycleRepositories:
-    def test_save_and_load(self, cycle: Cycle):
-        repository = _CycleFSRepository()
+    @pytest.mark.parametrize("repo", [_CycleFSRepository, _CycleSQLiteRepository])
+    def test_save_and_load(self, cycle: Cycle, repo):
+        repository = repo()
         repository._save(cycle)
 
         loaded_cycle = repository._load(cycle.id)
@@ -33,15 +35,17 @@ class TestCycleRepositories:
         assert cycle.id == loaded_cycle.id
         assert cycle._properties == loaded_cycle._properties
 
-    def test_exists(self, cycle):
-        repository = _CycleFSRepository()
+    @pytest.mark.parametrize("repo", [_CycleFSRepository, _CycleSQLiteRepository])
+    def test_exists(self, cycle, repo):
+        repository = repo()
         repository._save(cycle)
 
         assert repository._exists(cycle.id)
         assert not repository._exists("not-existed-cycle")
 
-    def test_load_all(self, cycle):
-        repository = _CycleFSRepository()
+    @pytest.mark.parametrize("repo", [_CycleFSRepository, _CycleSQLiteRepository])
+    def test_load_all(self, cycle, repo):
+        repository = repo()
         for i in range(10):
             cycle.id = CycleId(f"cycle-{i}")
             repository._save(cycle)
@@ -49,8 +53,9 @@ class TestCycleRepositories:
 
         assert len(data_nodes) == 10
 
-    def test_load_all_with_filters(self, cycle):
-        repository = _CycleFSRepository()
+    @pytest.mark.parametrize("repo", [_CycleFSRepository, _CycleSQLiteRepository])
+    def test_load_all_with_filters(self, cycle, repo):
+        repository = repo()
 
         for i in range(10):
             cycle.id = CycleId(f"cycle-{i}")
@@ -60,8 +65,9 @@ class TestCycleRepositories:
 
         assert len(objs) == 1
 
-    def test_delete(self, cycle):
-        repository = _CycleFSRepository()
+    @pytest.mark.parametrize("repo", [_CycleFSRepository, _CycleSQLiteRepository])
+    def test_delete(self, cycle, repo):
+        repository = repo()
         repository._save(cycle)
 
         repository._delete(cycle.id)
@@ -69,8 +75,9 @@ class TestCycleRepositories:
         with pytest.raises(ModelNotFound):
             repository._load(cycle.id)
 
-    def test_delete_all(self, cycle):
-        repository = _CycleFSRepository()
+    @pytest.mark.parametrize("repo", [_CycleFSRepository, _CycleSQLiteRepository])
+    def test_delete_all(self, cycle, repo):
+        repository = repo()
 
         for i in range(10):
             cycle.id = CycleId(f"cycle-{i}")
@@ -82,8 +89,9 @@ class TestCycleRepositories:
 
         assert len(repository._load_all()) == 0
 
-    def test_delete_many(self, cycle):
-        repository = _CycleFSRepository()
+    @pytest.mark.parametrize("repo", [_CycleFSRepository, _CycleSQLiteRepository])
+    def test_delete_many(self, cycle, repo):
+        repository = repo()
 
         for i in range(10):
             cycle.id = CycleId(f"cycle-{i}")
@@ -96,8 +104,9 @@ class TestCycleRepositories:
 
         assert len(repository._load_all()) == 7
 
-    def test_search(self, cycle):
-        repository = _CycleFSRepository()
+    @pytest.mark.parametrize("repo", [_CycleFSRepository, _CycleSQLiteRepository])
+    def test_search(self, cycle, repo):
+        repository = repo()
 
         for i in range(10):
             cycle.id = CycleId(f"cycle-{i}")
@@ -110,10 +119,11 @@ class TestCycleRepositories:
         assert len(objs) == 1
         assert isinstance(objs[0], Cycle)
 
-    def test_export(self, tmpdir, cycle):
-        repository = _CycleFSRepository()
+    @pytest.mark.parametrize("repo", [_CycleFSRepository, _CycleSQLiteRepository])
+    def test_export(self, tmpdir, cycle, repo):
+        repository = repo()
         repository._save(cycle)
 
         repository._export(cycle.id, tmpdir.strpath)
-        dir_path = repository.dir_path
+        dir_path = repository.dir_path if repo == _CycleFSRepository else os.path.join(tmpdir.strpath, "cycle")
         assert os.path.exists(os.path.join(dir_path, f"{cycle.id}.json"))
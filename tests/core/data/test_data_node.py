@@ -28,6 +28,7 @@ from taipy.core.data.data_node import DataNode
 from taipy.core.data.data_node_id import (
     EDIT_COMMENT_KEY,
     EDIT_EDITOR_ID_KEY,
+    EDIT_FINGERPRINT_KEY,
     EDIT_JOB_ID_KEY,
     EDIT_TIMESTAMP_KEY,
     DataNodeId,
@@ -189,6 +190,30 @@ class TestDataNode:
         assert dn.is_ready_for_reading
         assert dn.job_ids == [job_id]
 
+    def test_write_records_the_fingerprint_of_the_written_data(self):
+        dn = FakeDataNode("foo_bar", fingerprint=True)
+
+        dn.write({"a": 1, "b": [1, 2]})
+        dn.write({"b": [1, 2], "a": 1})
+        dn.write(pd.DataFrame({"a": [1, 2], "b": [3.0, 4.0]}))
+        dn.write(pd.DataFrame([[1, 3.0], [2, 4.0]], columns=["a", "b"]).astype({"a": "int64"}))
+        dn.write(pd.DataFrame({"a": [1, 2], "b": [3.0, 5.0]}))
+
+        fingerprints = [edit[EDIT_FINGERPRINT_KEY] for edit in dn.edits]
+        assert fingerprints[0] == fingerprints[1]
+        assert fingerprints[2] == fingerprints[3]
+        assert len({fingerprints[0], fingerprints[2], fingerprints[4]}) == 3
+        # The written data is hashed, the data node is not read again
+        assert dn.read_has_been_called == 0
+
+    def test_track_edit_does_not_read_data_node_not_stored_in_files(self):
+        dn = FakeDataNode("foo_bar", fingerprint=True)
+
+        dn.track_edit()
+
+        assert EDIT_FINGERPRINT_KEY not in dn.edits[-1]
+        assert dn.read_has_been_called == 0
+
     def test_lock_initialization(self):
         dn = InMemoryDataNode("dn", Scope.SCENARIO)
         assert not dn.edit_in_progress
@@ -345,6 +370,25 @@ class TestDataNode:
         dn_2_1.last_edit_date = current_datetime + timedelta(2)
         dn_3_1.last_edit_date = current_datetime + timedelta(3)
 
+    def test_is_up_to_date_does_not_build_the_scenario_graph(self, current_datetime):
+        dn_confg_1 = Config.configure_in_memory_data_node("dn_1")
+        dn_confg_2 = Config.configure_in_memory_data_node("dn_2")
+        dn_confg_3 = Config.configure_in_memory_data_node("dn_3")
+        task_config_1 = Config.configure_task("t1", print, [dn_confg_1], [dn_confg_2])
+        task_config_2 = Config.configure_task("t2", print, [dn_confg_2], [dn_confg_3])
+        scenario = tp.create_scenario(Config.configure_scenario("sc", [task_config_1, task_config_2]))
+        dn_1, dn_2, dn_3 = scenario.dn_1, scenario.dn_2, scenario.dn_3
+        dn_1.last_edit_date = current_datetime + timedelta(1)
+        dn_2.last_edit_date = current_datetime + timedelta(2)
+        dn_3.last_edit_date = current_datetime + timedelta(3)
+
+        with mock.patch("taipy.core.scenario.scenario.Scenario._build_dag") as mck:
+            assert dn_3.is_up_to_date
+            dn_1.last_edit_date = current_datetime + timedelta(4)
+            assert not dn_3.is_up_to_date
+            assert dn_1.is_up_to_date
+            mck.assert_not_called()
+
     def test_is_up_to_date_across_scenarios(self, current_datetime):
         dn_confg_1 = Config.configure_in_memory_data_node("dn_1", scope=Scope.SCENARIO)
         dn_confg_2 = Config.configure_in_memory_data_node("dn_2", scope=Scope.SCENARIO)
@@ -0,0 +1,48 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.core import taipy as tp
+
+NB_TASKS = 500
+
+
+def compute(*inputs):
+    return 1
+
+
+@pytest.mark.benchmark
+def test_is_up_to_date(benchmark_report):
+    # A chain of tasks, each one also reading a data node written further up the chain
+    dn_cfgs = [Config.configure_data_node(f"dn_{i}", default_data=0) for i in range(NB_TASKS + 1)]
+    task_cfgs = [
+        Config.configure_task(f"t_{i}", compute, [dn_cfgs[i]] + dn_cfgs[max(i - 10, 0) : max(i - 9, 0)], dn_cfgs[i + 1])
+        for i in range(NB_TASKS)
+    ]
+    scenario = tp.create_scenario(Config.configure_scenario("sc", task_cfgs))
+    # The last data node is the most recent one, so all its ancestors are checked
+    last_dn = tp.get(scenario.data_nodes[f"dn_{NB_TASKS}"].id)
+    last_dn.write(1)
+
+    start = time.perf_counter()
+    assert last_dn.is_up_to_date
+    is_up_to_date_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    assert len(tp.get_parents(last_dn)["scenario"]) == 1
+    get_parents_time = time.perf_counter() - start
+
+    benchmark_report("is_up_to_date_time", is_up_to_date_time)
+    benchmark_report("get_parents_time", get_parents_time)
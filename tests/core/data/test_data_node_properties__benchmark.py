@@ -0,0 +1,57 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import time
+from datetime import datetime
+from unittest import mock
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data.in_memory import InMemoryDataNode
+
+NB_READS = 1_000_000
+
+PROPERTIES = {
+    "string": "foo",
+    "date": datetime(2025, 1, 1),
+    "template": "ENV[FOO]",
+    "typed_template": "ENV[BAR]:int",
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("property_name", list(PROPERTIES))
+@pytest.mark.parametrize("is_environment_frozen", [False, True], ids=["environment", "frozen_environment"])
+def test_read_data_node_property(benchmark_report, property_name, is_environment_frozen):
+    with mock.patch.dict(os.environ, {"FOO": "foo", "BAR": "1"}):
+        dn = InMemoryDataNode("dn", Scope.SCENARIO, properties=dict(PROPERTIES))
+        dn_cfg = Config.configure_in_memory_data_node("dn", **PROPERTIES)
+        if is_environment_frozen:
+            Config.freeze_environment()
+        try:
+            properties = dn._properties
+            start = time.perf_counter()
+            for _ in range(NB_READS):
+                properties[property_name]
+            entity_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(NB_READS):
+                getattr(dn_cfg, property_name)
+            config_time = time.perf_counter() - start
+        finally:
+            Config.unfreeze_environment()
+
+    benchmark_report("entity_property_read_time", entity_time / NB_READS * 1e9, "ns")
+    benchmark_report("config_property_read_time", config_time / NB_READS * 1e9, "ns")
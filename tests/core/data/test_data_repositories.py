@@ -14,12 +14,13 @@ import os
 import pytest
 
 from taipy.core.data._data_fs_repository import _DataFSRepository
+from taipy.core.data._data_sqlite_repository import _DataSQLiteRepository
 from taipy.core.data.data_node import DataNode, DataNodeId
 from taipy.core.exceptions import ModelNotFound
 
 
 class TestDataNodeRepository:
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_save_and_load(self, data_node: DataNode, repo):
         repository = repo()
         repository._save(data_node)
@@ -40,7 +41,7 @@ class TestDataNodeRepository:
         assert data_node._edits == loaded_data_node._edits
         assert data_node._properties == loaded_data_node._properties
 
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_exists(self, data_node, repo):
         repository = repo()
         repository._save(data_node)
@@ -48,7 +49,7 @@ class TestDataNodeRepository:
         assert repository._exists(data_node.id)
         assert not repository._exists("not-existed-data-node")
 
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_load_all(self, data_node, repo):
         repository = repo()
         for i in range(10):
@@ -58,7 +59,7 @@ class TestDataNodeRepository:
 
         assert len(data_nodes) == 10
 
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_load_all_with_filters(self, data_node, repo):
         repository = repo()
 
@@ -70,7 +71,7 @@ class TestDataNodeRepository:
 
         assert len(objs) == 1
 
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_delete(self, data_node, repo):
         repository = repo()
         repository._save(data_node)
@@ -80,7 +81,7 @@ class TestDataNodeRepository:
         with pytest.raises(ModelNotFound):
             repository._load(data_node.id)
 
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_delete_all(self, data_node, repo):
         repository = repo()
 
@@ -94,7 +95,7 @@ class TestDataNodeRepository:
 
         assert len(repository._load_all()) == 0
 
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_delete_many(self, data_node, repo):
         repository = repo()
 
@@ -109,7 +110,7 @@ class TestDataNodeRepository:
 
         assert len(repository._load_all()) == 7
 
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_delete_by(self, data_node, repo):
         repository = repo()
 
@@ -125,7 +126,7 @@ class TestDataNodeRepository:
 
         assert len(repository._load_all()) == 5
 
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_search(self, data_node, repo):
         repository = repo()
 
@@ -146,7 +147,7 @@ class TestDataNodeRepository:
 
         assert repository._search("owner_id", "task-2", filters=[{"version": "non_existed_version"}]) == []
 
-    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    @pytest.mark.parametrize("repo", [_DataFSRepository, _DataSQLiteRepository])
     def test_export(self, tmpdir, data_node, repo):
         repository = repo()
         repository._save(data_node)
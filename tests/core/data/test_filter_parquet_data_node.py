@@ -12,6 +12,7 @@
 import os
 import pathlib
 from importlib import util
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -19,6 +20,7 @@ import pytest
 from pandas.testing import assert_frame_equal
 
 from taipy.common.config.common.scope import Scope
+from taipy.core.data._filter import _FilterDataNode
 from taipy.core.data.operator import JoinOperator, Operator
 from taipy.core.data.parquet import ParquetDataNode
 
@@ -137,3 +139,120 @@ class TestFilterParquetDataNode:
             np.array([[1, 1], [1, 2], [2, 1], [2, 2]]),
         )
         assert np.array_equal(dn[(dn[:, 1] == 1) | (dn[:, 1] == 2)], np.array([[1, 1], [1, 2], [2, 1], [2, 2]]))
+
+    def test_filter_pushed_down_to_the_parquet_reader(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "engine": "pyarrow"})
+        dn.write(pd.DataFrame({"foo": [1, 1, None, 2], "bar": [1, 2, 2, None], "baz": ["a", "b", "c", "d"]}))
+
+        with patch("pandas.read_parquet", wraps=pd.read_parquet) as read_mock:
+            filtered = dn.filter([("foo", 1, Operator.NOT_EQUAL), ("bar", 2, Operator.EQUAL)])
+            assert read_mock.call_args.kwargs["filters"] is not None
+        # Missing values are kept by the NOT_EQUAL operator, as when filtering a dataframe
+        assert filtered["baz"].tolist() == ["c"]
+
+        filtered = dn.filter([("foo", 2, Operator.GREATER_OR_EQUAL), ("bar", 1, Operator.LESS_THAN)], JoinOperator.OR)
+        assert filtered["baz"].tolist() == ["d"]
+
+        with patch("pandas.read_parquet", wraps=pd.read_parquet) as read_mock:
+            filtered = dn.filter(("foo", 1, Operator.EQUAL), columns=["baz"])
+            assert read_mock.call_args_list[0].kwargs["columns"] == ["baz", "foo"]
+        assert_frame_equal(filtered, pd.DataFrame({"baz": ["a", "b"]}))
+
+        with patch("pandas.read_parquet", wraps=pd.read_parquet) as read_mock:
+            assert dn["baz"].tolist() == ["a", "b", "c", "d"]
+            assert read_mock.call_args.kwargs["columns"] == ["baz"]
+        assert dn[["foo", "baz"]].columns.tolist() == ["foo", "baz"]
+        assert dn["unknown"] is None
+
+        # A value that cannot be compared with the column by Arrow is filtered by pandas
+        assert dn.filter(("baz", 1, Operator.EQUAL)).empty
+
+    def test_filter_partitioned_dataset(self, tmpdir_factory):
+        path = str(tmpdir_factory.mktemp("data").join("partitioned"))
+        data = pd.DataFrame({"year": [2023, 2023, 2024, 2025], "value": [1, 2, 3, 4]})
+        data.to_parquet(path, partition_cols=["year"], index=True)
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": path, "engine": "pyarrow"})
+
+        filtered = dn.filter(("year", 2024, Operator.GREATER_OR_EQUAL))
+        assert filtered["value"].tolist() == [3, 4]
+        assert filtered.index.tolist() == [2, 3]
+
+        # Without a stored index, the rows read from a partitioned dataset are indexed from 0
+        path = str(tmpdir_factory.mktemp("data").join("partitioned"))
+        data.to_parquet(path, partition_cols=["year"], index=False)
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": path, "engine": "pyarrow"})
+
+        filtered = dn.filter(("year", 2024, Operator.GREATER_OR_EQUAL))
+        assert filtered["value"].tolist() == [3, 4]
+        assert filtered.index.tolist() == [0, 1]
+
+    def test_filter_pushed_down_keeps_the_index_of_the_filtered_data(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "engine": "pyarrow"})
+        dn.write(pd.DataFrame({"foo": [1, 2, None, 2], "bar": [1, 2, 3, 4]}))
+        data = dn.read()
+
+        with patch("pandas.read_parquet", wraps=pd.read_parquet) as read_mock:
+            filtered = dn.filter(("foo", 2, Operator.EQUAL))
+            assert read_mock.call_args_list[0].kwargs["filters"] is not None
+        assert_frame_equal(filtered, _FilterDataNode._filter(data, ("foo", 2, Operator.EQUAL)))
+        assert filtered.index.tolist() == [1, 3]
+        assert dn.filter(("foo", 1, Operator.NOT_EQUAL)).index.tolist() == [1, 2, 3]
+
+        # The rows filtered by a list of 3-tuples are merged and indexed from 0, as in memory
+        operators = [("foo", 2, Operator.EQUAL), ("bar", 4, Operator.EQUAL)]
+        filtered = dn.filter(operators)
+        assert_frame_equal(filtered, _FilterDataNode._filter(data, operators))
+        assert filtered.index.tolist() == [0]
+
+    def test_filter_pushed_down_restores_the_index_stored_in_the_file(self, parquet_file_path):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "engine": "pyarrow"})
+        dn.write(pd.DataFrame({"foo": [1, 2, None, 2], "bar": [1, 2, 3, 4]}, index=[10, 20, 30, 40]))
+
+        with patch.object(ParquetDataNode, "_read_from_path", wraps=dn._read_from_path) as read_mock:
+            filtered = dn.filter(("foo", 2, Operator.EQUAL), columns=["bar"])
+            # The index is read along with the filtered columns
+            assert read_mock.call_count == 1
+        assert_frame_equal(filtered, pd.DataFrame({"bar": [2, 4]}, index=[20, 40]))
+
+    def test_filter_pushed_down_computes_the_index_from_the_matching_row_groups(self, parquet_file_path):
+        dn = ParquetDataNode(
+            "foo",
+            Scope.SCENARIO,
+            properties={"path": parquet_file_path, "engine": "pyarrow", "write_kwargs": {"row_group_size": 2}},
+        )
+        dn.write(pd.DataFrame({"foo": [1, 1, 2, 3, 3, 2], "bar": [1, 2, 3, 4, 5, 6]}))
+        data = dn.read()
+
+        # The rows matching the filter are in the second and the third row groups
+        filtered = dn.filter(("foo", 2, Operator.EQUAL))
+        assert_frame_equal(filtered, _FilterDataNode._filter(data, ("foo", 2, Operator.EQUAL)))
+        assert filtered.index.tolist() == [2, 5]
+
+        # A stored range index keeps its start and step
+        dn.write(pd.DataFrame({"foo": [1, 2, 1, 2]}, index=pd.RangeIndex(10, 50, 10)))
+        assert dn.filter(("foo", 2, Operator.EQUAL)).index.tolist() == [20, 40]
+
+    @pytest.mark.parametrize("join_operator", [JoinOperator.AND, JoinOperator.OR])
+    def test_filter_pushed_down_merges_rows_as_in_memory(self, parquet_file_path, join_operator):
+        dn = ParquetDataNode("foo", Scope.SCENARIO, properties={"path": parquet_file_path, "engine": "pyarrow"})
+        dn.write(pd.DataFrame({"foo": [3, 1, 2, 1, 2, 3], "bar": ["c", "a", "b", "a", "b", "d"]}))
+        data = dn.read()
+
+        # Duplicated rows are merged, and the merged rows are indexed from 0, as in memory
+        for operators in [
+            [("foo", 2, Operator.EQUAL), ("bar", "b", Operator.EQUAL)],
+            [("foo", 3, Operator.EQUAL), ("bar", "a", Operator.EQUAL)],
+            [("foo", 2, Operator.LESS_OR_EQUAL), ("bar", "c", Operator.GREATER_OR_EQUAL)],
+        ]:
+            with patch("pandas.read_parquet", wraps=pd.read_parquet) as read_mock:
+                filtered = dn.filter(operators, join_operator)
+                assert read_mock.call_args.kwargs["filters"] is not None
+            assert_frame_equal(filtered, _FilterDataNode._filter(data, operators, join_operator))
+            assert_frame_equal(
+                dn.filter(operators, join_operator, columns=["bar"]),
+                _FilterDataNode._filter(data, operators, join_operator)[["bar"]],
+            )
+
+        # A list holding a single 3-tuple is not merged: the rows keep their index labels
+        operators = [("foo", 1, Operator.EQUAL)]
+        assert_frame_equal(dn.filter(operators, join_operator), _FilterDataNode._filter(data, operators, join_operator))
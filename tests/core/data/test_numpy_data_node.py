@@ -0,0 +1,184 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import re
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from taipy.common.config import Config
+from taipy.common.config.common.scope import Scope
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.numpy import NumpyDataNode
+from taipy.core.exceptions.exceptions import NoData, UnsupportedMmapMode
+
+
+@pytest.fixture
+def npy_path(tmp_path):
+    return str(tmp_path / "array.npy")
+
+
+class TestNumpyDataNode:
+    def test_create_with_manager(self, npy_path):
+        dn_config = Config.configure_numpy_data_node(id="foo", default_path=npy_path, default_data=[1, 2, 3])
+        dn = _DataManagerFactory._build_manager()._create_and_set(dn_config, None, None)
+
+        assert isinstance(dn, NumpyDataNode)
+        assert dn.storage_type() == "numpy"
+        assert dn.path == npy_path
+        assert dn.properties["mmap_mode"] == "r"
+        assert dn.is_ready_for_reading
+        np.testing.assert_array_equal(dn.read(), np.array([1, 2, 3]))
+
+    def test_get_user_properties(self, npy_path):
+        dn = NumpyDataNode("dn", Scope.SCENARIO, properties={"default_path": npy_path, "mmap_mode": None, "foo": "bar"})
+        assert dn._get_user_properties() == {"foo": "bar"}
+
+    def test_generated_path(self):
+        dn = NumpyDataNode("foo", Scope.SCENARIO)
+        assert dn.is_generated
+        assert dn.path.endswith(f"{dn.id}.npy")
+
+    def test_read_is_memory_mapped(self, npy_path):
+        dn = NumpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_path})
+        with pytest.raises(NoData):
+            dn.read_or_raise()
+
+        data = np.arange(12, dtype=np.float32).reshape(3, 4)
+        dn.write(data)
+        array = dn.read()
+
+        assert isinstance(array, np.memmap)
+        assert array.dtype == np.float32
+        np.testing.assert_array_equal(array, data)
+        with pytest.raises(ValueError):
+            array[0, 0] = 42
+
+    def test_read_without_memory_map(self, npy_path):
+        dn = NumpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_path, "mmap_mode": None})
+        dn.write(np.ones((2, 2)))
+        array = dn.read()
+
+        assert not isinstance(array, np.memmap)
+        np.testing.assert_array_equal(array, np.ones((2, 2)))
+
+    def test_write_replaces_memory_mapped_file(self, npy_path):
+        dn = NumpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_path})
+        dn.write(np.zeros(5))
+        previous = dn.read()
+
+        dn.write(np.ones(10))
+
+        np.testing.assert_array_equal(previous, np.zeros(5))
+        np.testing.assert_array_equal(dn.read(), np.ones(10))
+        assert os.listdir(os.path.dirname(npy_path)) == ["array.npy"]
+
+    @pytest.mark.parametrize("mmap_mode", ["r+", "w+"])
+    def test_mmap_mode_writing_the_file_is_not_supported(self, npy_path, mmap_mode):
+        with pytest.raises(UnsupportedMmapMode):
+            NumpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_path, "mmap_mode": mmap_mode})
+
+    def test_write_memory_mapped_file_on_windows(self, npy_path):
+        # On Windows, a memory-mapped file can be neither replaced nor removed
+        mapped_paths = set()
+        replace, remove = os.replace, os.remove
+
+        def replace_unless_mapped(src, dst):
+            if dst in mapped_paths:
+                raise PermissionError(f"The file {dst} is memory-mapped")
+            replace(src, dst)
+
+        def remove_unless_mapped(path):
+            if path in mapped_paths:
+                raise PermissionError(f"The file {path} is memory-mapped")
+            remove(path)
+
+        dn = NumpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_path})
+        dn.write(np.zeros(5))
+        with patch("sys.platform", "win32"), patch("os.replace", side_effect=replace_unless_mapped), patch(
+            "os.remove", remove_unless_mapped
+        ):
+            previous = dn.read()
+            mapped_paths.add(dn.path)
+            dn.write(np.ones(10))
+
+            version_path = dn.path
+            assert re.fullmatch(r"array\.\d{20}\.npy", os.path.basename(version_path))
+            assert dn.properties["path"] == version_path
+            assert not dn.is_generated
+            np.testing.assert_array_equal(previous, np.zeros(5))
+            np.testing.assert_array_equal(dn.read(), np.ones(10))
+            assert set(os.listdir(os.path.dirname(npy_path))) == {"array.npy", os.path.basename(version_path)}
+
+            # Once the previous array is not mapped anymore, its file is removed by the next write
+            mapped_paths.clear()
+            dn.write(np.full(3, 2))
+            assert dn.path == version_path
+            np.testing.assert_array_equal(dn.read(), np.full(3, 2))
+            assert os.listdir(os.path.dirname(npy_path)) == [os.path.basename(version_path)]
+
+    def test_write_memory_mapped_file_fails_on_other_systems(self, npy_path):
+        dn = NumpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_path})
+        dn.write(np.zeros(5))
+        with patch("sys.platform", "linux"), patch("os.replace", side_effect=PermissionError("Permission denied")):
+            with pytest.raises(PermissionError):
+                dn.write(np.ones(10))
+        assert dn.path == npy_path
+        np.testing.assert_array_equal(dn.read(), np.zeros(5))
+        assert os.listdir(os.path.dirname(npy_path)) == ["array.npy"]
+
+    def test_versions_of_generated_file_are_removed_with_data_node(self):
+        data_manager = _DataManagerFactory._build_manager()
+        dn_config = Config.configure_numpy_data_node("foo")
+        dn = data_manager._bulk_get_or_create([dn_config])[dn_config]
+        dn.write(np.zeros(5))
+        path = dn.path
+        mapped_paths = {path}
+        replace, remove = os.replace, os.remove
+
+        def replace_unless_mapped(src, dst):
+            if dst in mapped_paths:
+                raise PermissionError(f"The file {dst} is memory-mapped")
+            replace(src, dst)
+
+        with patch("sys.platform", "win32"), patch("os.replace", side_effect=replace_unless_mapped):
+            dn.write(np.ones(10))
+        version_path = dn.path
+        assert version_path != path
+        assert dn.is_generated
+
+        data_manager._delete(dn.id)
+        assert not os.path.exists(path)
+        assert not os.path.exists(version_path)
+
+    @pytest.mark.skipif(os.name == "nt", reason="File permissions are not POSIX permissions on Windows")
+    def test_write_keeps_file_permissions(self, npy_path):
+        dn = NumpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_path})
+        umask = os.umask(0o022)
+        try:
+            # A new file has the default permissions
+            dn.write(np.zeros(5))
+            assert os.stat(npy_path).st_mode & 0o777 == 0o644
+
+            # An existing file keeps its permissions
+            os.chmod(npy_path, 0o640)
+            dn.write(np.ones(5))
+            assert os.stat(npy_path).st_mode & 0o777 == 0o640
+        finally:
+            os.umask(umask)
+
+    def test_write_object_array_fails(self, npy_path):
+        dn = NumpyDataNode("foo", Scope.SCENARIO, properties={"path": npy_path})
+        with pytest.raises(ValueError):
+            dn.write(np.array([{"a": 1}], dtype=object))
+        assert os.listdir(os.path.dirname(npy_path)) == []
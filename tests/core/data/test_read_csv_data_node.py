@@ -114,3 +114,43 @@ def test_read_without_header_custom_exposed_type():
         assert row_pandas[0] == row_custom.id
         assert str(row_pandas[1]) == row_custom.integer
         assert row_pandas[2] == row_custom.text
+
+
+@pytest.mark.parametrize("engine", [None, "c", "pyarrow"])
+def test_read_with_engine_and_dtype(engine):
+    properties = {"path": csv_file_path, "engine": engine, "dtype": {"integer": "float64"}}
+    data_pandas = CSVDataNode("bar", Scope.SCENARIO, properties=properties).read()
+    assert data_pandas["integer"].dtype == np.float64
+    assert pd.DataFrame.equals(data_pandas, pd.read_csv(csv_file_path, dtype={"integer": "float64"}))
+
+
+@pytest.mark.parametrize("engine", [None, "pyarrow"])
+def test_read_chunks_pandas(engine):
+    csv_data_node_as_pandas = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path, "engine": engine})
+    chunks = list(csv_data_node_as_pandas.read_chunks(4))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    assert pd.DataFrame.equals(pd.concat(chunks), pd.read_csv(csv_file_path))
+
+
+def test_read_chunks_numpy():
+    csv_data_node_as_numpy = CSVDataNode(
+        "qux", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": "numpy"}
+    )
+    chunks = list(csv_data_node_as_numpy.read_chunks(6))
+    assert [len(chunk) for chunk in chunks] == [6, 4]
+    assert np.array_equal(np.concatenate(chunks), pd.read_csv(csv_file_path).to_numpy())
+
+
+def test_read_chunks_custom_exposed_type():
+    csv_data_node_as_custom_object = CSVDataNode(
+        "bar", Scope.SCENARIO, properties={"path": csv_file_path, "exposed_type": MyCustomObject}
+    )
+    chunks = list(csv_data_node_as_custom_object.read_chunks(3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    assert [row for chunk in chunks for row in chunk] == csv_data_node_as_custom_object.read()
+
+
+def test_read_chunks_raise_no_data():
+    not_existing_csv = CSVDataNode("foo", Scope.SCENARIO, properties={"path": "WRONG.csv"})
+    with pytest.raises(NoData):
+        not_existing_csv.read_chunks(10)
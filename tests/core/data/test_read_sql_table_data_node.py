@@ -272,3 +272,50 @@ class TestReadSQLTableDataNode:
         data = dn.read()
 
         assert data.equals(pd.DataFrame([{"foo": 1, "bar": 2}, {"foo": 3, "bar": 4}]))
+
+    @pytest.mark.parametrize("exposed_type", ["pandas", "numpy", MyCustomObject])
+    def test_read_chunks(self, tmp_sqlite_db_file_path, exposed_type):
+        folder_path, db_name, file_extension = tmp_sqlite_db_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+            "exposed_type": exposed_type,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+        dn.append(pd.DataFrame([{"foo": 5, "bar": 6}]))
+
+        chunks = list(dn.read_chunks(2))
+        assert len(chunks) == 2
+        if exposed_type == "pandas":
+            assert chunks[0].equals(pd.DataFrame([{"foo": 1, "bar": 2}, {"foo": 3, "bar": 4}]))
+            assert chunks[1].equals(pd.DataFrame([{"foo": 5, "bar": 6}]))
+        elif exposed_type == "numpy":
+            assert np.array_equal(chunks[0], np.array([[1, 2], [3, 4]]))
+            assert np.array_equal(chunks[1], np.array([[5, 6]]))
+        else:
+            assert [(row.foo, row.bar) for chunk in chunks for row in chunk] == [(1, 2), (3, 4), (5, 6)]
+
+        filtered_chunks = list(dn.read_chunks(2, [("foo", 1, Operator.GREATER_THAN)]))
+        assert [len(chunk) for chunk in filtered_chunks] == [2]
+
+    def test_read_chunks_as_arrow(self, tmp_sqlite_db_file_path):
+        pa = pytest.importorskip("pyarrow")
+        folder_path, db_name, file_extension = tmp_sqlite_db_file_path
+        properties = {
+            "db_engine": "sqlite",
+            "table_name": "example",
+            "db_name": db_name,
+            "sqlite_folder_path": folder_path,
+            "sqlite_file_extension": file_extension,
+        }
+        dn = SQLTableDataNode("sqlite_dn", Scope.SCENARIO, properties=properties)
+
+        batches = list(dn.read_chunks(1, as_arrow=True))
+        assert all(isinstance(batch, pa.RecordBatch) for batch in batches)
+        assert pa.Table.from_batches(batches).to_pydict() == {"foo": [1, 3], "bar": [2, 4]}
+
+        with pytest.raises(ValueError):
+            dn.read_chunks(0)
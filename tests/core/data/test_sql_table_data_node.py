@@ -179,3 +179,29 @@ class TestSQLTableDataNode:
 
             dn.some_random_attribute_that_does_not_related_to_engine = "foo"
             assert dn._engine is not None
+
+    @pytest.mark.parametrize("properties", __sql_properties)
+    def test_engine_shared_by_data_nodes(self, properties):
+        dn_1 = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties.copy())
+        dn_2 = SQLTableDataNode("bar", Scope.SCENARIO, properties=properties.copy())
+        assert dn_1._get_engine() is dn_2._get_engine()
+
+        dn_3 = SQLTableDataNode(
+            "baz", Scope.SCENARIO, properties={**properties, "db_pool_size": 3, "db_pool_pre_ping": True}
+        )
+        engine = dn_3._get_engine()
+        assert engine is not dn_1._get_engine()
+        assert engine.pool.size() == 3
+        assert engine.pool._pre_ping
+
+        dn_4 = SQLTableDataNode(
+            "qux", Scope.SCENARIO, properties={**properties, "db_pool_size": "4", "db_pool_pre_ping": "False"}
+        )
+        engine = dn_4._get_engine()
+        assert engine.pool.size() == 4
+        assert not engine.pool._pre_ping
+
+        with patch("taipy.core.common._sql_connector.create_engine") as create_engine_mock:
+            dn_1 = SQLTableDataNode("foo", Scope.SCENARIO, properties=properties.copy())
+            dn_1._get_engine()
+            create_engine_mock.assert_not_called()
@@ -0,0 +1,50 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+
+import pytest
+
+from taipy.common.config.common.scope import Scope
+from taipy.core.common._sql_connector import _SQLEngineRegistry
+from taipy.core.data.sql_table import SQLTableDataNode
+
+NB_READS = 500
+
+
+def _read_per_second(properties, dispose_engines: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(NB_READS):
+        if dispose_engines:
+            # Emulates the engine built by each data node instance, as before the engines were shared
+            _SQLEngineRegistry._dispose_all()
+        # The data node is reloaded from the repository before each read
+        dn = SQLTableDataNode("example", Scope.SCENARIO, properties=properties.copy())
+        assert len(dn.read()) == 2
+    return NB_READS / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("pool_size", [None, 5])
+def test_read_sqlite_table(tmp_sqlite_db_file_path, benchmark_report, pool_size):
+    folder_path, db_name, file_extension = tmp_sqlite_db_file_path
+    properties = {
+        "db_name": db_name,
+        "db_engine": "sqlite",
+        "table_name": "example",
+        "sqlite_folder_path": folder_path,
+        "sqlite_file_extension": file_extension,
+        "db_pool_size": pool_size,
+    }
+
+    benchmark_report("reads_per_second_with_an_engine_per_read", _read_per_second(properties, True), "reads/s")
+    benchmark_report("reads_per_second_with_shared_engine", _read_per_second(properties, False), "reads/s")
+    _SQLEngineRegistry._dispose_all()
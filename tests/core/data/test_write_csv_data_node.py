@@ -69,6 +69,59 @@ def test_append(csv_file, default_data_frame, content):
     )
 
 
+def test_write_chunks(tmp_csv_file):
+    source_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file})
+    df = pd.DataFrame([{"a": i, "b": 2 * i} for i in range(10)])
+    source_dn.write(df)
+
+    target_path = tmp_csv_file.replace("temp.csv", "temp_target.csv")
+    try:
+        target_dn = CSVDataNode("bar", Scope.SCENARIO, properties={"path": target_path})
+        target_dn.write_chunks(chunk * 10 for chunk in source_dn.read_chunks(3))
+        assert_frame_equal(target_dn.read(), df * 10)
+        assert target_dn.last_edit_date is not None
+
+        target_dn.write_chunks([])
+        assert target_dn.read().empty
+    finally:
+        os.remove(target_path)
+
+    # The chunks read from the data node itself are written to another file before replacing it
+    source_dn.write_chunks(chunk + 1 for chunk in source_dn.read_chunks(4))
+    assert_frame_equal(source_dn.read(), df + 1)
+    assert not [name for name in os.listdir(pathlib.Path(tmp_csv_file).parent) if name.endswith(".tmp")]
+
+
+
+@pytest.mark.skipif(os.name == "nt", reason="File permissions are not POSIX permissions on Windows")
+def test_write_chunks_keeps_file_permissions(tmp_csv_file):
+    csv_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file})
+    umask = os.umask(0o022)
+    try:
+        # A new file has the default permissions
+        csv_dn.write_chunks([pd.DataFrame({"a": [1]})])
+        assert os.stat(tmp_csv_file).st_mode & 0o777 == 0o644
+
+        # An existing file keeps its permissions
+        os.chmod(tmp_csv_file, 0o640)
+        csv_dn.write_chunks([pd.DataFrame({"a": [2]})])
+        assert os.stat(tmp_csv_file).st_mode & 0o777 == 0o640
+    finally:
+        os.umask(umask)
+
+def test_write_and_append_iterators_of_rows(tmp_csv_file):
+    csv_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file})
+
+    csv_dn.write({"a": i, "b": 2 * i} for i in range(3))
+    assert_frame_equal(csv_dn.read(), pd.DataFrame({"a": [0, 1, 2], "b": [0, 2, 4]}))
+
+    csv_dn.append(zip([3, 4], [6, 8]))
+    assert_frame_equal(csv_dn.read(), pd.DataFrame({"a": [0, 1, 2, 3, 4], "b": [0, 2, 4, 6, 8]}))
+
+    csv_dn.write(map(dict, [[("a", 0), ("b", 0)], [("a", 1), ("b", -1)]]))
+    assert_frame_equal(csv_dn.read(), pd.DataFrame({"a": [0, 1], "b": [0, -1]}))
+
+
 def test_write_with_header_pandas(tmp_csv_file):
     csv_dn = CSVDataNode("foo", Scope.SCENARIO, properties={"path": tmp_csv_file})
 
@@ -109,6 +109,24 @@ def test_get_latest_job():
     assert _JobManager._get_latest(task_2).id == job_2.id
 
 
+def test_get_latest_job_does_not_load_all_jobs():
+    Config.configure_job_executions(mode=JobConfig._DEVELOPMENT_MODE)
+
+    task = _create_task(multiply, name="get_latest_job")
+    job_1 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+    sleep(0.01)  # Comparison is based on time, precision on Windows is not enough important
+    job_2 = _OrchestratorFactory._orchestrator.submit_task(task).jobs[0]
+
+    with mock.patch("taipy.core._repository._filesystem_repository._FileSystemRepository._load_all") as mck:
+        assert _JobManager._get_latest(task).id == job_2.id
+        mck.assert_not_called()
+
+    _JobManager._delete(job_2)
+    assert _JobManager._get_latest(task).id == job_1.id
+    _JobManager._delete(job_1)
+    assert _JobManager._get_latest(task) is None
+
+
 def test_get_job_unknown():
     assert _JobManager._get(JobId("Unknown")) is None
 
@@ -10,47 +10,52 @@
 # specific language governing permissions and limitations under the License.
 
 import os
+from datetime import datetime, timedelta
 
 import pytest
 
 from taipy.core.data._data_fs_repository import _DataFSRepository
 from taipy.core.exceptions import ModelNotFound
 from taipy.core.job._job_fs_repository import _JobFSRepository
+from taipy.core.job._job_sqlite_repository import _JobSQLiteRepository
 from taipy.core.job.job import Job, JobId
 from taipy.core.task._task_fs_repository import _TaskFSRepository
 from taipy.core.task.task import Task
 
 
 class TestJobRepository:
-    def test_save_and_load(self, data_node, job):
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_save_and_load(self, data_node, job, repo):
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskFSRepository()._save(task)
         job._task = task
 
-        repository = _JobFSRepository()
+        repository = repo()
         repository._save(job)
 
         obj = repository._load(job.id)
         assert isinstance(obj, Job)
 
-    def test_exists(self, data_node, job):
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_exists(self, data_node, job, repo):
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskFSRepository()._save(task)
         job._task = task
-        repository = _JobFSRepository()
+        repository = repo()
         repository._save(job)
 
         assert repository._exists(job.id)
         assert not repository._exists("not-existed-job")
 
-    def test_load_all(self, data_node, job):
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_load_all(self, data_node, job, repo):
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskFSRepository()._save(task)
         job._task = task
-        repository = _JobFSRepository()
+        repository = repo()
         for i in range(10):
             job.id = JobId(f"job-{i}")
             repository._save(job)
@@ -58,8 +63,9 @@ class TestJobRepository:
 
         assert len(jobs) == 10
 
-    def test_load_all_with_filters(self, data_node, job):
-        repository = _JobFSRepository()
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_load_all_with_filters(self, data_node, job, repo):
+        repository = repo()
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskFSRepository()._save(task)
@@ -72,8 +78,9 @@ class TestJobRepository:
 
         assert len(objs) == 1
 
-    def test_delete(self, data_node, job):
-        repository = _JobFSRepository()
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_delete(self, data_node, job, repo):
+        repository = repo()
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskFSRepository()._save(task)
@@ -85,8 +92,9 @@ class TestJobRepository:
         with pytest.raises(ModelNotFound):
             repository._load(job.id)
 
-    def test_delete_all(self, data_node, job):
-        repository = _JobFSRepository()
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_delete_all(self, data_node, job, repo):
+        repository = repo()
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskFSRepository()._save(task)
@@ -102,8 +110,9 @@ class TestJobRepository:
 
         assert len(repository._load_all()) == 0
 
-    def test_delete_many(self, data_node, job):
-        repository = _JobFSRepository()
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_delete_many(self, data_node, job, repo):
+        repository = repo()
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskFSRepository()._save(task)
@@ -120,8 +129,9 @@ class TestJobRepository:
 
         assert len(repository._load_all()) == 7
 
-    def test_delete_by(self, data_node, job):
-        repository = _JobFSRepository()
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_delete_by(self, data_node, job, repo):
+        repository = repo()
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskFSRepository()._save(task)
@@ -139,8 +149,9 @@ class TestJobRepository:
 
         assert len(repository._load_all()) == 5
 
-    def test_search(self, data_node, job):
-        repository = _JobFSRepository()
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_search(self, data_node, job, repo):
+        repository = repo()
         _DataFSRepository()._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskFSRepository()._save(task)
@@ -162,11 +173,49 @@ class TestJobRepository:
 
         assert repository._search("id", "job-2", filters=[{"version": "non_existed_version"}]) == []
 
-    def test_export(self, tmpdir, job):
-        repository = _JobFSRepository()
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_get_latest(self, data_node, job, repo):
+        repository = repo()
+        _DataFSRepository()._save(data_node)
+        task = Task("task_config_id", {}, print, [data_node], [data_node])
+        _TaskFSRepository()._save(task)
+        job._task = task
+
+        for i in range(5):
+            job.id = JobId(f"job-{i}")
+            job._creation_date = datetime(2024, 1, 1) + timedelta(days=(i + 3) % 5)
+            repository._save(job)
+
+        assert repository._get_latest("task_id", task.id).id == "job-1"
+        assert repository._get_latest("task_id", task.id, filters=[{"version": "random_version_number"}]).id == "job-1"
+        assert repository._get_latest("task_id", task.id, filters=[{"version": "non_existed_version"}]) is None
+        assert repository._get_latest("task_id", "non_existed_task") is None
+
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_load_all_with_indexed_filters(self, data_node, job, repo):
+        repository = repo()
+        _DataFSRepository()._save(data_node)
+        task = Task("task_config_id", {}, print, [data_node], [data_node])
+        _TaskFSRepository()._save(task)
+        job._task = task
+
+        for i in range(10):
+            job.id = JobId(f"job-{i}")
+            job._submit_id = f"submission-{i % 2}"
+            repository._save(job)
+
+        assert len(repository._load_all(filters=[{"task_id": task.id}])) == 10
+        assert len(repository._load_all(filters=[{"submit_id": "submission-1"}])) == 5
+        assert len(repository._load_all(filters=[{"task_id": task.id, "submit_id": "submission-1"}])) == 5
+        assert len(repository._load_all(filters=[{"submit_id": "submission-0"}, {"submit_id": "submission-1"}])) == 10
+        assert repository._load_all(filters=[{"task_id": "non_existed_task"}]) == []
+
+    @pytest.mark.parametrize("repo", [_JobFSRepository, _JobSQLiteRepository])
+    def test_export(self, tmpdir, job, repo):
+        repository = repo()
         repository._save(job)
 
         repository._export(job.id, tmpdir.strpath)
-        dir_path = repository.dir_path
+        dir_path = repository.dir_path if repo == _JobFSRepository else os.path.join(tmpdir.strpath, "job")
 
         assert os.path.exists(os.path.join(dir_path, f"{job.id}.json"))
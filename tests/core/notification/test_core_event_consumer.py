@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 from queue import SimpleQueue
+from typing import List
 
 from taipy.common.config import Config, Frequency
 from taipy.core import taipy as tp
@@ -57,6 +58,18 @@ class TaskCreationCoreEventConsumerProcessor(CoreEventConsumerBase):
         self.creation_event_operation_collected += 1
 
 
+class BatchCoreEventConsumerProcessor(CoreEventConsumerBase):
+    def __init__(self, registration_id: str, queue: SimpleQueue, batch_size: int, batch_timeout: float):
+        self.batches: List[List[Event]] = []
+        super().__init__(registration_id, queue, batch_size, batch_timeout)
+
+    def process_event(self, event: Event):
+        raise AssertionError("Events should be processed by batch")
+
+    def process_events(self, events: List[Event]):
+        self.batches.append(events)
+
+
 def test_core_event_consumer():
     register_id_0, register_queue_0 = Notifier.register()
     all_evt_csumer_0 = AllCoreEventConsumerProcessor(register_id_0, register_queue_0)
@@ -104,3 +117,19 @@ def test_core_event_consumer():
     all_evt_csumer_0.stop()
     sc_evt_csumer_1.stop()
     task_creation_evt_csumer_2.stop()
+
+
+def test_core_event_consumer_by_batch():
+    registration_id, queue = Notifier.register()
+    consumer = BatchCoreEventConsumerProcessor(registration_id, queue, batch_size=3, batch_timeout=0.5)
+    events = [Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, entity_id=f"dn_{i}") for i in range(4)]
+    for event in events:
+        Notifier.publish(event)
+    consumer.start()
+
+    # A full batch is processed right away, the remaining event once the batch timeout is reached.
+    assert_true_after_time(lambda: len(consumer.batches) == 2, time=10)
+    assert consumer.batches == [events[:3], events[3:]]
+
+    consumer.stop()
+    Notifier.unregister(registration_id)
@@ -0,0 +1,113 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from queue import Empty, SimpleQueue
+
+import pytest
+
+from taipy.core.notification import Event, EventEntityType, EventOperation, EventQueue, Notifier, OverflowPolicy
+
+
+def _update(entity_id: str, attribute_name: str, attribute_value) -> Event:
+    return Event(
+        entity_type=EventEntityType.DATA_NODE,
+        entity_id=entity_id,
+        operation=EventOperation.UPDATE,
+        attribute_name=attribute_name,
+        attribute_value=attribute_value,
+    )
+
+
+def _creation(entity_id: str) -> Event:
+    return Event(entity_type=EventEntityType.DATA_NODE, entity_id=entity_id, operation=EventOperation.CREATION)
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        EventQueue(0)
+
+
+def test_drop_oldest():
+    queue = EventQueue(2)
+    events = [_creation(f"dn_{i}") for i in range(3)]
+    for event in events:
+        queue.put(event)
+
+    assert queue.qsize() == 2
+    assert queue.nb_dropped_events == 1
+    assert queue.get() is events[1]
+    assert queue.get_nowait() is events[2]
+    assert queue.empty()
+    with pytest.raises(Empty):
+        queue.get_nowait()
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
+
+
+def test_block():
+    queue = EventQueue(1, OverflowPolicy.BLOCK)
+    first, second = _creation("dn_1"), _creation("dn_2")
+    queue.put(first)
+
+    queue.put(second, timeout=0.01)
+    queue.put_nowait(second)
+    assert queue.nb_dropped_events == 2
+    assert queue.qsize() == 1
+
+    publisher = threading.Thread(target=queue.put, args=(second,))
+    publisher.start()
+    assert queue.get(timeout=1) is first
+    publisher.join(timeout=1)
+    assert not publisher.is_alive()
+    assert queue.get(timeout=1) is second
+    assert queue.nb_dropped_events == 2
+
+
+def test_coalesce_updates_of_the_same_attribute():
+    queue = EventQueue(3, OverflowPolicy.COALESCE)
+    queue.put(_update("dn_1", "edit_in_progress", True))
+    queue.put(_creation("dn_2"))
+    queue.put(_update("dn_1", "edit_in_progress", False))
+    queue.put(_update("dn_1", "last_edit_date", 1))
+    queue.put(_update("dn_2", "edit_in_progress", True))
+
+    assert queue.nb_coalesced_events == 1
+    assert queue.nb_dropped_events == 1
+    assert queue.qsize() == 3
+    events = [queue.get_nowait() for _ in range(3)]
+    assert [(e.entity_id, e.attribute_name, e.attribute_value) for e in events] == [
+        ("dn_2", None, None),
+        ("dn_1", "last_edit_date", 1),
+        ("dn_2", "edit_in_progress", True),
+    ]
+
+    # Once consumed, an update is not coalesced anymore.
+    queue.put(_update("dn_2", "edit_in_progress", False))
+    assert queue.qsize() == 1
+    assert queue.nb_coalesced_events == 1
+
+
+def test_register_with_max_size():
+    _, queue = Notifier.register()
+    assert isinstance(queue, SimpleQueue)
+
+    registration_id, queue = Notifier.register(max_size=2, overflow_policy=OverflowPolicy.COALESCE)
+    assert isinstance(queue, EventQueue)
+    assert queue.max_size == 2
+    assert queue.overflow_policy == OverflowPolicy.COALESCE
+
+    for value in range(3):
+        Notifier.publish(_update("dn_1", "edit_in_progress", value))
+    assert queue.qsize() == 1
+    assert queue.nb_coalesced_events == 2
+    assert queue.get_nowait().attribute_value == 2
+    Notifier.unregister(registration_id)
@@ -308,6 +308,32 @@ def test_matching():
     )
 
 
+def test_publish_to_the_matching_topics_only():
+    entity_types = [None, EventEntityType.SCENARIO, EventEntityType.DATA_NODE]
+    entity_ids = [None, "id_1", "id_2"]
+    operations = [None, EventOperation.CREATION, EventOperation.UPDATE]
+    attribute_names = [None, "name", "properties"]
+    topics = [
+        _Topic(entity_type, entity_id, operation, attribute_name)
+        for entity_type in entity_types
+        for entity_id in entity_ids
+        for operation in operations
+        for attribute_name in attribute_names
+    ]
+    queues = [Notifier.register(t.entity_type, t.entity_id, t.operation, t.attribute_name)[1] for t in topics]
+
+    for entity_type in entity_types[1:]:
+        for entity_id in entity_ids:
+            for operation in operations[1:]:
+                for attribute_name in attribute_names if operation == EventOperation.UPDATE else [None]:
+                    event = Event(entity_type, operation, entity_id=entity_id, attribute_name=attribute_name)
+                    Notifier.publish(event)
+                    for topic, queue in zip(topics, queues):
+                        if Notifier._is_matching(event, topic):
+                            assert queue.get_nowait() is event
+                        assert queue.empty()
+
+
 def test_publish_creation_event():
     _, registration_queue = Notifier.register()
 
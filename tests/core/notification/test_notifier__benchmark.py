@@ -0,0 +1,51 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+
+import pytest
+
+from taipy.core.notification import EventEntityType, EventOperation
+from taipy.core.notification.event import Event
+from taipy.core.notification.notifier import Notifier
+
+NB_REGISTRATIONS = 1_000
+NB_EVENTS = 100_000
+
+
+@pytest.mark.benchmark
+def test_publish(benchmark_report):
+    # Each registration listens to the updates of its own data node, as a client displaying it would
+    queues = [
+        Notifier.register(EventEntityType.DATA_NODE, f"DATANODE_{i}", EventOperation.UPDATE)[1]
+        for i in range(NB_REGISTRATIONS)
+    ]
+    # A few registrations listen to all the events
+    queues.extend(Notifier.register()[1] for _ in range(3))
+    events = [
+        Event(
+            EventEntityType.DATA_NODE,
+            EventOperation.UPDATE,
+            entity_id=f"DATANODE_{i % NB_REGISTRATIONS}",
+            attribute_name="last_edit_date",
+        )
+        for i in range(NB_EVENTS)
+    ]
+
+    start = time.perf_counter()
+    for event in events:
+        Notifier.publish(event)
+    wall_time = time.perf_counter() - start
+
+    assert queues[0].qsize() == NB_EVENTS // NB_REGISTRATIONS
+    assert queues[-1].qsize() == NB_EVENTS
+    benchmark_report("wall_time", wall_time)
+    benchmark_report("wall_time_per_event", wall_time / NB_EVENTS * 1e6, "us")
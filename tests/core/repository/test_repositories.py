@@ -13,12 +13,15 @@ import json
 import os
 import pathlib
 import shutil
+from unittest import mock
 
 import pytest
 
+from taipy.common.config import Config, Frequency
+from taipy.core._repository._unit_of_work import _UnitOfWork
 from taipy.core.exceptions.exceptions import ModelNotFound
 
-from .mocks import MockConverter, MockFSRepository, MockModel, MockObj
+from .mocks import MockConverter, MockFSRepository, MockModel, MockObj, MockSQLiteRepository
 
 
 class TestRepositoriesStorage:
@@ -42,6 +45,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLiteRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_save_and_fetch_model(self, mock_repo, params):
@@ -56,6 +60,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLiteRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_exists(self, mock_repo, params):
@@ -70,6 +75,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLiteRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_get_all(self, mock_repo, params):
@@ -93,6 +99,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLiteRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_all(self, mock_repo, params):
@@ -114,6 +121,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLiteRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_delete_many(self, mock_repo, params):
@@ -134,6 +142,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLiteRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     def test_search(self, mock_repo, params):
@@ -153,6 +162,7 @@ class TestRepositoriesStorage:
         "mock_repo,params",
         [
             (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLiteRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
         ],
     )
     @pytest.mark.parametrize("export_path", ["tmp"])
@@ -174,3 +184,401 @@ class TestRepositoriesStorage:
         assert pathlib.Path(os.path.join(export_path, "mock_model/uuid.json")).exists()
 
         shutil.rmtree(export_path, ignore_errors=True)
+
+    def test_index_is_maintained_on_save_and_delete(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        for i in range(5):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0" if i < 3 else "2.0"))
+
+        assert r._index.path.exists()
+        assert r._index._ids([{"version": "1.0"}]) == {"uuid-0", "uuid-1", "uuid-2"}
+        assert r._index._ids([{"version": "1.0"}, {"version": "2.0"}]) == {f"uuid-{i}" for i in range(5)}
+        assert r._index._ids([{"name": "Foo0"}]) is None
+
+        r._delete("uuid-0")
+        r._delete_by("version", "2.0")
+        assert r._index._all_ids() == {"uuid-1", "uuid-2"}
+
+        r._delete_all()
+        assert not r._index.path.exists()
+        assert r._index._all_ids() == set()
+
+    def test_load_all_with_indexed_filters_does_not_scan_folder(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        for i in range(5):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0" if i < 3 else "2.0"))
+
+        with mock.patch("pathlib.Path.iterdir") as mck:
+            assert [m.id for m in r._load_all([{"version": "2.0"}])] == ["uuid-3", "uuid-4"]
+            assert [m.id for m in r._search("name", "Foo3", [{"version": "2.0"}])] == ["uuid-3"]
+            mck.assert_not_called()
+
+    def test_index_is_rebuilt_from_entity_files(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        for i in range(3):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0"))
+        r._index.path.unlink()
+
+        # A missing index is rebuilt by a new process
+        other_process_repo = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        assert other_process_repo._index._ids([{"version": "1.0"}]) == {"uuid-0", "uuid-1", "uuid-2"}
+
+        # Files added or removed without updating the index are reconciled by a new process
+        shutil.copy(r.dir_path / "uuid-0.json", r.dir_path / "uuid-9.json")
+        os.remove(r.dir_path / "uuid-1.json")
+        other_process_repo = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        assert other_process_repo._index._all_ids() == {"uuid-0", "uuid-2", "uuid-9"}
+
+    def test_index_replays_writes_from_other_processes(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        other_process_repo = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid-0", "Foo0", version="1.0"))
+        assert other_process_repo._index._ids([{"version": "1.0"}]) == {"uuid-0"}
+
+        r._save(MockObj("uuid-1", "Foo1", version="1.0"))
+        other_process_repo._delete("uuid-0")
+        assert r._index._ids([{"version": "1.0"}]) == {"uuid-1"}
+        assert [m.id for m in other_process_repo._load_all([{"version": "1.0"}])] == ["uuid-1"]
+
+    def test_index_log_is_compacted(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        other_process_repo = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid-0", "Foo0", version="1.0"))
+        assert other_process_repo._index._ids([{"version": "1.0"}]) == {"uuid-0"}
+
+        with mock.patch.object(r._index, "_COMPACTION_MIN_LINES", 10):
+            for i in range(1, 50):
+                r._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0"))
+                r._delete(f"uuid-{i}")
+        assert len(r._index.path.read_text().splitlines()) < 25
+        assert not list(r._storage_folder.glob("*.tmp"))
+
+        r._save(MockObj("uuid-50", "Foo50", version="2.0"))
+        assert other_process_repo._index._ids([{"version": "1.0"}]) == {"uuid-0"}
+        assert other_process_repo._index._ids([{"version": "2.0"}]) == {"uuid-50"}
+
+    @pytest.mark.skipif(os.name == "nt", reason="The index log is locked with fcntl on POSIX systems")
+    def test_index_log_is_locked_while_compacted(self):
+        import fcntl
+
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid-0", "Foo0", version="1.0"))
+        replace = os.replace
+        is_locked = []
+
+        def check_lock_and_replace(src, dst):
+            if pathlib.Path(dst) != r._index.path:
+                return replace(src, dst)
+            fd = os.open(r._index.lock_path, os.O_RDWR)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                is_locked.append(False)
+            except BlockingIOError:
+                is_locked.append(True)
+            finally:
+                os.close(fd)
+            return replace(src, dst)
+
+        with mock.patch.object(r._index, "_COMPACTION_MIN_LINES", 10), mock.patch(
+            "taipy.core._repository._filesystem_index.os.replace", side_effect=check_lock_and_replace
+        ):
+            for i in range(1, 20):
+                r._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0"))
+                r._delete(f"uuid-{i}")
+        assert is_locked and all(is_locked)
+
+    def test_index_written_for_other_attributes_is_rebuilt(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        for i in range(3):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0"))
+
+        with mock.patch.object(MockFSRepository, "_INDEXED_ATTRIBUTES", ("version", "name")):
+            other_process_repo = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+            assert other_process_repo._index._ids([{"name": "Foo1"}]) == {"uuid-1"}
+            assert json.loads(other_process_repo._index.path.read_text().splitlines()[0]) == {
+                "attributes": ["version", "name"]
+            }
+
+    def test_index_rebuilt_by_another_process_is_not_discarded(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        for i in range(3):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i}", version="1.0"))
+
+        with mock.patch.object(MockFSRepository, "_INDEXED_ATTRIBUTES", ("version", "name")):
+            other_process_repo = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+            index = other_process_repo._index
+            read_lines = index._FileSystemIndex__read_lines
+            rebuilt_logs = []
+
+            def read_lines_and_rebuild_log():
+                read_lines()
+                if index._is_outdated and not rebuilt_logs:
+                    # Another process rebuilds the log before this one discards it.
+                    third_process_repo = MockFSRepository(
+                        model_type=MockModel, dir_name="mock_model", converter=MockConverter
+                    )
+                    third_process_repo._index._all_ids()
+                    rebuilt_logs.append(index.path.read_text())
+
+            with mock.patch.object(index, "_FileSystemIndex__read_lines", side_effect=read_lines_and_rebuild_log):
+                assert index._ids([{"name": "Foo1"}]) == {"uuid-1"}
+
+        assert rebuilt_logs
+        assert index.path.read_text() == rebuilt_logs[0]
+
+    def test_index_can_be_disabled(self):
+        Config.configure_core(repository_properties={"entity_index": False})
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid", "foo"))
+
+        assert r._index is None
+        assert len(r._load_all([{"version": r._load("uuid")._version}])) == 1
+
+    def test_identity_map_disabled_by_default(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid", "foo"))
+
+        assert r._identity_map is None
+        assert r._load("uuid") is not r._load("uuid")
+
+    def test_load_from_identity_map(self):
+        Config.configure_core(repository_properties={"entity_cache_size": 2})
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        for i in range(3):
+            r._save(MockObj(f"uuid-{i}", f"Foo{i}"))
+
+        m = r._load("uuid-0")
+        with mock.patch.object(MockConverter, "_model_to_entity") as mck:
+            assert r._load("uuid-0") is m
+            mck.assert_not_called()
+
+        # The least recently loaded entity is evicted
+        r._load("uuid-1")
+        r._load("uuid-2")
+        assert len(r._identity_map) == 2
+        assert r._load("uuid-0") is not m
+
+        with pytest.raises(ModelNotFound):
+            r._load("non_existent_file")
+
+    def test_identity_map_is_invalidated_by_writes(self):
+        Config.configure_core(repository_properties={"entity_cache_size": 10})
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid", "foo"))
+        r._save(MockObj("uuid-2", "bar"))
+
+        m = r._load("uuid")
+        r._save(MockObj("uuid", "baz"))
+        assert r._load("uuid").name == "baz"
+
+        # The writes of a unit of work invalidate the map when they are flushed
+        m = r._load("uuid")
+        with _UnitOfWork._open():
+            r._save(MockObj("uuid", "qux"))
+        assert r._load("uuid") is not m
+        assert r._load("uuid").name == "qux"
+
+        r._load("uuid-2")
+        r._delete("uuid-2")
+        with pytest.raises(ModelNotFound):
+            r._load("uuid-2")
+
+        r._load("uuid")
+        r._delete_all()
+        assert len(r._identity_map) == 0
+        with pytest.raises(ModelNotFound):
+            r._load("uuid")
+
+    def test_identity_map_does_not_keep_an_entity_read_during_a_write(self):
+        Config.configure_core(repository_properties={"entity_cache_size": 10})
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid", "foo"))
+
+        to_entity = MockConverter._model_to_entity
+
+        def model_to_entity_while_saving(model):
+            r._save(MockObj("uuid", "bar"))
+            return to_entity(model)
+
+        with mock.patch.object(MockConverter, "_model_to_entity", side_effect=model_to_entity_while_saving):
+            assert r._load("uuid").name == "foo"
+        assert len(r._identity_map) == 0
+        assert r._load("uuid").name == "bar"
+
+    def test_identity_map_reads_files_written_by_other_processes(self):
+        Config.configure_core(repository_properties={"entity_cache_size": 10})
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid", "foo"))
+        assert r._load("uuid").name == "foo"
+
+        # Modifying the file from another process changes its signature
+        path = r.dir_path / "uuid.json"
+        content = json.loads(path.read_text())
+        content["name"] = "bazqux"
+        path.write_text(json.dumps(content))
+        assert r._load("uuid").name == "bazqux"
+
+        os.remove(path)
+        with pytest.raises(ModelNotFound):
+            r._load("uuid")
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLiteRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_unit_of_work_coalesces_saves(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+        m = MockObj("uuid", "foo")
+
+        with mock.patch.object(r, "_save_all", wraps=r._save_all) as mck:
+            with _UnitOfWork._open():
+                r._save(m)
+                m.name = "bar"
+                r._save(m)
+                with _UnitOfWork._open():
+                    r._save(MockObj("uuid-2", "baz"))
+
+                assert r._load("uuid") is m
+                assert r._exists("uuid-2")
+                mck.assert_not_called()
+
+            mck.assert_called_once()
+            assert len(mck.call_args.args[0]) == 2
+        assert r._load("uuid").name == "bar"
+        assert r._load("uuid-2").name == "baz"
+
+    @pytest.mark.parametrize(
+        "mock_repo,params",
+        [
+            (MockFSRepository, {"model_type": MockModel, "dir_name": "mock_model", "converter": MockConverter}),
+            (MockSQLiteRepository, {"model_type": MockModel, "table_name": "mock_model", "converter": MockConverter}),
+        ],
+    )
+    def test_unit_of_work_flushes_before_queries(self, mock_repo, params):
+        r = mock_repo(**params)
+        r._delete_all()
+
+        with _UnitOfWork._open():
+            r._save(MockObj("uuid-1", "foo", version="1.0"))
+            r._save(MockObj("uuid-2", "bar", version="1.0"))
+            assert {m.id for m in r._load_all([{"version": "1.0"}])} == {"uuid-1", "uuid-2"}
+            assert [m.id for m in r._search("name", "bar")] == ["uuid-2"]
+
+            # Deleting a pending entity discards it
+            r._save(MockObj("uuid-3", "baz", version="1.0"))
+            r._delete("uuid-3")
+            r._save(MockObj("uuid-4", "qux", version="1.0"))
+            r._delete_many(["uuid-1", "uuid-4"])
+
+        assert [m.id for m in r._load_all()] == ["uuid-2"]
+
+    def test_unit_of_work_replaces_files_atomically(self):
+        r = MockFSRepository(model_type=MockModel, dir_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid-1", "foo", version="1.0"))
+
+        with mock.patch("os.replace", side_effect=OSError):
+            with pytest.raises(OSError):
+                r._save_all([MockObj("uuid-1", "bar", version="1.0"), MockObj("uuid-2", "baz", version="1.0")])
+        assert r._load("uuid-1").name == "foo"
+
+        with mock.patch.object(
+            MockConverter, "_entity_to_model", side_effect=[MockModel("uuid-1", "bar", "1.0"), ValueError]
+        ):
+            with pytest.raises(ValueError):
+                r._save_all([MockObj("uuid-1", "bar", version="1.0"), MockObj("uuid-2", "baz", version="1.0")])
+        assert r._load("uuid-1").name == "foo"
+        assert not list(r._storage_folder.glob("*.tmp"))
+
+        r._save_all([MockObj("uuid-1", "bar", version="1.0"), MockObj("uuid-2", "baz", version="1.0")])
+        assert [m.name for m in r._load_all([{"version": "1.0"}])] == ["bar", "baz"]
+
+    def test_unit_of_work_is_a_single_sqlite_transaction(self):
+        r = MockSQLiteRepository(model_type=MockModel, table_name="mock_model", converter=MockConverter)
+        r._delete_all()
+
+        with mock.patch.object(MockConverter, "_entity_to_model", wraps=MockConverter._entity_to_model):
+            with pytest.raises(ValueError):
+                with r._transaction():
+                    r._save_all([MockObj("uuid-1", "foo", version="1.0")])
+                    raise ValueError
+        assert r._load_all() == []
+
+        with _UnitOfWork._open():
+            r._save(MockObj("uuid-1", "foo", version="1.0"))
+            r._save(MockObj("uuid-2", "bar", version="1.0"))
+        assert not r._connection.in_transaction
+        assert len(r._load_all()) == 2
+
+    def test_sqlite_columns_added_to_an_existing_table_are_filled(self):
+        r = MockSQLiteRepository(model_type=MockModel, table_name="mock_model", converter=MockConverter)
+        r._delete_all()
+        r._save(MockObj("uuid-1", "foo", version="1.0"))
+
+        with mock.patch.object(MockSQLiteRepository, "_INDEXED_COLUMNS", ("config_id", "owner_id", "version", "name")):
+            r._connection.initialized_tables.discard(r.table_name)
+            connection = r._connection
+            assert connection.execute("SELECT name FROM mock_model").fetchall() == [("foo",)]
+            assert [m.id for m in r._load_all([{"name": "foo"}])] == ["uuid-1"]
+
+
+def _double(x):
+    return x * 2
+
+
+@pytest.fixture
+def sqlite_repositories():
+    Config.configure_core(repository_type="sqlite")
+    yield
+    Config.core.repository_type = "filesystem"
+
+
+def test_entities_stored_in_sqlite_repositories(sqlite_repositories):
+    import taipy.core.taipy as tp
+    from taipy.core import Orchestrator
+    from taipy.core._repository._sqlite_connection import _SQLiteConnection
+
+    input_cfg = Config.configure_data_node("number", default_data=21)
+    output_cfg = Config.configure_data_node("result")
+    task_cfg = Config.configure_task("double", _double, input_cfg, output_cfg)
+    scenario_cfg = Config.configure_scenario("scenario", [task_cfg], frequency=Frequency.DAILY)
+
+    orchestrator = Orchestrator()
+    orchestrator.run()
+    scenario = tp.create_scenario(scenario_cfg)
+    submission = tp.submit(scenario, wait=True)
+    orchestrator.stop()
+
+    assert not (pathlib.Path(Config.core.taipy_storage_folder) / "scenarios").exists()
+    db_path = pathlib.Path(Config.core.taipy_storage_folder) / "taipy.sqlite"
+    connection = _SQLiteConnection._get(str(db_path))
+    for table in ["scenario", "task", "data_node", "cycle", "job", "submission", "version"]:
+        assert connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] >= 1
+
+    assert tp.get(scenario.id).result.read() == 42
+    assert tp.get_scenarios(cycle=scenario.cycle) == [scenario]
+    assert len(tp.get_jobs()) == 1
+    assert tp.get_latest_submission(scenario) == submission
+    assert tp.get_primary(scenario.cycle) == scenario
+
+    tp.delete(scenario.id)
+    assert tp.get_scenarios() == []
+    assert connection.execute("SELECT COUNT(*) FROM data_node").fetchone()[0] == 0
@@ -21,10 +21,12 @@ from taipy.core.common._utils import _Subscriber
 from taipy.core.cycle._cycle_manager_factory import _CycleManagerFactory
 from taipy.core.cycle.cycle import Cycle, CycleId
 from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data.data_node_id import DataNodeId
 from taipy.core.data.in_memory import DataNode, InMemoryDataNode
 from taipy.core.data.pickle import PickleDataNode
 from taipy.core.exceptions.exceptions import (
     AttributeKeyAlreadyExisted,
+    NonExistingTask,
     SequenceAlreadyExists,
     SequenceTaskDoesNotExistInScenario,
 )
@@ -1168,6 +1170,68 @@ def test_get_set_of_tasks():
     assert scenario_2._get_set_of_tasks() == {task_1, task_2, task_3, task_4, task_5}
 
 
+def test_get_lineage():
+    data_node_1 = InMemoryDataNode("foo", Scope.SCENARIO, "s1")
+    data_node_2 = InMemoryDataNode("bar", Scope.SCENARIO, "s2")
+    data_node_3 = InMemoryDataNode("baz", Scope.SCENARIO, "s3")
+    data_node_4 = InMemoryDataNode("qux", Scope.SCENARIO, "s4")
+    data_node_5 = InMemoryDataNode("quux", Scope.SCENARIO, "s5")
+    # s1 ---> t1 ---> s2 ---> t2 ---> s4
+    #                  |               |
+    # s3 --------------                 ---> t3 ---> s5
+    task_1 = Task("grault", {}, print, [data_node_1], [data_node_2], TaskId("t1"))
+    task_2 = Task("garply", {}, print, [data_node_2, data_node_3], [data_node_4], TaskId("t2"))
+    task_3 = Task("waldo", {}, print, [data_node_4], [data_node_5], TaskId("t3"))
+    scenario = Scenario("scenario", {task_1, task_2, task_3}, {}, set(), ScenarioId("sc"))
+
+    assert scenario._get_lineage() == {"s2": ["s1"], "s4": ["s2", "s3"], "s5": ["s4"]}
+    assert list(scenario._get_ancestor_ids(DataNodeId("s5"))) == ["s4", "s2", "s3", "s1"]
+    assert list(scenario._get_ancestor_ids(DataNodeId("s2"))) == ["s1"]
+    assert list(scenario._get_ancestor_ids(DataNodeId("s1"))) == []
+
+
+def test_lineage_is_saved_with_the_scenario():
+    dn_config_1 = Config.configure_pickle_data_node("dn_1")
+    dn_config_2 = Config.configure_pickle_data_node("dn_2")
+    dn_config_3 = Config.configure_pickle_data_node("dn_3")
+    task_config_1 = Config.configure_task("t1", print, [dn_config_1], [dn_config_2])
+    task_config_2 = Config.configure_task("t2", print, [dn_config_2], [dn_config_3])
+    scenario = create_scenario(Config.configure_scenario("sc", [task_config_1, task_config_2]))
+    dn_1, dn_2, dn_3 = scenario.dn_1, scenario.dn_2, scenario.dn_3
+
+    with mock.patch("taipy.core.task._task_manager._TaskManager._get") as mck:
+        lineage = _ScenarioManagerFactory._build_manager()._get(scenario.id)._get_lineage()
+        mck.assert_not_called()
+    assert lineage == {dn_2.id: [dn_1.id], dn_3.id: [dn_2.id]}
+
+    # Changing the tasks of the scenario resets its lineage, computed again on first use
+    scenario.tasks = {scenario.t1}
+    scenario = _ScenarioManagerFactory._build_manager()._get(scenario.id)
+    assert scenario._lineage is None
+    assert scenario._get_lineage() == {dn_2.id: [dn_1.id]}
+
+
+def test_saving_a_scenario_does_not_compute_its_lineage():
+    dn_config_1 = Config.configure_pickle_data_node("dn_1")
+    dn_config_2 = Config.configure_pickle_data_node("dn_2")
+    task_config = Config.configure_task("t1", print, [dn_config_1], [dn_config_2])
+    scenario = create_scenario(Config.configure_scenario("sc", [task_config]))
+    task_id = scenario.t1.id
+    scenario_manager = _ScenarioManagerFactory._build_manager()
+
+    # A scenario saved by a previous version has no lineage, and one of its tasks was deleted
+    scenario._lineage = None
+    scenario_manager._set(scenario)
+    _TaskManagerFactory._build_manager()._repository._delete(task_id)
+    scenario = scenario_manager._get(scenario.id)
+
+    scenario.properties["foo"] = "bar"
+    scenario_manager._set(scenario)
+    assert scenario_manager._get(scenario.id)._lineage is None
+    with pytest.raises(NonExistingTask):
+        scenario._get_lineage()
+
+
 def test_get_sorted_tasks():
     def _assert_equal(tasks_a, tasks_b) -> bool:
         if len(tasks_a) != len(tasks_b):
@@ -22,6 +22,7 @@ from taipy.common.config.common.scope import Scope
 from taipy.core import Job
 from taipy.core import taipy as tp
 from taipy.core._orchestrator._orchestrator import _Orchestrator
+from taipy.core._repository._filesystem_repository import _FileSystemRepository
 from taipy.core._version._version_manager import _VersionManager
 from taipy.core.common import _utils
 from taipy.core.common._utils import _Subscriber
@@ -41,6 +42,7 @@ from taipy.core.exceptions.exceptions import (
     UnauthorizedTagError,
 )
 from taipy.core.job._job_manager import _JobManager
+from taipy.core.notification import EventEntityType, EventOperation, Notifier
 from taipy.core.reason import WrongConfigType
 from taipy.core.scenario._scenario_manager import _ScenarioManager
 from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
@@ -607,6 +609,86 @@ def test_scenario_manager_only_creates_data_node_once():
     assert len(_ScenarioManager._get_all()) == 2
 
 
+def test_bulk_create_scenarios():
+    dn_config_1 = Config.configure_data_node("foo", "in_memory", Scope.GLOBAL, default_data=1)
+    dn_config_2 = Config.configure_data_node("bar", "in_memory", Scope.CYCLE, default_data=0)
+    dn_config_3 = Config.configure_data_node("qux", "in_memory", Scope.SCENARIO, default_data=0)
+    dn_config_4 = Config.configure_data_node("baz", "in_memory", Scope.CYCLE, default_data=0)
+    task_mult_by_2_config = Config.configure_task("mult_by_2", mult_by_2, [dn_config_1], dn_config_2)
+    task_mult_by_4_config = Config.configure_task("mult_by_4", mult_by_4, [dn_config_1], dn_config_3)
+    scenario_config = Config.configure_scenario(
+        "awesome_scenario", [task_mult_by_2_config, task_mult_by_4_config], [dn_config_4], Frequency.DAILY
+    )
+    scenario_config.add_sequences({"by_2": [task_mult_by_2_config]})
+    day_1, day_2 = datetime(2024, 1, 1, 9), datetime(2024, 1, 2, 9)
+    scenario_0 = _ScenarioManager._create(scenario_config, day_1)
+
+    with patch.object(_ScenarioManager, "_get_all_by_cycle", wraps=_ScenarioManager._get_all_by_cycle) as mck:
+        scenarios = _ScenarioManager._bulk_create(
+            scenario_config, [day_1, day_2, day_2 + timedelta(hours=1)], ["a", "b", None]
+        )
+        assert mck.call_count == 2
+
+    assert [scenario.name for scenario in scenarios] == ["a", "b", None]
+    assert [scenario.is_primary for scenario in scenarios] == [False, True, False]
+    assert scenarios[0].cycle == scenario_0.cycle
+    assert scenarios[1].cycle == scenarios[2].cycle != scenario_0.cycle
+    assert len(_ScenarioManager._get_all()) == 4
+    assert len(_CycleManager._get_all()) == 2
+    assert len(_SequenceManager._get_all()) == 4
+    # One global data node, two cycle data nodes per cycle and one scenario data node per scenario
+    assert len(_DataManager._get_all()) == 1 + 2 * 2 + 4
+    # One cycle task per cycle and one scenario task per scenario
+    assert len(_TaskManager._get_all()) == 2 + 4
+
+    assert scenarios[0].foo == scenarios[1].foo == scenario_0.foo
+    assert scenarios[0].bar == scenario_0.bar
+    assert scenarios[0].baz == scenario_0.baz
+    assert scenarios[0].mult_by_2 == scenario_0.mult_by_2
+    assert scenarios[1].bar == scenarios[2].bar != scenario_0.bar
+    assert scenarios[1].mult_by_2 == scenarios[2].mult_by_2
+    assert len({scenario.qux.id for scenario in [scenario_0, *scenarios]}) == 4
+    assert _TaskManager._get(scenarios[1].mult_by_2)._parent_ids == {
+        scenarios[1].id,
+        scenarios[2].id,
+        scenarios[1].by_2.id,
+        scenarios[2].by_2.id,
+    }
+    assert _DataManager._get(scenarios[0].baz)._parent_ids == {scenario_0.id, scenarios[0].id}
+    for scenario in scenarios:
+        assert _ScenarioManager._get(scenario) == scenario
+        assert scenario._is_consistent()
+
+
+def test_bulk_create_scenarios_publishes_events_once_saved():
+    dn_config = Config.configure_data_node("foo", "in_memory", Scope.SCENARIO, default_data=1)
+    task_config = Config.configure_task("mult_by_2", mult_by_2, [dn_config], None)
+    scenario_config = Config.configure_scenario("awesome_scenario", [task_config])
+    registration_id, queue = Notifier.register()
+    _save_all = _FileSystemRepository._save_all
+
+    def save_all(repository, entities):
+        assert queue.empty()
+        _save_all(repository, entities)
+
+    with patch(
+        "taipy.core._repository._filesystem_repository._FileSystemRepository._save_all",
+        autospec=True,
+        side_effect=save_all,
+    ) as mck:
+        scenarios = _ScenarioManager._bulk_create(scenario_config, [None] * 3, [None] * 3)
+        # The scenarios, tasks and data nodes are saved with one call per repository
+        assert mck.call_count == 3
+    Notifier.unregister(registration_id)
+
+    events = [queue.get() for _ in range(queue.qsize())]
+    assert {(e.entity_type, e.entity_id) for e in events if e.operation == EventOperation.CREATION} == {
+        *((EventEntityType.SCENARIO, scenario.id) for scenario in scenarios),
+        *((EventEntityType.TASK, scenario.mult_by_2.id) for scenario in scenarios),
+        *((EventEntityType.DATA_NODE, scenario.foo.id) for scenario in scenarios),
+    }
+
+
 def test_notification_subscribe(mocker):
     mocker.patch("taipy.core._entity._reload._Reloader._reload", side_effect=lambda m, o: o)
 
@@ -0,0 +1,53 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.common.config.common.frequency import Frequency
+from taipy.common.config.common.scope import Scope
+from taipy.core import taipy as tp
+from taipy.core.scenario._scenario_manager import _ScenarioManager
+
+
+def mult(a, b):
+    return a * b
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "bulk, nb_scenarios",
+    [(False, 1_000), (True, 1_000), (True, 10_000)],
+    ids=["create_scenario-1k", "create_scenarios-1k", "create_scenarios-10k"],
+)
+def test_create_scenarios(benchmark_report, bulk, nb_scenarios):
+    factor_cfg = Config.configure_data_node("factor", scope=Scope.GLOBAL, default_data=2)
+    value_cfg = Config.configure_data_node("value", default_data=1)
+    result_cfg = Config.configure_data_node("result")
+    summary_cfg = Config.configure_data_node("summary", scope=Scope.CYCLE)
+    task_cfg = Config.configure_task("mult", mult, [value_cfg, factor_cfg], result_cfg)
+    scenario_cfg = Config.configure_scenario(
+        "monte_carlo", [task_cfg], [summary_cfg], Frequency.DAILY, sequences={"run": [task_cfg]}
+    )
+
+    start = time.perf_counter()
+    if bulk:
+        tp.create_scenarios(scenario_cfg, nb_scenarios)
+    else:
+        for _ in range(nb_scenarios):
+            tp.create_scenario(scenario_cfg)
+    wall_time = time.perf_counter() - start
+
+    assert len(_ScenarioManager._get_all()) == nb_scenarios
+    benchmark_report("wall_time", wall_time)
+    benchmark_report("wall_time_per_scenario", wall_time / nb_scenarios * 1e3, "ms")
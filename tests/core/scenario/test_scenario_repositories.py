@@ -13,14 +13,17 @@ import os
 
 import pytest
 
+from taipy.core.cycle._cycle_fs_repository import _CycleFSRepository
 from taipy.core.exceptions import ModelNotFound
 from taipy.core.scenario._scenario_fs_repository import _ScenarioFSRepository
+from taipy.core.scenario._scenario_sqlite_repository import _ScenarioSQLiteRepository
 from taipy.core.scenario.scenario import Scenario, ScenarioId
 
 
-class TestScenarioFSRepository:
-    def test_save_and_load(self, scenario: Scenario):
-        repository = _ScenarioFSRepository()
+class TestScenarioRepository:
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_save_and_load(self, scenario: Scenario, repo):
+        repository = repo()
         repository._save(scenario)
 
         loaded_scenario = repository._load(scenario.id)
@@ -37,15 +40,17 @@ class TestScenarioFSRepository:
         assert scenario._sequences == loaded_scenario._sequences
         assert scenario._version == loaded_scenario._version
 
-    def test_exists(self, scenario):
-        repository = _ScenarioFSRepository()
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_exists(self, scenario, repo):
+        repository = repo()
         repository._save(scenario)
 
         assert repository._exists(scenario.id)
         assert not repository._exists("not-existed-scenario")
 
-    def test_load_all(self, scenario):
-        repository = _ScenarioFSRepository()
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_load_all(self, scenario, repo):
+        repository = repo()
         for i in range(10):
             scenario.id = ScenarioId(f"scenario-{i}")
             repository._save(scenario)
@@ -53,8 +58,9 @@ class TestScenarioFSRepository:
 
         assert len(data_nodes) == 10
 
-    def test_load_all_with_filters(self, scenario):
-        repository = _ScenarioFSRepository()
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_load_all_with_filters(self, scenario, repo):
+        repository = repo()
 
         for i in range(10):
             scenario.id = ScenarioId(f"scenario-{i}")
@@ -63,8 +69,9 @@ class TestScenarioFSRepository:
 
         assert len(objs) == 1
 
-    def test_delete(self, scenario):
-        repository = _ScenarioFSRepository()
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_delete(self, scenario, repo):
+        repository = repo()
         repository._save(scenario)
 
         repository._delete(scenario.id)
@@ -72,8 +79,9 @@ class TestScenarioFSRepository:
         with pytest.raises(ModelNotFound):
             repository._load(scenario.id)
 
-    def test_delete_all(self, scenario):
-        repository = _ScenarioFSRepository()
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_delete_all(self, scenario, repo):
+        repository = repo()
 
         for i in range(10):
             scenario.id = ScenarioId(f"scenario-{i}")
@@ -85,8 +93,9 @@ class TestScenarioFSRepository:
 
         assert len(repository._load_all()) == 0
 
-    def test_delete_many(self, scenario):
-        repository = _ScenarioFSRepository()
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_delete_many(self, scenario, repo):
+        repository = repo()
 
         for i in range(10):
             scenario.id = ScenarioId(f"scenario-{i}")
@@ -99,8 +108,9 @@ class TestScenarioFSRepository:
 
         assert len(repository._load_all()) == 7
 
-    def test_delete_by(self, scenario):
-        repository = _ScenarioFSRepository()
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_delete_by(self, scenario, repo):
+        repository = repo()
 
         # Create 5 entities with version 1.0 and 5 entities with version 2.0
         for i in range(10):
@@ -114,8 +124,9 @@ class TestScenarioFSRepository:
 
         assert len(repository._load_all()) == 5
 
-    def test_search(self, scenario):
-        repository = _ScenarioFSRepository()
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_search(self, scenario, repo):
+        repository = repo()
 
         for i in range(10):
             scenario.id = ScenarioId(f"scenario-{i}")
@@ -133,11 +144,56 @@ class TestScenarioFSRepository:
 
         assert repository._search("id", "scenario-2", filters=[{"version": "non_existed_version"}]) == []
 
-    def test_export(self, tmpdir, scenario):
-        repository = _ScenarioFSRepository()
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_load_all_with_indexed_filters(self, scenario, cycle, repo):
+        repository = repo()
+        _CycleFSRepository()._save(cycle)
+
+        for i in range(10):
+            scenario.id = ScenarioId(f"scenario-{i}")
+            scenario._config_id = f"config-{i % 2}"
+            scenario._cycle = cycle if i < 4 else None
+            repository._save(scenario)
+
+        assert len(repository._load_all(filters=[{"cycle": cycle.id}])) == 4
+        assert len(repository._load_all(filters=[{"config_id": "config-1"}])) == 5
+        assert len(repository._load_all(filters=[{"config_id": "config-1", "cycle": cycle.id}])) == 2
+        assert len(repository._load_all(filters=[{"cycle": cycle.id}, {"config_id": "config-1"}])) == 7
+        assert len(repository._search("cycle", cycle.id, filters=[{"version": "random_version_number"}])) == 4
+
+        repository._delete_by("cycle", cycle.id)
+
+        assert len(repository._load_all()) == 6
+        assert repository._load_all(filters=[{"cycle": cycle.id}]) == []
+
+    def test_indexed_column_added_to_an_existing_table(self, scenario, cycle):
+        repository = _ScenarioSQLiteRepository()
+        _CycleFSRepository()._save(cycle)
+
+        for i in range(4):
+            scenario.id = ScenarioId(f"scenario-{i}")
+            scenario._cycle = cycle if i % 2 else None
+            repository._save(scenario)
+
+        # Recreate the table as it was before the cycle column was indexed.
+        connection = repository._connection
+        connection.execute("CREATE TABLE scenario_without_cycle AS SELECT id, config_id, version, model FROM scenario")
+        connection.execute("DROP TABLE scenario")
+        connection.execute("ALTER TABLE scenario_without_cycle RENAME TO scenario")
+        connection.initialized_tables.discard("scenario")
+
+        objs = repository._load_all(filters=[{"cycle": cycle.id}])
+
+        assert sorted(obj.id for obj in objs) == ["scenario-1", "scenario-3"]
+        assert "cycle" in {row[1] for row in connection.execute("PRAGMA table_info(scenario)")}
+        assert connection.execute("SELECT 1 FROM sqlite_master WHERE name = 'idx_scenario_cycle'").fetchone()
+
+    @pytest.mark.parametrize("repo", [_ScenarioFSRepository, _ScenarioSQLiteRepository])
+    def test_export(self, tmpdir, scenario, repo):
+        repository = repo()
         repository._save(scenario)
 
         repository._export(scenario.id, tmpdir.strpath)
-        dir_path = repository.dir_path
+        dir_path = repository.dir_path if repo == _ScenarioFSRepository else os.path.join(tmpdir.strpath, "scenario")
 
         assert os.path.exists(os.path.join(dir_path, f"{scenario.id}.json"))
@@ -117,6 +117,30 @@ def test_get_latest_submission():
     assert submission_manager._get_latest(task_2) == submission_4
 
 
+def test_get_latest_submission_of_current_version():
+    task = Task("task_config", {}, print, id="task_id")
+    submission_manager = _SubmissionManagerFactory._build_manager()
+    version_manager = _VersionManagerFactory._build_manager()
+
+    version_manager._set_experiment_version("1.0")
+    submission_1 = submission_manager._create(task.id, task._ID_PREFIX, task.config_id)
+    sleep(0.01)  # Comparison is based on time, precision on Windows is not enough important
+    version_manager._set_experiment_version("2.0")
+    assert submission_manager._get_latest(task) is None
+
+    submission_2 = submission_manager._create(task.id, task._ID_PREFIX, task.config_id)
+    assert submission_manager._get_latest(task) == submission_2
+
+    # The latest submission of the task belongs to another version
+    version_manager._set_experiment_version("1.0")
+    assert submission_manager._get_latest(task) == submission_1
+
+    submission_manager._repository._delete(submission_1.id)
+    assert submission_manager._get_latest(task) is None
+    version_manager._set_experiment_version("2.0")
+    assert submission_manager._get_latest(task) == submission_2
+
+
 def test_delete_submission():
     submission_manager = _SubmissionManagerFactory._build_manager()
 
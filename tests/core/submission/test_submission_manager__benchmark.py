@@ -0,0 +1,45 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+
+import pytest
+
+from taipy.common.config import Config
+from taipy.core import taipy as tp
+from taipy.core.submission._submission_manager_factory import _SubmissionManagerFactory
+from taipy.core.task.task import Task
+
+NB_ENTITIES = 100
+NB_LOOKUPS = 100
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("repository_type", ["filesystem", "sqlite"])
+@pytest.mark.parametrize("nb_submissions", [1_000, 10_000])
+def test_get_latest_submission(benchmark_report, repository_type, nb_submissions):
+    Config.configure_core(repository_type=repository_type)
+    try:
+        submission_manager = _SubmissionManagerFactory._build_manager()
+        tasks = [Task("task", {}, print, id=f"TASK_task_{i}") for i in range(NB_ENTITIES)]
+        with tp.batch():
+            for i in range(nb_submissions):
+                task = tasks[i % NB_ENTITIES]
+                submission_manager._create(task.id, task._ID_PREFIX, task.config_id)
+
+        start = time.perf_counter()
+        for i in range(NB_LOOKUPS):
+            assert tp.get_latest_submission(tasks[i % NB_ENTITIES]) is not None
+        wall_time = time.perf_counter() - start
+    finally:
+        Config.core.repository_type = "filesystem"
+
+    benchmark_report("wall_time_per_lookup", wall_time / NB_LOOKUPS * 1e3, "ms")
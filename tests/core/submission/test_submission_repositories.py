@@ -10,21 +10,23 @@
 # specific language governing permissions and limitations under the License.
 
 import os
+from datetime import datetime, timedelta
 
 import pytest
 
-from taipy.common.config import Config
 from taipy.core.data._data_manager_factory import _DataManagerFactory
 from taipy.core.exceptions import ModelNotFound
 from taipy.core.job._job_manager_factory import _JobManagerFactory
-from taipy.core.submission._submission_manager_factory import _SubmissionManagerFactory
+from taipy.core.submission._submission_fs_repository import _SubmissionFSRepository
+from taipy.core.submission._submission_sqlite_repository import _SubmissionSQLiteRepository
 from taipy.core.submission.submission import Submission
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 from taipy.core.task.task import Task
 
 
 class TestSubmissionRepository:
-    def test_save_and_load(self, data_node, job):
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_save_and_load(self, data_node, job, repo):
         _DataManagerFactory._build_manager()._repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         _TaskManagerFactory._build_manager()._repository._save(task)
@@ -34,7 +36,7 @@ class TestSubmissionRepository:
         submission = Submission(
             task.id, task._ID_PREFIX, task.config_id, properties={"debug": True, "log": "log_file", "retry_note": 5}
         )
-        submission_repository = _SubmissionManagerFactory._build_manager()._repository
+        submission_repository = repo()
         submission_repository._save(submission)
         submission.jobs = [job]
 
@@ -45,16 +47,18 @@ class TestSubmissionRepository:
         assert obj.entity_config_id == task.config_id
         assert obj.properties == {"debug": True, "log": "log_file", "retry_note": 5}
 
-    def test_exists(self):
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_exists(self, repo):
         submission = Submission("entity_id", "ENTITY_TYPE", "entity_config_id")
-        submission_repository = _SubmissionManagerFactory._build_manager()._repository
+        submission_repository = repo()
         submission_repository._save(submission)
 
         assert submission_repository._exists(submission.id)
         assert not submission_repository._exists("not-existed-submission")
 
-    def test_load_all(self):
-        repository = _SubmissionManagerFactory._build_manager()._repository
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_load_all(self, repo):
+        repository = repo()
         submission = Submission("entity_id", "ENTITY_TYPE", "entity_config_id")
         for i in range(10):
             submission.id = f"submission-{i}"
@@ -63,8 +67,9 @@ class TestSubmissionRepository:
 
         assert len(submissions) == 10
 
-    def test_delete(self):
-        repository = _SubmissionManagerFactory._build_manager()._repository
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_delete(self, repo):
+        repository = repo()
 
         submission = Submission("entity_id", "ENTITY_TYPE", "entity_config_id")
         repository._save(submission)
@@ -74,8 +79,9 @@ class TestSubmissionRepository:
         with pytest.raises(ModelNotFound):
             repository._load(submission.id)
 
-    def test_delete_all(self):
-        submission_repository = _SubmissionManagerFactory._build_manager()._repository
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_delete_all(self, repo):
+        submission_repository = repo()
         submission = Submission("entity_id", "ENTITY_TYPE", "entity_config_id")
 
         for i in range(10):
@@ -88,9 +94,10 @@ class TestSubmissionRepository:
 
         assert len(submission_repository._load_all()) == 0
 
-    def test_delete_many(self):
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_delete_many(self, repo):
         submission = Submission("entity_id", "ENTITY_TYPE", "entity_config_id")
-        submission_repository = _SubmissionManagerFactory._build_manager()._repository
+        submission_repository = repo()
 
         for i in range(10):
             submission.id = f"submission-{i}"
@@ -103,9 +110,10 @@ class TestSubmissionRepository:
 
         assert len(submission_repository._load_all()) == 7
 
-    def test_delete_by(self):
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_delete_by(self, repo):
         # Create 5 entities with version 1.0 and 5 entities with version 2.0
-        submission_repository = _SubmissionManagerFactory._build_manager()._repository
+        submission_repository = repo()
         submission = Submission("entity_id", "ENTITY_TYPE", "entity_config_id")
 
         for i in range(10):
@@ -119,8 +127,9 @@ class TestSubmissionRepository:
 
         assert len(submission_repository._load_all()) == 5
 
-    def test_search(self):
-        submission_repository = _SubmissionManagerFactory._build_manager()._repository
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_search(self, repo):
+        submission_repository = repo()
         submission = Submission("entity_id", "ENTITY_TYPE", "entity_config_id", version="random_version_number")
         for i in range(10):
             submission.id = f"submission-{i}"
@@ -138,16 +147,35 @@ class TestSubmissionRepository:
 
         assert submission_repository._search("id", "submission-2", filters=[{"version": "non_existed_version"}]) == []
 
-    def test_export(self, tmpdir):
-        repository = _SubmissionManagerFactory._build_manager()._repository
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_load_all_with_indexed_filters(self, repo):
+        repository = repo()
+
+        for i in range(10):
+            submission = Submission(
+                f"entity_id_{i % 2}",
+                "ENTITY_TYPE",
+                "entity_config_id",
+                id=f"submission-{i}",
+                creation_date=datetime(2024, 1, 1) + timedelta(days=i),
+            )
+            repository._save(submission)
+
+        assert len(repository._load_all(filters=[{"entity_id": "entity_id_1"}])) == 5
+        assert len(repository._search("entity_id", "entity_id_0")) == 5
+        assert repository._get_latest("entity_id", "entity_id_0").id == "submission-8"
+        assert repository._get_latest("entity_id", "entity_id_1").id == "submission-9"
+        assert repository._get_latest("entity_id", "non_existed_entity") is None
+
+    @pytest.mark.parametrize("repo", [_SubmissionFSRepository, _SubmissionSQLiteRepository])
+    def test_export(self, tmpdir, repo):
+        repository = repo()
         submission = Submission("entity_id", "ENTITY_TYPE", "entity_config_id")
         repository._save(submission)
 
         repository._export(submission.id, tmpdir.strpath)
         dir_path = (
-            repository.dir_path
-            if Config.core.repository_type == "default"
-            else os.path.join(tmpdir.strpath, "submission")
+            repository.dir_path if repo == _SubmissionFSRepository else os.path.join(tmpdir.strpath, "submission")
         )
 
         assert os.path.exists(os.path.join(dir_path, f"{submission.id}.json"))
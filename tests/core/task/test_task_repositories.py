@@ -16,12 +16,14 @@ import pytest
 from taipy.core.data._data_fs_repository import _DataFSRepository
 from taipy.core.exceptions import ModelNotFound
 from taipy.core.task._task_fs_repository import _TaskFSRepository
+from taipy.core.task._task_sqlite_repository import _TaskSQLiteRepository
 from taipy.core.task.task import Task, TaskId
 
 
-class TestTaskFSRepository:
-    def test_save_and_load(self, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+class TestTaskRepository:
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_save_and_load(self, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
 
@@ -40,8 +42,9 @@ class TestTaskFSRepository:
         assert task._skippable == loaded_task._skippable
         assert task._properties == loaded_task._properties
 
-    def test_exists(self, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_exists(self, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
 
@@ -50,8 +53,9 @@ class TestTaskFSRepository:
         assert task_repository._exists(task.id)
         assert not task_repository._exists("not-existed-task")
 
-    def test_load_all(self, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_load_all(self, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
 
@@ -62,8 +66,9 @@ class TestTaskFSRepository:
 
         assert len(data_nodes) == 10
 
-    def test_load_all_with_filters(self, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_load_all_with_filters(self, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
 
@@ -75,8 +80,9 @@ class TestTaskFSRepository:
 
         assert len(objs) == 1
 
-    def test_delete(self, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_delete(self, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         task_repository._save(task)
@@ -86,8 +92,9 @@ class TestTaskFSRepository:
         with pytest.raises(ModelNotFound):
             task_repository._load(task.id)
 
-    def test_delete_all(self, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_delete_all(self, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
 
@@ -101,8 +108,9 @@ class TestTaskFSRepository:
 
         assert len(task_repository._load_all()) == 0
 
-    def test_delete_many(self, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_delete_many(self, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
 
@@ -117,8 +125,9 @@ class TestTaskFSRepository:
 
         assert len(task_repository._load_all()) == 7
 
-    def test_delete_by(self, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_delete_by(self, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
 
@@ -134,8 +143,9 @@ class TestTaskFSRepository:
 
         assert len(task_repository._load_all()) == 5
 
-    def test_search(self, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_search(self, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task(
             "task_config_id",
@@ -163,13 +173,14 @@ class TestTaskFSRepository:
 
         assert task_repository._search("owner_id", "owner-2", filters=[{"version": "non_existed_version"}]) == []
 
-    def test_export(self, tmpdir, data_node):
-        task_repository, data_repository = _TaskFSRepository(), _DataFSRepository()
+    @pytest.mark.parametrize("repo", [_TaskFSRepository, _TaskSQLiteRepository])
+    def test_export(self, tmpdir, data_node, repo):
+        task_repository, data_repository = repo(), _DataFSRepository()
         data_repository._save(data_node)
         task = Task("task_config_id", {}, print, [data_node], [data_node])
         task_repository._save(task)
 
         task_repository._export(task.id, tmpdir.strpath)
-        dir_path = task_repository.dir_path
+        dir_path = task_repository.dir_path if repo == _TaskFSRepository else os.path.join(tmpdir.strpath, "task")
 
         assert os.path.exists(os.path.join(dir_path, f"{task.id}.json"))
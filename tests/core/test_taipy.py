@@ -35,6 +35,7 @@ from taipy.core import (
     TaskId,
 )
 from taipy.core._orchestrator._orchestrator_factory import _OrchestratorFactory
+from taipy.core._repository._filesystem_repository import _FileSystemRepository
 from taipy.core._version._version_manager import _VersionManager
 from taipy.core.config.data_node_config import DataNodeConfig
 from taipy.core.config.scenario_config import ScenarioConfig
@@ -44,6 +45,7 @@ from taipy.core.data.pickle import PickleDataNode
 from taipy.core.exceptions.exceptions import DataNodeConfigIsNotGlobal
 from taipy.core.job._job_manager import _JobManager
 from taipy.core.job.job import Job
+from taipy.core.notification import EventEntityType, Notifier
 from taipy.core.scenario._scenario_manager import _ScenarioManager
 from taipy.core.submission._submission_manager import _SubmissionManager
 from taipy.core.task._task_manager import _TaskManager
@@ -74,6 +76,54 @@ class TestTaipy:
             tp.set(submission)
             mck.assert_called_once_with(submission)
 
+    def test_batch(self):
+        dn_config = Config.configure_data_node("number", default_data=1)
+        task_config = Config.configure_task("double", print, [dn_config])
+        scenario_config = Config.configure_scenario("sc", [task_config])
+        registration_id, queue = Notifier.register(entity_type=EventEntityType.SCENARIO)
+
+        with mock.patch(
+            "taipy.core._repository._filesystem_repository._FileSystemRepository._save_all",
+            autospec=True,
+            side_effect=_FileSystemRepository._save_all,
+        ) as mck:
+            with tp.batch():
+                scenario = tp.create_scenario(scenario_config)
+                scenario.name = "What-if"
+                scenario.properties["region"] = "EMEA"
+                scenario.add_tag("draft")
+                assert tp.get(scenario.id).name == "What-if"
+                assert queue.empty()
+
+            saved_scenarios = [e for call in mck.call_args_list for e in call.args[1] if isinstance(e, Scenario)]
+            assert len(saved_scenarios) == 1
+        Notifier.unregister(registration_id)
+
+        scenario = _ScenarioManager._get(scenario.id)
+        assert scenario.name == "What-if"
+        assert scenario.properties["region"] == "EMEA"
+        assert scenario.tags == {"draft"}
+        assert len(_DataManager._get_all()) == 1
+        assert len(_TaskManager._get_all()) == 1
+        assert not queue.empty()
+
+    def test_batch_discards_pending_entities_on_exception(self):
+        dn_config = Config.configure_data_node("number", default_data=1)
+        task_config = Config.configure_task("double", print, [dn_config])
+        scenario_config = Config.configure_scenario("sc", [task_config])
+        registration_id, queue = Notifier.register(entity_type=EventEntityType.SCENARIO)
+
+        with pytest.raises(ValueError):
+            with tp.batch():
+                tp.create_scenario(scenario_config)
+                raise ValueError
+        Notifier.unregister(registration_id)
+
+        assert _ScenarioManager._get_all() == []
+        assert _DataManager._get_all() == []
+        assert _TaskManager._get_all() == []
+        assert queue.empty()
+
     def test_is_editable_is_called(self, cycle, job, data_node):
         with mock.patch("taipy.core.cycle._cycle_manager._CycleManager._is_editable") as mck:
             cycle_id = CycleId("CYCLE_id")
@@ -730,6 +780,25 @@ class TestTaipy:
             tp.create_scenario(scenario_config, datetime.datetime(2022, 2, 5), "displayable_name")
             mck.assert_called_once_with(scenario_config, datetime.datetime(2022, 2, 5), "displayable_name")
 
+    def test_create_scenarios(self):
+        scenario_config = ScenarioConfig("scenario_config")
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._bulk_create") as mck:
+            with mock.patch("taipy.core.orchestrator.Orchestrator._manage_version_and_block_config") as mv_mock:
+                tp.create_scenarios(scenario_config, 2)
+                mck.assert_called_once_with(scenario_config, [None, None], [None, None])
+                mv_mock.assert_called_once()
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._bulk_create") as mck:
+            tp.create_scenarios(scenario_config, ["low", "high"], datetime.datetime(2022, 2, 5))
+            mck.assert_called_once_with(
+                scenario_config, [datetime.datetime(2022, 2, 5), datetime.datetime(2022, 2, 5)], ["low", "high"]
+            )
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._bulk_create") as mck:
+            tp.create_scenarios(scenario_config, [datetime.datetime(2022, 2, 5), "high"])
+            mck.assert_called_once_with(scenario_config, [datetime.datetime(2022, 2, 5), None], [None, "high"])
+        with mock.patch("taipy.core.scenario._scenario_manager._ScenarioManager._bulk_create") as mck:
+            tp.create_scenarios(scenario_config, "high")
+            mck.assert_called_once_with(scenario_config, [None], ["high"])
+
     def test_get_parents(self):
         def assert_result_parents_and_expected_parents(parents, expected_parents):
             for key, items in expected_parents.items():
@@ -0,0 +1,95 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import numpy as np
+import pytest
+
+from taipy.gui.data.decimator import LTTB, RDP, MinMaxDecimator
+
+
+def _points(y):
+    return np.column_stack((np.arange(len(y), dtype=float), np.asarray(y, dtype=float)))
+
+
+def _random_walk(nb_points, seed=0):
+    return _points(np.cumsum(np.random.default_rng(seed).standard_normal(nb_points)))
+
+
+def test_lttb_keeps_peaks():
+    data = _points([0, 0, 0, 5, 0, 0, 0, -5, 0, 0, 0, 0])
+    mask = LTTB(4)._decimate(data, {})
+    assert np.flatnonzero(mask).tolist() == [0, 3, 7, 11]
+
+
+@pytest.mark.parametrize("n_out", [3, 10, 1000])
+def test_lttb_selects_one_point_per_bin(n_out):
+    data = _random_walk(100_003)
+    mask = LTTB(n_out)._decimate(data, {})
+    assert mask.sum() == n_out
+    assert mask[0] and mask[-1]
+    # One point is selected in each of the bins of np.array_split
+    bin_ends = np.cumsum([len(b) for b in np.array_split(np.arange(1, len(data) - 1), n_out - 2)])
+    assert np.bincount(np.searchsorted(bin_ends, np.flatnonzero(mask[1:-1]), side="right")).tolist() == [1] * (
+        n_out - 2
+    )
+
+
+def test_lttb_too_few_points():
+    data = _points([0, 1])
+    assert LTTB(3)._decimate(data, {}).all()
+    with pytest.raises(ValueError):
+        LTTB(2)._decimate(_random_walk(10), {})
+
+
+def test_minmax_keeps_min_and_max_of_each_bin():
+    data = _points([0, 3, -1, 1, 2, -4, 5, 0])
+    mask = MinMaxDecimator(4)._decimate(data, {})
+    assert np.flatnonzero(mask).tolist() == [1, 2, 5, 6]
+
+
+def test_rdp_epsilon():
+    data = _points([0, 1, 2, 10, 4, 5, 6, 7])
+    assert np.flatnonzero(RDP(epsilon=1)._decimate(data, {})).tolist() == [0, 2, 3, 4, 7]
+    assert np.flatnonzero(RDP(epsilon=100)._decimate(data, {})).tolist() == [0, 7]
+
+
+def test_rdp_n_out():
+    data = _points([0, 1, 2, 10, 4, 5, 6, 7])
+    assert np.flatnonzero(RDP(n_out=3)._decimate(data, {})).tolist() == [0, 3, 7]
+    assert RDP(n_out=10)._decimate(data, {}).all()
+
+
+@pytest.mark.parametrize("nb_points", [1_000, 300_000])
+def test_rdp_large_and_small_segments(nb_points):
+    data = _random_walk(nb_points)
+    mask = RDP(n_out=500)._decimate(data, {})
+    assert mask.sum() == 500
+    assert mask[0] and mask[-1]
+
+    mask = RDP(epsilon=1)._decimate(data, {})
+    assert mask[0] and mask[-1]
+    # Points removed by RDP lie within epsilon of the segment joining the points kept around them
+    kept = np.flatnonzero(mask)
+    segments = np.searchsorted(kept, np.flatnonzero(~mask)) - 1
+    start, end = data[kept[segments]], data[kept[segments + 1]]
+    points = data[~mask]
+    cross = (end[:, 0] - start[:, 0]) * (points[:, 1] - start[:, 1]) - (end[:, 1] - start[:, 1]) * (
+        points[:, 0] - start[:, 0]
+    )
+    assert (cross**2 <= ((end - start) ** 2).sum(axis=1)).all()
+
+
+def test_rdp_closed_shape():
+    angles = np.linspace(0, 2 * np.pi, 9)
+    data = np.column_stack((np.cos(angles), np.sin(angles)))
+    mask = RDP(n_out=5)._decimate(data, {})
+    assert mask.sum() == 5
+    assert mask[0] and mask[-1] and mask[4]
@@ -0,0 +1,39 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+
+import numpy as np
+import pytest
+
+from taipy.gui.data.decimator import LTTB, RDP, MinMaxDecimator
+
+N_OUT = 2000
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("nb_points", [10_000, 1_000_000, 10_000_000, 50_000_000])
+@pytest.mark.parametrize(
+    "decimator",
+    [LTTB(N_OUT), MinMaxDecimator(N_OUT), RDP(n_out=N_OUT), RDP(epsilon=1)],
+    ids=["lttb", "minmax", "rdp_n_out", "rdp_epsilon"],
+)
+def test_decimate(benchmark_report, decimator, nb_points):
+    rng = np.random.default_rng(0)
+    data = np.column_stack((np.arange(nb_points, dtype=float), np.cumsum(rng.standard_normal(nb_points))))
+
+    start = time.process_time()
+    mask = decimator._decimate(data, {})
+    cpu_time = time.process_time() - start
+
+    benchmark_report("cpu_time", cpu_time)
+    benchmark_report("throughput", nb_points / cpu_time / 1e6, "Mpoints/s")
+    benchmark_report("kept_points", int(mask.sum()), "points")
@@ -13,7 +13,7 @@ import inspect
 import os
 from datetime import datetime
 from importlib import util
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pandas
 import pandas as pd
@@ -429,3 +429,83 @@ def test_csv(gui, small_dataframe):
     path = accessor.to_csv("", pd)
     assert path is not None
     assert os.path.getsize(path) > 0
+
+
+def test_pages_reuse_filtered_and_sorted_rows(gui: Gui):
+    accessor = _PandasDataAccessor(gui)
+    df = pandas.DataFrame(data={"name": list("ABCDEFGH"), "value": [5, 3, 8, 1, 7, 2, 6, 4]})
+    query = {
+        "columns": ["name", "value"],
+        "orderby": "value",
+        "sort": "desc",
+        "filters": [{"col": "value", "action": ">", "value": 2}],
+    }
+
+    with patch.object(pandas.DataFrame, "eval", autospec=True, side_effect=pandas.DataFrame.eval) as mck:
+        pages = [
+            accessor.get_data("x", df, {**query, "start": start, "end": start + 1}, _DataFormat.JSON)["value"]
+            for start in (0, 2, 4)
+        ]
+        assert mck.call_count == 1
+    assert [row["value"] for page in pages for row in page["data"]] == [8, 7, 6, 5, 4, 3]
+    assert [row["_tp_index"] for row in pages[0]["data"]] == [2, 4]
+    assert pages[0]["rowcount"] == 6
+    assert pages[0]["fullrowcount"] == 8
+
+    # The rows are computed again for another data frame, for other filters, or once the variable is updated
+    with patch.object(pandas.DataFrame, "eval", autospec=True, side_effect=pandas.DataFrame.eval) as mck:
+        accessor.get_data("x", df.copy(), {**query, "start": 0, "end": 1}, _DataFormat.JSON)
+        assert mck.call_count == 1
+        accessor.get_data("x", df.copy(), {**query, "filters": [], "start": 0, "end": 1}, _DataFormat.JSON)
+        assert mck.call_count == 1
+        accessor.get_data("x", df, {**query, "start": 0, "end": 1}, _DataFormat.JSON)
+        assert mck.call_count == 2
+        accessor.invalidate("x")
+        accessor.get_data("x", df, {**query, "start": 0, "end": 1}, _DataFormat.JSON)
+        assert mck.call_count == 3
+
+
+def test_failed_aggregate_keeps_filtered_rows(gui: Gui):
+    accessor = _PandasDataAccessor(gui)
+    df = pandas.DataFrame(data={"name": ["A", "B", "A", "C"], "value": [1, 2, 3, 4]})
+    query = {
+        "columns": ["name", "value"],
+        "start": 0,
+        "end": -1,
+        "filters": [{"col": "name", "action": "==", "value": "A"}],
+        "aggregates": ["unknown"],
+        "applies": {"value": "sum"},
+    }
+    value = accessor.get_data("x", df, query, _DataFormat.JSON)["value"]
+    assert value["rowcount"] == 2
+    assert [row["value"] for row in value["data"]] == [1, 3]
+    assert [row["_tp_index"] for row in value["data"]] == [0, 2]
+
+
+def test_edit_invalidates_sorted_rows(gui: Gui):
+    accessor = _PandasDataAccessor(gui)
+    df = pandas.DataFrame(data={"name": ["A", "B", "C"], "value": [1, 2, 3]})
+    query = {"columns": ["name", "value"], "start": 0, "end": 0, "orderby": "value", "sort": "desc"}
+    assert accessor.get_data("x", df, query, _DataFormat.JSON)["value"]["data"][0]["name"] == "C"
+
+    accessor.on_edit(df, {"index": 0, "col": "value", "value": 10})
+    assert accessor.get_data("x", df, query, _DataFormat.JSON)["value"]["data"][0]["name"] == "A"
+
+
+@pytest.mark.skipif(not util.find_spec("pyarrow"), reason="pyarrow is not installed")
+def test_arrow_data_is_sent_as_record_batches(gui: Gui):
+    import pyarrow as pa
+
+    accessor = _PandasDataAccessor(gui)
+    df = pandas.DataFrame(data={"x": range(200_000), "y": [float(i) for i in range(200_000)]})
+    query = {"alldata": True, "columns": ["x", "y"], "filters": [{"col": "x", "action": ">=", "value": 50_000}]}
+
+    value = accessor.get_data("x", df, query, _DataFormat.APACHE_ARROW)["value"]
+    with pa.ipc.open_stream(value["data"]) as reader:
+        batches = list(reader)
+    assert len(batches) > 1
+    table = pa.Table.from_batches(batches)
+    # the index of the filtered data frame is not sent
+    assert table.column_names == ["x", "y"]
+    assert table.num_rows == 150_000
+    assert table.column("x")[0].as_py() == 50_000
@@ -0,0 +1,44 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import time
+from importlib import util
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from taipy.gui import Gui
+from taipy.gui._renderers.json import _TaipyJsonEncoder
+from taipy.gui.data.data_format import _DataFormat
+from taipy.gui.data.pandas_data_accessor import _PandasDataAccessor
+
+NB_POINTS = 1_000_000
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not util.find_spec("pyarrow"), reason="pyarrow is not installed")
+@pytest.mark.parametrize("data_format", [_DataFormat.JSON, _DataFormat.APACHE_ARROW])
+def test_chart_data(gui: Gui, benchmark_report, data_format):
+    accessor = _PandasDataAccessor(gui)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": np.arange(NB_POINTS), "y": rng.random(NB_POINTS), "z": rng.random(NB_POINTS)})
+    query = {"alldata": True, "columns": ["x", "y", "z"]}
+
+    start = time.process_time()
+    value = accessor.get_data("x", df, query, data_format)["value"]
+    # JSON data is serialized when it is sent to the front end
+    payload = value["data"] if data_format is _DataFormat.APACHE_ARROW else json.dumps(value, cls=_TaipyJsonEncoder)
+    cpu_time = time.process_time() - start
+
+    benchmark_report("cpu_time", cpu_time)
+    benchmark_report("payload_size", len(payload) / 2**20, "MiB")
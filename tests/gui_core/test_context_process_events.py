@@ -0,0 +1,69 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest.mock import Mock, call, patch
+
+from taipy.core.notification import Event, EventEntityType, EventOperation
+from taipy.gui_core._context import _GuiCoreContext
+
+
+def _data_node_event(entity_id: str, operation: EventOperation = EventOperation.UPDATE) -> Event:
+    attribute_name = "last_edit_date" if operation is EventOperation.UPDATE else None
+    return Event(EventEntityType.DATA_NODE, operation, entity_id=entity_id, attribute_name=attribute_name)
+
+
+class TestGuiCoreContext_process_events:
+    def test_data_node_events_are_broadcast_once(self):
+        gui = Mock()
+        gui_core_context = _GuiCoreContext(gui)
+        gui_core_context.data_nodes_by_owner = {}
+        events = [_data_node_event(f"DATANODE_{i % 3}") for i in range(1000)]
+
+        with patch.object(_GuiCoreContext, "process_event") as process_event:
+            gui_core_context.process_events(events)
+            process_event.assert_not_called()
+
+        gui._broadcast.assert_called_once_with(
+            _GuiCoreContext._CORE_CHANGED_NAME, {"datanode": ["DATANODE_0", "DATANODE_1", "DATANODE_2"]}, None
+        )
+        assert gui_core_context.data_nodes_by_owner is None
+
+    def test_data_node_deletion_is_broadcast_apart_from_updated_data_nodes(self):
+        gui = Mock()
+        gui_core_context = _GuiCoreContext(gui)
+        gui_core_context.process_events(
+            [_data_node_event("DATANODE_0"), _data_node_event("DATANODE_1", EventOperation.DELETION)]
+        )
+        assert gui._broadcast.call_args_list == [
+            call(_GuiCoreContext._CORE_CHANGED_NAME, {"datanode": ["DATANODE_0"]}, None),
+            call(_GuiCoreContext._CORE_CHANGED_NAME, {"datanode": True}, None),
+        ]
+
+    def test_other_events_are_processed_one_by_one(self):
+        gui = Mock()
+        gui_core_context = _GuiCoreContext(gui)
+        job_event = Event(EventEntityType.JOB, EventOperation.CREATION, entity_id="JOB_0")
+        with patch.object(_GuiCoreContext, "process_event") as process_event:
+            gui_core_context.process_events([_data_node_event("DATANODE_0"), job_event])
+            process_event.assert_called_once_with(job_event)
+        gui._broadcast.assert_called_once_with(_GuiCoreContext._CORE_CHANGED_NAME, {"datanode": ["DATANODE_0"]}, None)
+
+    def test_events_are_processed_in_order(self):
+        gui = Mock()
+        gui_core_context = _GuiCoreContext(gui)
+        job_event = Event(EventEntityType.JOB, EventOperation.CREATION, entity_id="JOB_0")
+        dn_events = [_data_node_event(f"DATANODE_{i}") for i in range(3)]
+        processed = []
+        with patch.object(_GuiCoreContext, "process_event", side_effect=processed.append), patch.object(
+            _GuiCoreContext, "data_nodes_refresh", side_effect=lambda events: processed.append(list(events))
+        ):
+            gui_core_context.process_events([dn_events[0], job_event, dn_events[1], dn_events[2]])
+        assert processed == [[dn_events[0]], job_event, [dn_events[1], dn_events[2]]]
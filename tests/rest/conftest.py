@@ -337,5 +337,7 @@ def init_orchestrator():
         _OrchestratorFactory._build_dispatcher(force_restart=True)
         _OrchestratorFactory._orchestrator.jobs_to_run = Queue()
         _OrchestratorFactory._orchestrator.blocked_jobs = []
+        _OrchestratorFactory._orchestrator._awaited_data_nodes = {}
+        _OrchestratorFactory._orchestrator._awaiting_jobs = {}
 
     return _init_orchestrator